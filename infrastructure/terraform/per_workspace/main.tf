@@ -47,6 +47,8 @@ module "cpmtable" {
     { name = "sk_read_1", type = "S" },
     { name = "pk_read_2", type = "S" },
     { name = "sk_read_2", type = "S" },
+    { name = "pk_active", type = "S" },
+    { name = "pk_active_read_2", type = "S" },
   ]
 
   global_secondary_indexes = [
@@ -61,6 +63,18 @@ module "cpmtable" {
       hash_key        = "pk_read_2"
       range_key       = "sk_read_2"
       projection_type = "ALL"
+    },
+    {
+      name            = "idx_gsi_active"
+      hash_key        = "pk_active"
+      range_key       = "sk"
+      projection_type = "ALL"
+    },
+    {
+      name            = "idx_gsi_active_read_2"
+      hash_key        = "pk_active_read_2"
+      range_key       = "sk_read_2"
+      projection_type = "ALL"
     }
   ]
 }
@@ -103,7 +117,10 @@ module "lambdas" {
     }
   }
   environment_variables = {
-    DYNAMODB_TABLE = module.cpmtable.dynamodb_table_name
+    DYNAMODB_TABLE         = module.cpmtable.dynamodb_table_name
+    PREWARM_CLIENTS        = "true"
+    ACTIVE_INDEX_READS     = var.active_index_reads
+    PRODUCT_ID_BITMAP_FILE = "/tmp/product_id_bitmap"
   }
   attach_policy_statements = length((fileset("${path.module}/../../../src/api/${each.key}/policies", "*.json"))) > 0
   policy_statements = {
@@ -123,7 +140,8 @@ module "authoriser" {
   lambda_name    = "${local.project}--${replace(terraform.workspace, "_", "-")}--authoriser"
   source_path    = "${path.module}/../../../src/api/authoriser/dist/authoriser.zip"
   environment_variables = {
-    ENVIRONMENT = var.environment
+    ENVIRONMENT     = var.environment
+    PREWARM_CLIENTS = "true"
   }
   layers = concat(
     compact([for instance in module.layers : contains(var.api_lambda_layers, instance.name) ? instance.layer_arn : null]),
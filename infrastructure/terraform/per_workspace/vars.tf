@@ -71,3 +71,10 @@ variable "domain" {
 variable "lambda_memory_size" {
   default = 128
 }
+
+# Only set to "true" once "make admin--backfill-active-indexes" has been run
+# against this workspace's table
+variable "active_index_reads" {
+  type    = string
+  default = "false"
+}
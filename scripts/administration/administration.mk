@@ -1,4 +1,21 @@
 SET_GENERATOR_COUNT :=
+GENERATOR_TABLE_NAME :=
+BULK_IMPORT_FILE :=
+BULK_IMPORT_TABLE_NAME :=
+BACKFILL_TABLE_NAME :=
+CLAIM_PRODUCT_IDS_TABLE_NAME :=
 
 admin--generate-ids--product: ## Generate product Ids
 	poetry run python scripts/administration/id_generator.py --count="$(SET_GENERATOR_COUNT)"
+
+admin--generate-ids--product-pool: ## Add product Ids to the pre-generated id pool
+	poetry run python scripts/administration/id_generator.py --pool --count="$(SET_GENERATOR_COUNT)" --table-name="$(GENERATOR_TABLE_NAME)"
+
+admin--bulk-import: ## Bulk import product teams and products from an NDJSON file
+	poetry run python scripts/administration/bulk_import.py "$(BULK_IMPORT_FILE)" --table-name="$(BULK_IMPORT_TABLE_NAME)"
+
+admin--backfill-active-indexes: ## Backfill the active index keys of existing active items
+	poetry run python scripts/administration/backfill_active_indexes.py --table-name="$(BACKFILL_TABLE_NAME)"
+
+admin--claim-product-ids: ## Claim the ids of existing products across the table
+	poetry run python scripts/administration/claim_product_ids.py --table-name="$(CLAIM_PRODUCT_IDS_TABLE_NAME)"
@@ -0,0 +1,20 @@
+"""
+Set the keys of the sparse active indexes (idx_gsi_active and
+idx_gsi_active_read_2) on active items that were written before those indexes
+existed. Safe to run against a live table, and to rerun if interrupted.
+"""
+
+import argparse
+
+from domain.repository.cpm_repository.active_index import backfill_active_keys
+from event.aws.client import dynamodb_client
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--table-name", required=True, help="DynamoDB table name.")
+    args = parser.parse_args()
+
+    n_updated = backfill_active_keys(
+        client=dynamodb_client(), table_name=args.table_name
+    )
+    print(f"Backfilled the active index keys of {n_updated} items")  # noqa
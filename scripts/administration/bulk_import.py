@@ -0,0 +1,62 @@
+"""
+Bulk import product teams and products from an NDJSON file, one product team
+or product per line, by invoking the bulkImport lambda handler locally against
+a DynamoDB table. Files longer than the import limit are imported in
+consecutive batches, so products may refer to product teams in an earlier
+batch by alias.
+"""
+
+import argparse
+import json
+import os
+import sys
+from itertools import batched
+
+from domain.request_models import BULK_IMPORT_ROW_LIMIT
+from event.json import json_loads
+
+
+def bulk_import(lines: list[str]) -> list[dict]:
+    from api.bulkImport.index import handler
+
+    # Blank lines are dropped before batching, so that every batch has rows,
+    # but results are still reported against the line numbers of the file
+    numbered_lines = [
+        (line_number, line)
+        for line_number, line in enumerate(lines, start=1)
+        if line.strip()
+    ]
+    results = []
+    for batch_number, batch in enumerate(
+        batched(numbered_lines, n=BULK_IMPORT_ROW_LIMIT)
+    ):
+        line_numbers, batch_lines = zip(*batch)
+        response = handler(
+            event={"headers": {"version": "1"}, "body": "\n".join(batch_lines)}
+        )
+        body = json_loads(response["body"])
+        if response["statusCode"] != 200:
+            raise ValueError(f"Import of batch {batch_number} failed: {body}")
+
+        for result in body["results"]:
+            results.append({**result, "line": line_numbers[result["line"] - 1]})
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("file", help="NDJSON file of product teams and products.")
+    parser.add_argument("--table-name", required=True, help="DynamoDB table name.")
+    args = parser.parse_args()
+
+    os.environ["DYNAMODB_TABLE"] = args.table_name
+    with open(args.file) as file:
+        lines = file.read().splitlines()
+
+    results = bulk_import(lines=lines)
+    for result in results:
+        print(json.dumps(result))  # noqa
+
+    n_failed = sum(result["status"] == "failed" for result in results)
+    print(f"Imported {len(results) - n_failed} of {len(results)} lines")  # noqa
+    sys.exit(1 if n_failed else 0)
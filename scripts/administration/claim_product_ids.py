@@ -0,0 +1,21 @@
+"""
+Claim the ids of products that were written before product ids were claimed
+across the table, so that new products can't be given the same ids. Safe to
+run against a live table, and to rerun if interrupted.
+"""
+
+import argparse
+
+from domain.repository.cpm_product_repository import CpmProductRepository
+from event.aws.client import dynamodb_client
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--table-name", required=True, help="DynamoDB table name.")
+    args = parser.parse_args()
+
+    product_repo = CpmProductRepository(
+        table_name=args.table_name, dynamodb_client=dynamodb_client()
+    )
+    n_claimed = product_repo.claim_existing_ids()
+    print(f"Claimed the ids of {n_claimed} existing products")  # noqa
@@ -1,22 +1,37 @@
 import argparse
 import json
 import os
+from array import array
 
-from domain.core.cpm_system_id import ProductId
+from domain.core.cpm_system_id import (
+    PRODUCT_ID_POOL_RANGE,
+    PRODUCT_ID_SPACE,
+    product_id_from_index,
+    product_id_to_index,
+)
+from domain.core.cpm_system_id.pool import IdPool, generate_id_pool, write_id_pool
+from domain.repository.cpm_product_repository import CpmProductRepository
+from event.aws.client import dynamodb_client
 
 ID_FILE_MAP = {
     "product": f"{os.getcwd()}/src/layers/domain/core/cpm_system_id/generated_ids/product_ids.json",
 }
-
-ID_CLASS_MAP = {
-    "product": ProductId,
+ID_POOL_FILE_MAP = {
+    "product": f"{os.getcwd()}/src/layers/domain/core/cpm_system_id/generated_ids/product_id_pool.bin",
 }
 
-
-def generator(id_type="product"):
-    id_class = ID_CLASS_MAP.get(id_type)
-    generator = id_class.create()
-    return generator.__root__
+ID_SPACE_MAP = {
+    "product": PRODUCT_ID_SPACE,
+}
+ID_POOL_RANGE_MAP = {
+    "product": PRODUCT_ID_POOL_RANGE,
+}
+ID_ENCODING_MAP = {
+    "product": (product_id_to_index, product_id_from_index),
+}
+ID_REPOSITORY_MAP = {
+    "product": CpmProductRepository,
+}
 
 
 def open_file(id_type="product"):
@@ -31,26 +46,104 @@ def save_file(ids, id_type="product"):
         json.dump(list(ids), file)
 
 
+def open_pool(id_type="product") -> array:
+    path = ID_POOL_FILE_MAP.get(id_type)
+    if not os.path.exists(path):
+        return array("I")
+    pool = IdPool(path)
+    try:
+        return array("I", pool)
+    finally:
+        pool.close()
+
+
+def issued_ids(table_name: str, id_type="product") -> set[str]:
+    """Ids that have already been issued to items in the table"""
+    repository = ID_REPOSITORY_MAP[id_type](
+        table_name=table_name, dynamodb_client=dynamodb_client()
+    )
+    return set(repository.scan_ids())
+
+
+def _reserved_indices(id_type="product", issued: set[str] = frozenset()) -> set[int]:
+    """
+    Ids that must not be issued again: the reserved ids, the existing pool and
+    the 'issued' ids
+    """
+    to_index, _ = ID_ENCODING_MAP[id_type]
+    return {
+        *map(to_index, open_file(id_type=id_type)),
+        *open_pool(id_type=id_type),
+        *map(to_index, issued),
+    }
+
+
 def bulk_generator(id_count=1, id_type="product"):
+    """Add 'id_count' new ids to the reserved ids"""
+    _, from_index = ID_ENCODING_MAP[id_type]
     ids = open_file(id_type=id_type)
-    starting_id_count = len(ids)
-    while len(ids) - starting_id_count < id_count:
-        ids.add(generator())
+    new_indices = generate_id_pool(
+        size=id_count,
+        id_space=ID_SPACE_MAP[id_type],
+        reserved=_reserved_indices(id_type=id_type),
+    )
+    ids.update(map(from_index, new_indices))
     save_file(ids, id_type)
     return ids
 
 
+def bulk_pool_generator(id_count=1, id_type="product", table_name: str = None) -> int:
+    """
+    Append 'id_count' new ids from the pool's range of ids to the pool,
+    excluding any ids already issued in the table. Existing positions in the pool are unchanged, since they may
+    already have been handed out.
+    """
+    pool = open_pool(id_type=id_type)
+    issued = issued_ids(table_name=table_name, id_type=id_type)
+    pool_range = ID_POOL_RANGE_MAP[id_type]
+    pool.extend(
+        generate_id_pool(
+            size=id_count,
+            id_space=pool_range.stop,
+            start=pool_range.start,
+            reserved=_reserved_indices(id_type=id_type, issued=issued),
+        )
+    )
+    write_id_pool(ID_POOL_FILE_MAP[id_type], pool)
+    return len(pool)
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generate unique Product Ids.")
     parser.add_argument(
         "--count", type=int, default=1, help="Number of Product Ids to generate."
     )
+    parser.add_argument(
+        "--pool",
+        action="store_true",
+        help="Add the ids to the binary id pool rather than the reserved ids.",
+    )
+    parser.add_argument(
+        "--table-name",
+        help="DynamoDB table name, whose issued ids are excluded from the pool.",
+    )
     args = parser.parse_args()
-    ids = bulk_generator(args.count)
+    if args.pool and not args.table_name:
+        parser.error("--table-name is required with --pool")
     id_type = "product"
-    print(f"Generated {id_type.capitalize()} Ids...")  # noqa
-    print("========================")  # noqa
-    for id in ids:
-        print(id)  # noqa
+    if args.pool:
+        pool_size = bulk_pool_generator(
+            args.count, id_type=id_type, table_name=args.table_name
+        )
+        print(  # noqa
+            f"Added {args.count} {id_type.capitalize()} Ids to the pool "
+            f"({pool_size} in total)"
+        )
+    else:
+        ids = bulk_generator(args.count)
+        print(f"Generated {id_type.capitalize()} Ids...")  # noqa
+        print("========================")  # noqa
+        for id in ids:
+            print(id)  # noqa
 
-    print("========================")  # noqa
+        print("========================")  # noqa
@@ -0,0 +1,24 @@
+BENCHMARK_ITEMS ?= 10000
+
+benchmark--marshall: ## Benchmark DynamoDB (un)marshalling of CpmProduct items
+	poetry run python scripts/benchmark/marshall_benchmark.py --items="$(BENCHMARK_ITEMS)"
+
+benchmark--hydration: ## Benchmark hydrating CpmProduct models from table items
+	poetry run python scripts/benchmark/hydration_benchmark.py
+
+benchmark--render-response: ## Benchmark rendering a large product search response
+	poetry run python scripts/benchmark/render_response_benchmark.py --items="$(BENCHMARK_ITEMS)"
+
+IMPORT_THRESHOLD_MS ?= 1000
+
+benchmark--imports: ## Profile cold-start import time of each lambda handler, failing above IMPORT_THRESHOLD_MS
+	poetry run python scripts/benchmark/import_profile.py --threshold-ms="$(IMPORT_THRESHOLD_MS)"
+
+benchmark--step-chain: ## Benchmark the per-request overhead of the API step chain engine
+	poetry run python scripts/benchmark/step_chain_benchmark.py
+
+benchmark--product-ids: ## Benchmark allocating product ids after 1M have been issued
+	poetry run python scripts/benchmark/product_id_benchmark.py
+
+benchmark--client: ## Benchmark first-request latency of DynamoDB clients against BENCHMARK_TABLE_NAME
+	poetry run python scripts/benchmark/client_benchmark.py --table-name="$(BENCHMARK_TABLE_NAME)"
@@ -0,0 +1,65 @@
+"""
+Benchmark of the latency of the first DynamoDB requests made by a new lambda
+container, comparing a default boto3 client against the tuned client from
+'event.aws.client', with and without pre-warming its connection during init.
+Each trial uses a new boto3 session, so that credentials are resolved again,
+and makes GetItem requests for a key that does not exist in 'table_name'.
+"""
+
+import argparse
+import statistics
+import time
+
+import boto3
+from event.aws.client import dynamodb_client
+
+KEY = {"pk": {"S": "BENCHMARK"}, "sk": {"S": "BENCHMARK"}}
+
+
+def _default_client(session: boto3.Session):
+    return session.client("dynamodb")
+
+
+def _tuned_client(session: boto3.Session):
+    return dynamodb_client(session=session, prewarm_client=False)
+
+
+def _prewarmed_client(session: boto3.Session):
+    return dynamodb_client(session=session, prewarm_client=True)
+
+
+def _elapsed_ms(fn) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def trial(create_client, table_name: str) -> tuple[float, float, float]:
+    """Milliseconds to create the client, then for the first and second request"""
+    session = boto3.Session()
+    init_ms, client = _elapsed_ms(lambda: create_client(session))
+    first_ms, _ = _elapsed_ms(lambda: client.get_item(TableName=table_name, Key=KEY))
+    second_ms, _ = _elapsed_ms(lambda: client.get_item(TableName=table_name, Key=KEY))
+    return init_ms, first_ms, second_ms
+
+
+def main(table_name: str, trials: int):
+    clients = {
+        "default": _default_client,
+        "tuned": _tuned_client,
+        "tuned + prewarm": _prewarmed_client,
+    }
+    print(f"Median of {trials} trials (ms)")  # noqa
+    print(f"{'client':<16} {'init':>8} {'first':>8} {'second':>8}")  # noqa
+    for name, create_client in clients.items():
+        results = [trial(create_client, table_name) for _ in range(trials)]
+        init_ms, first_ms, second_ms = map(statistics.median, zip(*results))
+        print(f"{name:<16} {init_ms:>8.1f} {first_ms:>8.1f} {second_ms:>8.1f}")  # noqa
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--table-name", required=True)
+    parser.add_argument("--trials", type=int, default=20)
+    args = parser.parse_args()
+    main(table_name=args.table_name, trials=args.trials)
@@ -0,0 +1,44 @@
+"""
+Benchmark of hydrating CpmProduct models from table items, as in a product
+search, comparing full pydantic validation against trusted hydration
+"""
+
+import argparse
+import timeit
+
+from domain.core.cpm_product import CpmProduct
+from domain.repository.hydration import hydrate
+from sample_items import product_items
+
+DEFAULT_N_ITEMS = [1_000, 10_000, 50_000]
+
+
+def main(n_items: list[int], repeat: int):
+    print(f"Best of {repeat} runs, per-item cost in microseconds")  # noqa
+    print(f"{'items':>8} {'validated':>10} {'trusted':>10} {'speed-up':>9}")  # noqa
+    for n in n_items:
+        items = product_items(n_items=n)
+        validated = min(
+            timeit.repeat(
+                lambda: [CpmProduct(**item) for item in items], number=1, repeat=repeat
+            )
+        )
+        trusted = min(
+            timeit.repeat(
+                lambda: [hydrate(CpmProduct, item) for item in items],
+                number=1,
+                repeat=repeat,
+            )
+        )
+        print(  # noqa
+            f"{n:>8} {validated / n * 1e6:>10.1f} {trusted / n * 1e6:>10.1f}"
+            f" {validated / trusted:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, nargs="+", default=DEFAULT_N_ITEMS)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(n_items=args.items, repeat=args.repeat)
@@ -0,0 +1,109 @@
+"""
+Profile the cold-start import cost of each lambda handler under src/api, using
+'python -X importtime' in a fresh interpreter per handler. Reports the total
+import time of each handler along with its most expensive modules, and exits
+non-zero if any handler's total import time exceeds the threshold.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+API_DIR = PROJECT_ROOT / "src" / "api"
+PYTHONPATH = [PROJECT_ROOT / "src", PROJECT_ROOT / "src" / "layers"]
+# Handlers build their environment at import time, so give them something to build
+HANDLER_ENVIRONMENT = {
+    "AWS_DEFAULT_REGION": "eu-west-2",
+    "DYNAMODB_TABLE": "import-profile",
+    "ENVIRONMENT": "import-profile",
+}
+IMPORT_TIME_PREFIX = "import time:"
+
+
+def handler_names() -> list[str]:
+    return sorted(path.parent.name for path in API_DIR.glob("*/index.py"))
+
+
+def _parse_import_times(stderr: str) -> dict[str, tuple[int, int]]:
+    """Returns (self, cumulative) import time in microseconds by module name"""
+    import_times = {}
+    for line in stderr.splitlines():
+        if not line.startswith(IMPORT_TIME_PREFIX):
+            continue
+        self_us, cumulative_us, module = line.removeprefix(IMPORT_TIME_PREFIX).split(
+            "|"
+        )
+        if not self_us.strip().isdigit():  # header
+            continue
+        import_times[module.strip()] = (int(self_us), int(cumulative_us))
+    return import_times
+
+
+def profile_handler(handler_name: str) -> dict[str, tuple[int, int]]:
+    env = {
+        **os.environ,
+        **HANDLER_ENVIRONMENT,
+        "PYTHONPATH": os.pathsep.join(map(str, PYTHONPATH)),
+        "PYTHONDONTWRITEBYTECODE": "1",
+    }
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import api.{handler_name}.index"],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to import {handler_name}:\n{result.stderr}")
+    return _parse_import_times(result.stderr)
+
+
+def main(handlers: list[str], repeat: int, top: int, threshold_ms: float) -> int:
+    regressions = []
+    for handler_name in handlers:
+        # Take the run with the median total, to smooth out noisy neighbours
+        runs = [profile_handler(handler_name) for _ in range(repeat)]
+        index_module = f"api.{handler_name}.index"
+        totals = [run[index_module][1] / 1000 for run in runs]
+        median_total = statistics.median_low(totals)
+        import_times = runs[totals.index(median_total)]
+
+        print(f"{handler_name:<24} {median_total:>8.1f} ms")  # noqa
+        most_expensive = sorted(
+            import_times.items(), key=lambda item: item[1][0], reverse=True
+        )
+        for module, (self_us, cumulative_us) in most_expensive[:top]:
+            print(  # noqa
+                f"    {module:<56} self {self_us / 1000:>7.1f} ms"
+                f"  cumulative {cumulative_us / 1000:>7.1f} ms"
+            )
+
+        if median_total > threshold_ms:
+            regressions.append(handler_name)
+
+    if regressions:
+        print(  # noqa
+            f"Import time exceeds {threshold_ms} ms for: {', '.join(regressions)}"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("handlers", nargs="*", default=handler_names())
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--threshold-ms", type=float, default=1000)
+    args = parser.parse_args()
+    sys.exit(
+        main(
+            handlers=args.handlers,
+            repeat=args.repeat,
+            top=args.top,
+            threshold_ms=args.threshold_ms,
+        )
+    )
@@ -0,0 +1,81 @@
+"""
+Micro-benchmark of DynamoDB (un)marshalling of CpmProduct items, comparing
+'marshall' / 'unmarshall' against the original 'match'-based implementation
+(reproduced below for reference)
+"""
+
+import argparse
+import timeit
+
+from domain.repository.marshall import marshall, unmarshall
+from sample_items import product_items
+
+REFERENCE_MARSHALL_FUNCTION_BY_TYPE = {
+    type(None): (lambda _: {"NULL": True}),
+    bool: (lambda x: {"BOOL": x}),
+    int: (lambda x: {"N": str(x)}),
+    float: (lambda x: {"N": str(x)}),
+    set: (lambda x: {"L": [reference_marshall_value(item) for item in x]}),
+    list: (lambda x: {"L": [reference_marshall_value(item) for item in x]}),
+    tuple: (lambda x: {"L": [reference_marshall_value(item) for item in x]}),
+    dict: (lambda x: {"M": {k: reference_marshall_value(v) for (k, v) in x.items()}}),
+}
+
+
+def reference_marshall_value(value) -> dict:
+    fn = REFERENCE_MARSHALL_FUNCTION_BY_TYPE.get(type(value), (lambda x: {"S": str(x)}))
+    return fn(value)
+
+
+def reference_marshall(**data) -> dict:
+    return reference_marshall_value(data)["M"]
+
+
+def _reference_unmarshall_mapping(mapping):
+    return {k: reference_unmarshall_value(v) for (k, v) in mapping["M"].items()}
+
+
+def reference_unmarshall_value(record):
+    ((_type_name, value),) = record.items()
+    match _type_name:
+        case "NULL":
+            return None
+        case "S":
+            return str(value)
+        case "BOOL":
+            return bool(value)
+        case "N":
+            return int(value) if value.isdigit() else float(value)
+        case "L":
+            return list(map(reference_unmarshall_value, value))
+        case "M":
+            return _reference_unmarshall_mapping(mapping=record)
+
+
+def reference_unmarshall(record):
+    return _reference_unmarshall_mapping({"M": record})
+
+
+def main(n_items: int, repeat: int):
+    items = product_items(n_items=n_items)
+    records = [marshall(**item) for item in items]
+
+    benchmarks = {
+        "marshall (reference)": lambda: [reference_marshall(**i) for i in items],
+        "marshall": lambda: [marshall(**i) for i in items],
+        "unmarshall (reference)": lambda: list(map(reference_unmarshall, records)),
+        "unmarshall": lambda: list(map(unmarshall, records)),
+    }
+
+    print(f"Best of {repeat} runs over {n_items} CpmProduct items")  # noqa
+    for name, fn in benchmarks.items():
+        seconds = min(timeit.repeat(fn, number=1, repeat=repeat))
+        print(f"{name:<24} {seconds * 1000:>8.1f} ms")  # noqa
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(n_items=args.items, repeat=args.repeat)
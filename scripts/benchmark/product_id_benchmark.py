@@ -0,0 +1,73 @@
+"""
+Benchmark allocating product ids once many have already been issued, comparing
+a reference allocator (a set of issued ids with retries on collision, as
+ProductId.create used to work) against the bitmap allocator behind
+ProductId.create
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from domain.core.cpm_system_id import PRODUCT_ID_SPACE, product_id_from_index
+from domain.core.cpm_system_id.bitmap import IdAllocator, IdBitmap
+
+
+class ReferenceAllocator:
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        self.issued = set()
+
+    def allocate(self) -> str:
+        while True:
+            product_id = product_id_from_index(self.rng.randrange(PRODUCT_ID_SPACE))
+            if product_id not in self.issued:
+                self.issued.add(product_id)
+                return product_id
+
+
+class BitmapAllocator:
+    def __init__(self, rng: random.Random):
+        self.allocator = IdAllocator(bitmap=IdBitmap(size=PRODUCT_ID_SPACE), rng=rng)
+
+    def allocate(self) -> str:
+        return product_id_from_index(self.allocator.allocate())
+
+
+def _set_size(ids: set) -> int:
+    return sys.getsizeof(ids) + sum(map(sys.getsizeof, ids))
+
+
+def main(issued: int, allocations: int):
+    print(  # noqa
+        f"Allocating {allocations} product ids after {issued} have been issued"
+    )
+    for name, allocator_type in (
+        ("reference", ReferenceAllocator),
+        ("bitmap", BitmapAllocator),
+    ):
+        allocator = allocator_type(rng=random.Random(1))
+        for _ in range(issued):
+            allocator.allocate()
+
+        start = time.perf_counter()
+        for _ in range(allocations):
+            allocator.allocate()
+        seconds = (time.perf_counter() - start) / allocations
+
+        if isinstance(allocator, ReferenceAllocator):
+            size_mb = _set_size(allocator.issued) / 1_000_000
+        else:
+            size_mb = allocator.allocator.bitmap.n_bytes / 1_000_000
+        print(  # noqa
+            f"{name:<12} {seconds * 1_000_000:>8.2f} µs per id {size_mb:>8.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--issued", type=int, default=1_000_000)
+    parser.add_argument("--allocations", type=int, default=100_000)
+    args = parser.parse_args()
+    main(issued=args.issued, allocations=args.allocations)
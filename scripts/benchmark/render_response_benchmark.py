@@ -0,0 +1,59 @@
+"""
+Benchmark of rendering a large product search response, comparing the
+previous pipeline (model state, JSON validation and json.dumps) against
+single-pass serialisation in 'render_response'
+"""
+
+import argparse
+import json
+import timeit
+from http import HTTPStatus
+
+import orjson
+from domain.core.cpm_product import CpmProduct
+from domain.repository.hydration import hydrate
+from domain.response.render_response import render_response
+from domain.response.response_models import SearchProductResponse
+from sample_items import product_items
+
+
+def reference_render_response(products: list[CpmProduct]) -> str:
+    results = [
+        {
+            "org_code": "AAA",
+            "product_teams": [
+                {
+                    "product_team_id": None,
+                    "cpm_product_team_id": products[0].cpm_product_team_id,
+                    "products": [product.state() for product in products],
+                }
+            ],
+        }
+    ]
+    outcome = orjson.loads(orjson.dumps({"results": results}))
+    json.dumps(outcome)  # validate_json_serialisable_response
+    return json.dumps(outcome)
+
+
+def main(n_items: int, repeat: int):
+    products = [hydrate(CpmProduct, item) for item in product_items(n_items=n_items)]
+
+    benchmarks = {
+        "render (reference)": lambda: reference_render_response(products),
+        "render": lambda: render_response(
+            response=(HTTPStatus.OK, SearchProductResponse(products=products).dict())
+        ),
+    }
+
+    print(f"Best of {repeat} runs over {n_items} CpmProducts")  # noqa
+    for name, fn in benchmarks.items():
+        seconds = min(timeit.repeat(fn, number=1, repeat=repeat))
+        print(f"{name:<20} {seconds * 1000:>8.1f} ms")  # noqa
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(n_items=args.items, repeat=args.repeat)
@@ -0,0 +1,22 @@
+from domain.core.root import Root
+
+
+def product_items(n_items: int) -> list[dict]:
+    """Copies of a single CpmProduct table item, with table attributes"""
+    org = Root.create_ods_organisation(ods_code="AAA")
+    product_team = org.create_product_team(name="product-team")
+    product = product_team.create_cpm_product(name="product")
+    for i in range(3):
+        product.add_key(key_type="general", key_value=f"key{i}")
+    item = {
+        "pk": f"PT#{product_team.id}",
+        "sk": f"P#{product.id}",
+        "pk_read_1": f"P#{product.id}",
+        "sk_read_1": f"P#{product.id}",
+        "pk_read_2": "ORG#AAA",
+        "sk_read_2": f"P#{product.id}",
+        "root": True,
+        "row_type": "product",
+        **product.state(),
+    }
+    return [dict(item) for _ in range(n_items)]
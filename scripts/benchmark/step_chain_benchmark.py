@@ -0,0 +1,102 @@
+"""
+Benchmark of the per-request overhead of 'execute_step_chain', using API steps
+that do nothing, comparing the previous engine (chains built and decorated on
+every request, with step results copied after every step) against reused chains
+"""
+
+import argparse
+import timeit
+from http import HTTPStatus
+from types import FunctionType
+
+from api_utils.api_step_chain import STEP_DECORATORS, execute_step_chain
+from api_utils.versioning.constants import VersioningStepArgs
+from api_utils.versioning.steps import (
+    get_largest_possible_version,
+    get_steps_for_requested_version,
+    versioning_steps,
+)
+from domain.response.steps import response_steps
+from event.step_chain import StepChain
+from event.step_chain.types import FrozenDict
+
+
+class ReferenceStepChain(StepChain):
+    def run(self, cache: dict = None, init: any = None):
+        if cache is None:
+            cache = {}
+
+        data = FrozenDict(**{self.INIT: init})
+        for step in self.step_chain:
+            try:
+                result = step(data=data, cache=cache)
+            except Exception as exception:
+                result = exception
+            naked_step = self.naked_step_lookup[step]
+            data = FrozenDict({**data, naked_step: result})
+            if isinstance(result, Exception):
+                break
+
+        self.data = data
+        self.result = result
+
+
+def reference_execute_step_chain(event: dict, cache: dict, versioned_steps: dict):
+    version_chain = ReferenceStepChain(
+        step_chain=versioning_steps, step_decorators=STEP_DECORATORS
+    )
+    version_chain.run(
+        init={
+            VersioningStepArgs.EVENT: event,
+            VersioningStepArgs.VERSIONED_STEPS: versioned_steps,
+        }
+    )
+    version = version_chain.data[get_largest_possible_version]
+    steps = version_chain.data[get_steps_for_requested_version]
+    api_chain = ReferenceStepChain(step_chain=steps, step_decorators=STEP_DECORATORS)
+    api_chain.run(cache=cache, init=event)
+
+    response_chain = ReferenceStepChain(
+        step_chain=response_steps, step_decorators=STEP_DECORATORS
+    )
+    response_chain.run(init=(api_chain.result, version))
+    return response_chain.result
+
+
+def _noop_steps(n_steps: int) -> list[FunctionType]:
+    def _noop_step(data, cache):
+        return (HTTPStatus.OK, None)
+
+    # Each step needs to be a distinct function, since results are keyed by step
+    return [
+        FunctionType(_noop_step.__code__, globals(), f"step_{i}")
+        for i in range(n_steps)
+    ]
+
+
+def main(n_steps: int, number: int, repeat: int):
+    versioned_steps = {"1": _noop_steps(n_steps)}
+    event = {"headers": {"version": "1"}}
+
+    benchmarks = {
+        "reference": lambda: reference_execute_step_chain(
+            event=event, cache={}, versioned_steps=versioned_steps
+        ),
+        "execute_step_chain": lambda: execute_step_chain(
+            event=event, cache={}, versioned_steps=versioned_steps
+        ),
+    }
+
+    print(f"Best of {repeat} runs, per request with {n_steps} API steps")  # noqa
+    for name, fn in benchmarks.items():
+        seconds = min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+        print(f"{name:<20} {seconds * 1_000_000:>8.1f} µs")  # noqa
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--steps", type=int, default=10)
+    parser.add_argument("--number", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(n_steps=args.steps, number=args.number, repeat=args.repeat)
@@ -1,8 +1,10 @@
+import compileall
 import os
 import shutil
 import stat
 from functools import cache
 from pathlib import Path
+from py_compile import PycInvalidationMode
 from zipfile import ZIP_DEFLATED, ZipFile, ZipInfo
 
 SRC_DIR = "src"
@@ -35,6 +37,18 @@ def clean_dir(dir_path: Path):
     dir_path.mkdir(parents=True)
 
 
+def compile_bytecode(build_dir: Path):
+    """
+    Lambda packages are read-only, so any module shipped without bytecode is
+    recompiled on every cold start. Hash-based bytecode is used since the zip
+    resets file timestamps, and is 'unchecked' since the sources are immutable.
+    Any module that fails to compile is simply compiled at runtime as before.
+    """
+    compileall.compile_dir(
+        build_dir, quiet=1, invalidation_mode=PycInvalidationMode.UNCHECKED_HASH
+    )
+
+
 def zip_package(build_dir: Path, format="zip"):
     archive_path = Path(f"{str(build_dir)}.{format}")
     if archive_path.exists():
@@ -9,6 +9,7 @@ from builder.common import (
     PROJECT_ROOT_DIR,
     SRC_DIR,
     clean_dir,
+    compile_bytecode,
     copy_source_code,
     get_base_dir,
     zip_package,
@@ -28,6 +29,7 @@ def create_zip_package(
     clean_dir(dist_dir)
     print(f"Building {base_dir.parent.name}/{package_name}")  # noqa: T201
     yield copy_dir
+    compile_bytecode(build_dir)
     zip_package(build_dir)
     shutil.move(dist_dir / f"{BUILD_DIR}.zip", dist_dir / f"{package_name}.zip")
     clean_dir(build_dir)
@@ -7,6 +7,7 @@ from builder.common import (
     BUILD_DIR,
     DIST_DIR,
     clean_dir,
+    compile_bytecode,
     copy_source_code,
     get_base_dir,
     zip_package,
@@ -40,6 +41,7 @@ def create_zip_package(
 
     print(f"Building {base_dir.parent.name}/{package_name}")  # noqa: T201
     yield package_dir
+    compile_bytecode(build_dir)
     zip_package(build_dir)
     shutil.move(dist_dir / f"{BUILD_DIR}.zip", zip_path)
 
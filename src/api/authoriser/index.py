@@ -1,10 +1,16 @@
-import boto3
+import hmac
+
 from domain.logging.step_decorators import logging_step_decorators
+from event.aws.client import secretsmanager_client
+from event.aws.secrets import SecretCache
 from event.environment import BaseEnvironment
 from event.logging.logger import setup_logger
 from event.step_chain import StepChain
+from nhs_context_logging import add_fields
+from nhs_context_logging.logger import logging_context
 
 from api.authoriser.errors import AuthoriserError
+from api.authoriser.policy_cache import PolicyCache
 
 
 class Environment(BaseEnvironment):
@@ -12,20 +18,35 @@ class Environment(BaseEnvironment):
 
 
 environment = Environment.build()
-CLIENT = boto3.client("secretsmanager")
+CLIENT = secretsmanager_client()
+SECRET_CACHE = SecretCache(client=CLIENT)
+POLICY_CACHE = PolicyCache()
+
+
+def _cpm_apikey_secret_name() -> str:
+    return f"{environment.ENVIRONMENT}-apigee-cpm-apikey"
+
 
+def _read_cpm_apikey(refresh: bool = False) -> str:
+    read = SECRET_CACHE.refresh if refresh else SECRET_CACHE.get
+    return read(secret_id=_cpm_apikey_secret_name())
 
-def _read_cpm_apikey() -> str:
-    secret_name = f"{environment.ENVIRONMENT}-apigee-cpm-apikey"
-    response = CLIENT.get_secret_value(SecretId=secret_name)
-    return response["SecretString"]
+
+def _apikeys_match(provided_apikey: str, cpm_apikey_value: str) -> bool:
+    return hmac.compare_digest(provided_apikey.encode(), cpm_apikey_value.encode())
 
 
 def authenticate_apikey(data, cache):
+    if logging_context.current():
+        add_fields(policy_cache=POLICY_CACHE.stats())
+
     provided_apikey = data["INIT"]["headers"]["apikey"]
-    cpm_apikey_value = _read_cpm_apikey()
 
-    if provided_apikey != cpm_apikey_value:
+    # On a mismatch the apikey may have been rotated since it was cached
+    if not (
+        _apikeys_match(provided_apikey, _read_cpm_apikey())
+        or _apikeys_match(provided_apikey, _read_cpm_apikey(refresh=True))
+    ):
         raise AuthoriserError(
             "Provided apikey in request does not match the Connecting Party Manager apikey"
         )
@@ -56,22 +77,40 @@ def render_policy(data, cache):
     }
 
 
-cache = {**Environment.build().dict()}
+cache = {**environment.dict()}
 step_decorators = [*logging_step_decorators]
+step_chain = StepChain(
+    step_chain=[authenticate_apikey], step_decorators=step_decorators
+)
+post_step_chain = StepChain(step_chain=[render_policy], step_decorators=step_decorators)
+
+
+def _cached_policy(event: dict) -> dict | None:
+    provided_apikey = event.get("headers", {}).get("apikey")
+    if provided_apikey is None:
+        return None
+    return POLICY_CACHE.get(apikey=provided_apikey, method_arn=event["methodArn"])
 
 
 def handler(event, context=None):
+    # Fast path: a recently allowed apikey skips the step chains (and logging)
+    policy = _cached_policy(event)
+    if policy is not None:
+        return policy
+
     setup_logger(service_name=__file__)
 
-    step_chain = StepChain(
-        step_chain=[authenticate_apikey], step_decorators=step_decorators
-    )
-    step_chain.run(cache=cache, init=event)
+    _, result = step_chain.execute(cache=cache, init=event)
 
-    post_step_chain = StepChain(
-        step_chain=[render_policy], step_decorators=step_decorators
+    _, policy = post_step_chain.execute(
+        init={"result": result, "method_arn": event["methodArn"]}
     )
-    post_step_chain.run(
-        init={"result": step_chain.result, "method_arn": event["methodArn"]}
-    )
-    return post_step_chain.result
+
+    # Only Allow policies are cached, so that rejected apikeys are always rechecked
+    if result is True:
+        POLICY_CACHE.put(
+            apikey=event["headers"]["apikey"],
+            method_arn=event["methodArn"],
+            policy=policy,
+        )
+    return policy
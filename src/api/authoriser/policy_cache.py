@@ -0,0 +1,95 @@
+import hashlib
+import time
+from collections import OrderedDict
+
+POLICY_CACHE_TTL_SECONDS = 60
+POLICY_CACHE_MAX_SIZE = 256
+METHOD_ARN_SEPARATOR = "/"
+
+
+def apikey_fingerprint(apikey: str) -> str:
+    return hashlib.sha256(apikey.encode()).hexdigest()
+
+
+def method_arn_wildcard(method_arn: str) -> str:
+    """
+    'arn:aws:execute-api:<region>:<account>:<api>/<stage>/<verb>/<path>'
+    becomes 'arn:aws:execute-api:<region>:<account>:<api>/<stage>/*'
+    """
+    parts = method_arn.split(METHOD_ARN_SEPARATOR, maxsplit=2)
+    if len(parts) < 3:
+        return method_arn
+    return METHOD_ARN_SEPARATOR.join((*parts[:2], "*"))
+
+
+def _for_method_arn(policy: dict, method_arn: str) -> dict:
+    policy_document = policy["policyDocument"]
+    return {
+        **policy,
+        "policyDocument": {
+            **policy_document,
+            "Statement": [
+                {**statement, "Resource": method_arn}
+                for statement in policy_document["Statement"]
+            ],
+        },
+    }
+
+
+class PolicyCache:
+    """
+    Cache of rendered Allow policies, intended to live for the lifetime of a
+    warm lambda container. Entries are keyed by a fingerprint of the apikey
+    (so that the apikey itself is not held) and the method ARN wildcard, so that
+    one entry serves every method of the API stage. Entries expire after 'ttl'
+    seconds and the least recently used entry is evicted beyond 'max_size'.
+    Deny policies must never be cached.
+    """
+
+    def __init__(
+        self,
+        ttl: float = POLICY_CACHE_TTL_SECONDS,
+        max_size: int = POLICY_CACHE_MAX_SIZE,
+    ):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str], tuple[float, dict]] = OrderedDict()
+
+    @staticmethod
+    def _cache_key(apikey: str, method_arn: str) -> tuple[str, str]:
+        return (apikey_fingerprint(apikey), method_arn_wildcard(method_arn))
+
+    def get(self, apikey: str, method_arn: str) -> dict | None:
+        """The cached Allow policy, for this specific method ARN"""
+        cache_key = self._cache_key(apikey=apikey, method_arn=method_arn)
+        entry = self._entries.get(cache_key)
+        if entry is not None:
+            expires_at, policy = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return _for_method_arn(policy=policy, method_arn=method_arn)
+            del self._entries[cache_key]
+        self.misses += 1
+        return None
+
+    def put(self, apikey: str, method_arn: str, policy: dict):
+        cache_key = self._cache_key(apikey=apikey, method_arn=method_arn)
+        self._entries[cache_key] = (time.monotonic() + self.ttl, policy)
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        n_lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / n_lookups, 3) if n_lookups else 0.0,
+            "size": len(self._entries),
+        }
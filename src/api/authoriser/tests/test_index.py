@@ -3,6 +3,8 @@ from unittest import mock
 
 from moto import mock_aws
 
+from api.authoriser.policy_cache import PolicyCache
+
 
 def test_correct_apikey():
     with mock_aws(), mock.patch.dict(
@@ -12,6 +14,8 @@ def test_correct_apikey():
     ):
         import api.authoriser.index as index
 
+        index.SECRET_CACHE.clear()
+        index.POLICY_CACHE.clear()
         index.CLIENT.create_secret(
             Name="dev-apigee-cpm-apikey",
             SecretString="hello",  # pragma: allowlist secret
@@ -47,6 +51,8 @@ def test_incorrect_apikey():
     ):
         import api.authoriser.index as index
 
+        index.SECRET_CACHE.clear()
+        index.POLICY_CACHE.clear()
         index.CLIENT.create_secret(
             Name="dev-apigee-cpm-apikey",
             SecretString="hello",  # pragma: allowlist secret
@@ -74,3 +80,108 @@ def test_incorrect_apikey():
             ],
         },
     }
+
+
+def _effect(result: dict) -> str:
+    (statement,) = result["policyDocument"]["Statement"]
+    return statement["Effect"]
+
+
+def test_apikey_is_cached_and_rotation_is_picked_up():
+    with mock_aws(), mock.patch.dict(
+        os.environ,
+        {"ENVIRONMENT": "dev", "AWS_DEFAULT_REGION": "us-east-1"},
+        clear=True,
+    ):
+        import api.authoriser.index as index
+
+        index.SECRET_CACHE.clear()
+        index.POLICY_CACHE.clear()
+        index.CLIENT.create_secret(
+            Name="dev-apigee-cpm-apikey",
+            SecretString="hello",  # pragma: allowlist secret
+        )
+
+        def _authorise(apikey: str) -> str:
+            return _effect(
+                index.handler(event={"methodArn": "foo", "headers": {"apikey": apikey}})
+            )
+
+        with mock.patch.object(
+            index.CLIENT, "get_secret_value", wraps=index.CLIENT.get_secret_value
+        ) as get_secret_value, mock.patch("time.monotonic", return_value=0):
+            assert _authorise("hello") == "Allow"
+            assert _authorise("hello") == "Allow"
+            assert get_secret_value.call_count == 1
+
+            index.CLIENT.put_secret_value(
+                SecretId="dev-apigee-cpm-apikey",
+                SecretString="goodbye",  # pragma: allowlist secret
+            )
+            # The cached apikey was only just read, so is not re-read
+            assert _authorise("goodbye") == "Deny"
+            assert get_secret_value.call_count == 1
+
+        with mock.patch.object(
+            index.CLIENT, "get_secret_value", wraps=index.CLIENT.get_secret_value
+        ) as get_secret_value, mock.patch("time.monotonic", return_value=60):
+            assert _authorise("goodbye") == "Allow"
+            assert _authorise("hello") == "Deny"
+            assert _authorise("goodbye") == "Allow"
+            assert get_secret_value.call_count == 1
+
+
+def test_allow_policies_are_cached_and_deny_policies_are_not():
+    with mock_aws(), mock.patch.dict(
+        os.environ,
+        {"ENVIRONMENT": "dev", "AWS_DEFAULT_REGION": "us-east-1"},
+        clear=True,
+    ):
+        import api.authoriser.index as index
+
+        index.SECRET_CACHE.clear()
+        index.CLIENT.create_secret(
+            Name="dev-apigee-cpm-apikey",
+            SecretString="hello",  # pragma: allowlist secret
+        )
+
+        def _authorise(apikey: str, method_arn: str) -> dict:
+            return index.handler(
+                event={"methodArn": method_arn, "headers": {"apikey": apikey}}
+            )
+
+        with mock.patch.object(
+            index.step_chain, "execute", wraps=index.step_chain.execute
+        ) as step_chain_execute, mock.patch.object(
+            index, "POLICY_CACHE", PolicyCache()
+        ):
+            allowed = _authorise("hello", "api/dev/GET/ProductTeam")
+            assert step_chain_execute.call_count == 1
+
+            assert _authorise("hello", "api/dev/GET/ProductTeam") == allowed
+            assert _authorise("hello", "api/dev/POST/ProductTeam") == {
+                **allowed,
+                "policyDocument": {
+                    **allowed["policyDocument"],
+                    "Statement": [
+                        {
+                            **allowed["policyDocument"]["Statement"][0],
+                            "Resource": "api/dev/POST/ProductTeam",
+                        }
+                    ],
+                },
+            }
+            assert step_chain_execute.call_count == 1
+
+            assert _effect(_authorise("not-hello", "api/dev/GET/ProductTeam")) == "Deny"
+            assert _effect(_authorise("not-hello", "api/dev/GET/ProductTeam")) == "Deny"
+            assert step_chain_execute.call_count == 3
+
+            assert index.POLICY_CACHE.stats() == {
+                "hits": 2,
+                "misses": 3,
+                "hit_rate": 0.4,
+                "size": 1,
+            }
+
+    assert _effect(allowed) == "Allow"
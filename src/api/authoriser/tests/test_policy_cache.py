@@ -0,0 +1,86 @@
+from unittest import mock
+
+import pytest
+
+from api.authoriser.policy_cache import PolicyCache, method_arn_wildcard
+
+STAGE_ARN = "arn:aws:execute-api:eu-west-2:123456789012:abcdef/dev"
+GET_ARN = f"{STAGE_ARN}/GET/ProductTeam/123"
+POST_ARN = f"{STAGE_ARN}/POST/ProductTeam"
+OTHER_STAGE_ARN = "arn:aws:execute-api:eu-west-2:123456789012:abcdef/qa/GET/_status"
+APIKEY = "hello"  # pragma: allowlist secret
+
+
+def _policy(method_arn: str, effect="Allow") -> dict:
+    return {
+        "principalId": "me",
+        "context": {},
+        "policyDocument": {
+            "Version": "2012-10-17",
+            "Statement": [
+                {
+                    "Action": "execute-api:Invoke",
+                    "Effect": effect,
+                    "Resource": method_arn,
+                }
+            ],
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    ["method_arn", "expected"],
+    [
+        (GET_ARN, f"{STAGE_ARN}/*"),
+        (POST_ARN, f"{STAGE_ARN}/*"),
+        (f"{STAGE_ARN}/GET/", f"{STAGE_ARN}/*"),
+        ("foo", "foo"),
+    ],
+)
+def test_method_arn_wildcard(method_arn: str, expected: str):
+    assert method_arn_wildcard(method_arn) == expected
+
+
+def test_policy_cache_serves_every_method_of_the_stage():
+    policy_cache = PolicyCache()
+    policy_cache.put(apikey=APIKEY, method_arn=GET_ARN, policy=_policy(GET_ARN))
+
+    assert policy_cache.get(apikey=APIKEY, method_arn=GET_ARN) == _policy(GET_ARN)
+    assert policy_cache.get(apikey=APIKEY, method_arn=POST_ARN) == _policy(POST_ARN)
+    assert policy_cache.get(apikey=APIKEY, method_arn=OTHER_STAGE_ARN) is None
+    assert policy_cache.get(apikey="not-hello", method_arn=GET_ARN) is None
+    assert policy_cache.stats() == {
+        "hits": 2,
+        "misses": 2,
+        "hit_rate": 0.5,
+        "size": 1,
+    }
+
+
+def test_policy_cache_does_not_hold_the_apikey():
+    policy_cache = PolicyCache()
+    policy_cache.put(apikey=APIKEY, method_arn=GET_ARN, policy=_policy(GET_ARN))
+    assert all(APIKEY not in cache_key for cache_key in policy_cache._entries)
+
+
+def test_policy_cache_ttl():
+    policy_cache = PolicyCache(ttl=10)
+    with mock.patch("time.monotonic", return_value=100):
+        policy_cache.put(apikey=APIKEY, method_arn=GET_ARN, policy=_policy(GET_ARN))
+    with mock.patch("time.monotonic", return_value=109.9):
+        assert policy_cache.get(apikey=APIKEY, method_arn=GET_ARN)
+    with mock.patch("time.monotonic", return_value=110):
+        assert policy_cache.get(apikey=APIKEY, method_arn=GET_ARN) is None
+    assert policy_cache.stats()["size"] == 0
+
+
+def test_policy_cache_lru():
+    policy_cache = PolicyCache(max_size=2)
+    for apikey in ("a", "b"):
+        policy_cache.put(apikey=apikey, method_arn=GET_ARN, policy=_policy(GET_ARN))
+    policy_cache.get(apikey="a", method_arn=GET_ARN)
+    policy_cache.put(apikey="c", method_arn=GET_ARN, policy=_policy(GET_ARN))
+
+    assert policy_cache.get(apikey="a", method_arn=GET_ARN)
+    assert policy_cache.get(apikey="b", method_arn=GET_ARN) is None
+    assert policy_cache.get(apikey="c", method_arn=GET_ARN)
@@ -0,0 +1,79 @@
+from http import HTTPStatus
+
+from domain.api.common_steps.general import parse_event_body
+from domain.core.cpm_product import CpmProduct
+from domain.core.product_team import ProductTeam
+from domain.repository.cpm_product_repository import CpmProductRepository
+from domain.repository.product_team_repository import ProductTeamRepository
+from domain.request_models import BatchReadCpmProductIncomingParams
+from domain.response.validation_errors import mark_validation_errors_as_inbound
+
+
+@mark_validation_errors_as_inbound
+def parse_incoming_product_keys(data, cache) -> BatchReadCpmProductIncomingParams:
+    json_body = data[parse_event_body]
+    return BatchReadCpmProductIncomingParams(**json_body)
+
+
+def read_product_teams(data, cache) -> dict[str, ProductTeam]:
+    """Resolve each distinct product team id (or alias) to its product team"""
+    incoming_params: BatchReadCpmProductIncomingParams = data[
+        parse_incoming_product_keys
+    ]
+    product_team_ids = list(
+        dict.fromkeys(key.product_team_id for key in incoming_params.products)
+    )
+    product_team_repo = ProductTeamRepository(
+        table_name=cache["DYNAMODB_TABLE"], dynamodb_client=cache["DYNAMODB_CLIENT"]
+    )
+    product_teams = product_team_repo.read_many(ids=product_team_ids)
+    return {
+        product_team_id: product_team
+        for product_team_id, product_team in zip(product_team_ids, product_teams)
+        if product_team is not None
+    }
+
+
+def read_products(data, cache) -> list[CpmProduct | None]:
+    incoming_params: BatchReadCpmProductIncomingParams = data[
+        parse_incoming_product_keys
+    ]
+    product_teams: dict[str, ProductTeam] = data[read_product_teams]
+
+    product_keys = [
+        (product_teams[key.product_team_id].id, key.product_id)
+        for key in incoming_params.products
+        if key.product_team_id in product_teams
+    ]
+    product_repo = CpmProductRepository(
+        table_name=cache["DYNAMODB_TABLE"], dynamodb_client=cache["DYNAMODB_CLIENT"]
+    )
+    products = iter(product_repo.read_many(keys=product_keys))
+    return [
+        next(products) if key.product_team_id in product_teams else None
+        for key in incoming_params.products
+    ]
+
+
+def return_products(data, cache) -> tuple[HTTPStatus, dict]:
+    incoming_params: BatchReadCpmProductIncomingParams = data[
+        parse_incoming_product_keys
+    ]
+    products: list[CpmProduct | None] = data[read_products]
+
+    results, not_found = [], []
+    for key, product in zip(incoming_params.products, products):
+        if product is None:
+            not_found.append(key.dict())
+        else:
+            results.append(product)
+    return HTTPStatus.OK, {"results": results, "not_found": not_found}
+
+
+steps = [
+    parse_event_body,
+    parse_incoming_product_keys,
+    read_product_teams,
+    read_products,
+    return_products,
+]
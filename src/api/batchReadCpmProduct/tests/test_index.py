@@ -0,0 +1,110 @@
+import json
+import os
+from unittest import mock
+
+import pytest
+from domain.core.root import Root
+from domain.repository.cpm_product_repository import CpmProductRepository
+from domain.repository.product_team_repository import ProductTeamRepository
+from event.json import json_loads
+
+from test_helpers.dynamodb import mock_table_cpm
+
+TABLE_NAME = "hiya"
+ODS_CODE = "F5H1R"
+PRODUCT_TEAM_NAME = "product-team-name"
+PRODUCT_TEAM_ALIAS = "808a36db-a52a-4130-b71e-d9cbcbaed15b"
+PRODUCT_TEAM_KEYS = [{"key_type": "product_team_id", "key_value": PRODUCT_TEAM_ALIAS}]
+PRODUCT_NAME = "cpm-product-name"
+PRODUCT_IDS = ["P.AAA-CCC", "P.AAA-DDD", "P.AAA-EEE"]
+
+
+@pytest.mark.parametrize(
+    "version",
+    [
+        "1",
+    ],
+)
+def test_index(version):
+    org = Root.create_ods_organisation(ods_code=ODS_CODE)
+    product_team = org.create_product_team(
+        name=PRODUCT_TEAM_NAME, keys=PRODUCT_TEAM_KEYS
+    )
+    products = [
+        product_team.create_cpm_product(name=PRODUCT_NAME, product_id=product_id)
+        for product_id in PRODUCT_IDS
+    ]
+
+    with mock_table_cpm(TABLE_NAME) as client, mock.patch.dict(
+        os.environ,
+        {
+            "DYNAMODB_TABLE": TABLE_NAME,
+            "AWS_DEFAULT_REGION": "eu-west-2",
+        },
+        clear=True,
+    ):
+        from api.batchReadCpmProduct.index import cache, handler
+
+        cache["DYNAMODB_CLIENT"] = client
+
+        ProductTeamRepository(table_name=TABLE_NAME, dynamodb_client=client).write(
+            entity=product_team
+        )
+        product_repo = CpmProductRepository(
+            table_name=TABLE_NAME, dynamodb_client=client
+        )
+        for product in products:
+            product_repo.write(product)
+
+        product_keys = [
+            {"product_team_id": PRODUCT_TEAM_ALIAS, "product_id": PRODUCT_IDS[2]},
+            {"product_team_id": product_team.id, "product_id": "P.XXX-YYY"},
+            {"product_team_id": "not-a-product-team", "product_id": PRODUCT_IDS[0]},
+            {"product_team_id": product_team.id, "product_id": PRODUCT_IDS[0]},
+            {"product_team_id": product_team.id, "product_id": PRODUCT_IDS[2]},
+        ]
+        result = handler(
+            event={
+                "headers": {"version": version},
+                "body": json.dumps({"products": product_keys}),
+            }
+        )
+
+    assert result["statusCode"] == 200
+    assert result["headers"]["Content-Length"] == str(len(result["body"]))
+
+    result_body = json_loads(result["body"])
+    assert result_body == {
+        "results": [products[2].state(), products[0].state(), products[2].state()],
+        "not_found": [product_keys[1], product_keys[2]],
+    }
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {},
+        {"products": []},
+        {"products": [{"product_id": PRODUCT_IDS[0]}]},
+        {"products": [{"product_team_id": "foo", "product_id": "bar", "baz": "qux"}]},
+        {"products": [{"product_team_id": "foo", "product_id": "bar"}] * 501},
+    ],
+)
+def test_index_bad_request(body):
+    with mock_table_cpm(TABLE_NAME) as client, mock.patch.dict(
+        os.environ,
+        {
+            "DYNAMODB_TABLE": TABLE_NAME,
+            "AWS_DEFAULT_REGION": "eu-west-2",
+        },
+        clear=True,
+    ):
+        from api.batchReadCpmProduct.index import cache, handler
+
+        cache["DYNAMODB_CLIENT"] = client
+
+        result = handler(event={"headers": {"version": "1"}, "body": json.dumps(body)})
+
+    assert result["statusCode"] == 400
+    result_body = json_loads(result["body"])
+    assert result_body["errors"][0]["code"] in ("VALIDATION_ERROR", "MISSING_VALUE")
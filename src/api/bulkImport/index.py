@@ -0,0 +1,36 @@
+from api_utils.api_step_chain import execute_step_chain
+from domain.api.common_steps.create_cpm_product import (
+    PRODUCT_ID_RESERVATIONS,
+    product_id_reservations,
+)
+from event.aws.client import dynamodb_client
+from event.environment import BaseEnvironment
+from event.logging.logger import setup_logger
+
+from .src.v1.steps import steps as v1_steps
+
+
+class Environment(BaseEnvironment):
+    DYNAMODB_TABLE: str
+
+
+versioned_steps = {"1": v1_steps}
+environment = Environment.build()
+client = dynamodb_client()
+cache = {
+    **environment.dict(),
+    "DYNAMODB_CLIENT": client,
+    PRODUCT_ID_RESERVATIONS: product_id_reservations(
+        table_name=environment.DYNAMODB_TABLE, dynamodb_client=client
+    ),
+}
+
+
+def handler(event: dict, context=None):
+    setup_logger(service_name=__file__)
+    return execute_step_chain(
+        event=event,
+        cache=cache,
+        versioned_steps=versioned_steps,
+        context=context,
+    )
@@ -0,0 +1,303 @@
+import asyncio
+from http import HTTPStatus
+from json import JSONDecodeError
+
+from aws_lambda_powertools.utilities.data_classes import APIGatewayProxyEvent
+from domain.api.common_steps.create_cpm_product import (
+    reserve_product_id,
+    write_new_cpm_product,
+)
+from domain.core.cpm_product import CpmProduct
+from domain.core.product_team import ProductTeam
+from domain.core.root import Root
+from domain.logging.step_decorators import skip_result_logging
+from domain.ods import InvalidOdsCodeError, are_valid_ods_codes
+from domain.repository.cpm_product_repository import CpmProductRepository
+from domain.repository.errors import (
+    AlreadyExistsError,
+    ItemNotActive,
+    ItemNotFound,
+    UnhandledTransaction,
+)
+from domain.repository.product_team_repository import ProductTeamRepository
+from domain.request_models import BulkImportIncomingParams, BulkImportRow
+from domain.response.validation_errors import (
+    mark_validation_errors_as_inbound,
+    parse_validation_error,
+)
+from event.json import json_loads
+from event.json.errors import DuplicateKeyError
+from event.step_chain import StepChain
+from pydantic import ValidationError
+
+# Each step maps the line number of each row to its result so far, or to the
+# reason that the row failed, which later steps pass through unchanged
+type RowResults[T] = dict[int, T | str]
+
+NOT_WRITTEN = "Could not be written, please retry"
+PRODUCT_TEAM_NOT_IMPORTED = "The product team for this product was not imported"
+
+
+@mark_validation_errors_as_inbound
+def parse_import_lines(data, cache) -> dict[int, str]:
+    """The non-blank lines of the NDJSON body, by line number"""
+    event = APIGatewayProxyEvent(data[StepChain.INIT])
+    lines = {
+        line_number: line
+        for line_number, line in enumerate((event.body or "").splitlines(), start=1)
+        if line.strip()
+    }
+    BulkImportIncomingParams(rows=list(lines.values()))
+    return lines
+
+
+def parse_import_rows(data, cache) -> RowResults[BulkImportRow]:
+    lines: dict[int, str] = data[parse_import_lines]
+    rows = {}
+    for line_number, line in lines.items():
+        try:
+            json_row = json_loads(line)
+        except (JSONDecodeError, DuplicateKeyError):
+            rows[line_number] = "Invalid JSON"
+            continue
+        if not isinstance(json_row, dict):
+            rows[line_number] = "Expected a JSON object"
+            continue
+        try:
+            rows[line_number] = BulkImportRow(**json_row)
+        except ValidationError as validation_error:
+            rows[line_number] = "; ".join(
+                f"{item.path}: {item.msg}"
+                for item in parse_validation_error(validation_error)
+            )
+    return rows
+
+
+def validate_ods_codes(data, cache) -> dict[str, bool]:
+    """Validate each distinct ODS code once, however many teams share it"""
+    rows: RowResults[BulkImportRow] = data[parse_import_rows]
+    return are_valid_ods_codes(
+        ods_codes=(
+            row.product_team.ods_code
+            for row in rows.values()
+            if isinstance(row, BulkImportRow) and row.product_team
+        )
+    )
+
+
+def read_product_teams(data, cache) -> dict[str, ProductTeam]:
+    """
+    Read, in a single batch, the existing product teams that products refer
+    to, along with any that already hold the aliases of the imported teams
+    """
+    rows: RowResults[BulkImportRow] = data[parse_import_rows]
+    valid_rows = [row for row in rows.values() if isinstance(row, BulkImportRow)]
+    imported_aliases = [
+        key.key_value
+        for row in valid_rows
+        if row.product_team
+        for key in row.product_team.keys
+    ]
+    product_team_ids = list(
+        dict.fromkeys(
+            [
+                *imported_aliases,
+                *(row.product.product_team_id for row in valid_rows if row.product),
+            ]
+        )
+    )
+    product_team_repo = ProductTeamRepository(
+        table_name=cache["DYNAMODB_TABLE"], dynamodb_client=cache["DYNAMODB_CLIENT"]
+    )
+    product_teams = product_team_repo.read_many(ids=product_team_ids)
+    return {
+        product_team_id: product_team
+        for product_team_id, product_team in zip(product_team_ids, product_teams)
+        if product_team is not None
+    }
+
+
+def create_aggregates(data, cache) -> RowResults[ProductTeam | CpmProduct]:
+    """
+    Build each product team and product. Products may refer to a product team
+    earlier in the import by its alias, or else to an existing product team.
+    Products that refer to the alias of a product team that failed also fail,
+    rather than being added to whichever team already holds that alias.
+    """
+    rows: RowResults[BulkImportRow] = data[parse_import_rows]
+    valid_ods_codes: dict[str, bool] = data[validate_ods_codes]
+    existing_product_teams: dict[str, ProductTeam] = data[read_product_teams]
+
+    imported_product_teams: dict[str, ProductTeam] = {}
+    failed_aliases = set()
+    aggregates = {}
+    for line_number, row in rows.items():
+        if not isinstance(row, BulkImportRow):
+            aggregates[line_number] = row
+        elif row.product_team:
+            params = row.product_team
+            aliases = [key.key_value for key in params.keys]
+            if not valid_ods_codes[params.ods_code]:
+                aggregates[line_number] = str(InvalidOdsCodeError(params.ods_code))
+                failed_aliases.update(aliases)
+            elif any(
+                alias in existing_product_teams or alias in imported_product_teams
+                for alias in aliases
+            ):
+                aggregates[line_number] = str(AlreadyExistsError())
+                failed_aliases.update(aliases)
+            else:
+                org = Root.create_ods_organisation(ods_code=params.ods_code)
+                product_team = org.create_product_team(
+                    **params.dict(exclude={"ods_code"})
+                )
+                imported_product_teams.update(dict.fromkeys(aliases, product_team))
+                aggregates[line_number] = product_team
+        else:
+            params = row.product
+            product_team = imported_product_teams.get(
+                params.product_team_id
+            ) or existing_product_teams.get(params.product_team_id)
+            if params.product_team_id in failed_aliases:
+                aggregates[line_number] = PRODUCT_TEAM_NOT_IMPORTED
+            elif product_team is None:
+                aggregates[line_number] = str(
+                    ItemNotFound(params.product_team_id, item_type=ProductTeam)
+                )
+            else:
+                aggregates[line_number] = product_team.create_cpm_product(
+                    name=params.name, product_id=reserve_product_id(cache=cache)
+                )
+    return aggregates
+
+
+async def _write_product_team(
+    product_team_repo: ProductTeamRepository, product_team: ProductTeam
+) -> ProductTeam | str:
+    try:
+        await product_team_repo.aio.write(entity=product_team)
+    except AlreadyExistsError as error:
+        return str(error)
+    except UnhandledTransaction:
+        return NOT_WRITTEN
+    return product_team
+
+
+async def _write_product(
+    product_repo: CpmProductRepository,
+    product_team_repo: ProductTeamRepository,
+    product_team: ProductTeam,
+    product: CpmProduct,
+    cache: dict,
+) -> CpmProduct | str:
+    try:
+        return await product_repo.aio.call(
+            lambda: write_new_cpm_product(
+                product_repo=product_repo,
+                product_team=product_team,
+                product=product,
+                cache=cache,
+                condition_checks=[
+                    product_team_repo.active_condition_check(id=product_team.id)
+                ],
+            )
+        )
+    except ItemNotActive:
+        return str(ItemNotFound(product_team.id, item_type=ProductTeam))
+    except (AlreadyExistsError, UnhandledTransaction):
+        return NOT_WRITTEN
+
+
+@skip_result_logging
+async def write_aggregates(data, cache) -> RowResults[ProductTeam | CpmProduct]:
+    """
+    Write the product teams, and then the products of the product teams that
+    were written. Each product team is written in its own conditional
+    transaction with its alias rows, so that an alias that has been taken
+    since read_product_teams is not overwritten, and a product team is either
+    written with all of its aliases or not at all. Likewise each product is
+    written in its own conditional transaction, on condition that its product
+    team is still active and that no other product already has its id (in
+    which case it is written with a new id instead), so a product is never
+    overwritten.
+    """
+    aggregates: RowResults[ProductTeam | CpmProduct] = data[create_aggregates]
+    results = dict(aggregates)
+
+    product_teams = {
+        line_number: aggregate
+        for line_number, aggregate in aggregates.items()
+        if isinstance(aggregate, ProductTeam)
+    }
+    product_team_repo = ProductTeamRepository(
+        table_name=cache["DYNAMODB_TABLE"], dynamodb_client=cache["DYNAMODB_CLIENT"]
+    )
+    written = await asyncio.gather(
+        *(
+            _write_product_team(product_team_repo, product_team)
+            for product_team in product_teams.values()
+        )
+    )
+    unwritten_product_team_ids = set()
+    for (line_number, product_team), result in zip(product_teams.items(), written):
+        if isinstance(result, str):
+            unwritten_product_team_ids.add(product_team.id)
+            results[line_number] = result
+
+    product_teams_by_id = {
+        product_team.id: product_team
+        for product_team in (
+            *data[read_product_teams].values(),
+            *product_teams.values(),
+        )
+    }
+    products = {}
+    for line_number, aggregate in aggregates.items():
+        if not isinstance(aggregate, CpmProduct):
+            continue
+        if aggregate.cpm_product_team_id in unwritten_product_team_ids:
+            results[line_number] = PRODUCT_TEAM_NOT_IMPORTED
+        else:
+            products[line_number] = aggregate
+    product_repo = CpmProductRepository(
+        table_name=cache["DYNAMODB_TABLE"], dynamodb_client=cache["DYNAMODB_CLIENT"]
+    )
+    written = await asyncio.gather(
+        *(
+            _write_product(
+                product_repo=product_repo,
+                product_team_repo=product_team_repo,
+                product_team=product_teams_by_id[product.cpm_product_team_id],
+                product=product,
+                cache=cache,
+            )
+            for product in products.values()
+        )
+    )
+    results.update(zip(products, written))
+    return results
+
+
+def return_results(data, cache) -> tuple[HTTPStatus, dict]:
+    results: RowResults[ProductTeam | CpmProduct] = data[write_aggregates]
+    return HTTPStatus.OK, {
+        "results": [
+            (
+                {"line": line_number, "status": "failed", "error": result}
+                if isinstance(result, str)
+                else {"line": line_number, "status": "created", "id": str(result.id)}
+            )
+            for line_number, result in results.items()
+        ]
+    }
+
+
+steps = [
+    parse_import_lines,
+    parse_import_rows,
+    validate_ods_codes,
+    read_product_teams,
+    create_aggregates,
+    write_aggregates,
+    return_results,
+]
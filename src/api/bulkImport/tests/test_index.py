@@ -0,0 +1,442 @@
+import json
+import os
+from unittest import mock
+
+import pytest
+from domain.core.product_team import ProductTeam
+from domain.core.root import Root
+from domain.repository.cpm_product_repository import CpmProductRepository
+from domain.repository.errors import UnhandledTransaction
+from domain.repository.product_team_repository import ProductTeamRepository
+from event.json import json_loads
+
+from test_helpers.dynamodb import mock_table_cpm
+
+TABLE_NAME = "hiya"
+ODS_CODE = "F5H1R"
+INVALID_ODS_CODE = "NOT-AN-ODS-CODE"
+EXISTING_ALIAS = "808a36db-a52a-4130-b71e-d9cbcbaed15b"
+NEW_ALIAS = "2a1b1a5c-9d3e-4d5e-8f0a-0b1c2d3e4f50"
+OTHER_ALIAS = "5e9b3c8e-8a7d-4a8e-9e3b-7d1f2c3b4a59"
+
+
+def _keys(alias: str) -> list[dict]:
+    return [{"key_type": "product_team_id", "key_value": alias}]
+
+
+def _ndjson(*rows) -> str:
+    return "\n".join(row if isinstance(row, str) else json.dumps(row) for row in rows)
+
+
+@pytest.mark.parametrize(
+    "version",
+    [
+        "1",
+    ],
+)
+def test_index(version):
+    org = Root.create_ods_organisation(ods_code=ODS_CODE)
+    existing_product_team = org.create_product_team(
+        name="existing-team", keys=_keys(EXISTING_ALIAS)
+    )
+
+    body = _ndjson(
+        {
+            "product_team": {
+                "name": "new-team",
+                "ods_code": ODS_CODE,
+                "keys": _keys(NEW_ALIAS),
+            }
+        },
+        {"product": {"product_team_id": NEW_ALIAS, "name": "new-product"}},
+        {"product": {"product_team_id": existing_product_team.id, "name": "product"}},
+        "",
+        "{not json",
+        {
+            "product_team": {
+                "name": "dupe",
+                "ods_code": ODS_CODE,
+                "keys": _keys(EXISTING_ALIAS),
+            }
+        },
+        {"product": {"product_team_id": EXISTING_ALIAS, "name": "orphan"}},
+        {"product": {"product_team_id": "not-a-team", "name": "orphan"}},
+        {
+            "product_team": {
+                "name": "team",
+                "ods_code": INVALID_ODS_CODE,
+                "keys": _keys(OTHER_ALIAS),
+            }
+        },
+        {"product": {"name": "no-team"}},
+    )
+
+    with mock_table_cpm(TABLE_NAME) as client, mock.patch.dict(
+        os.environ,
+        {
+            "DYNAMODB_TABLE": TABLE_NAME,
+            "AWS_DEFAULT_REGION": "eu-west-2",
+        },
+        clear=True,
+    ), mock.patch(
+        "api.bulkImport.src.v1.steps.are_valid_ods_codes",
+        side_effect=lambda ods_codes: {
+            ods_code: ods_code == ODS_CODE for ods_code in ods_codes
+        },
+    ) as mocked_are_valid_ods_codes:
+        from api.bulkImport.index import cache, handler
+
+        cache["DYNAMODB_CLIENT"] = client
+
+        product_team_repo = ProductTeamRepository(
+            table_name=TABLE_NAME, dynamodb_client=client
+        )
+        product_team_repo.write(entity=existing_product_team)
+
+        result = handler(event={"headers": {"version": version}, "body": body})
+
+        assert result["statusCode"] == 200
+        results = json_loads(result["body"])["results"]
+
+        new_product_team = product_team_repo.read(id=NEW_ALIAS)
+        product_repo = CpmProductRepository(
+            table_name=TABLE_NAME, dynamodb_client=client
+        )
+        (new_product,) = product_repo.search_by_product_team(
+            product_team_id=new_product_team.id, status="active"
+        )
+        (product,) = product_repo.search_by_product_team(
+            product_team_id=existing_product_team.id, status="active"
+        )
+
+    # The ODS codes of all of the product teams are validated together
+    mocked_are_valid_ods_codes.assert_called_once()
+
+    assert isinstance(new_product_team, ProductTeam)
+    assert new_product.name == "new-product"
+    assert product.name == "product"
+
+    statuses = {result["line"]: result["status"] for result in results}
+    assert statuses == {
+        1: "created",
+        2: "created",
+        3: "created",
+        5: "failed",
+        6: "failed",
+        7: "failed",
+        8: "failed",
+        9: "failed",
+        10: "failed",
+    }
+    assert results[0]["id"] == new_product_team.id
+    assert results[1]["id"] == str(new_product.id)
+    assert results[2]["id"] == str(product.id)
+
+    errors = {result["line"]: result.get("error") for result in results}
+    assert errors[5] == "Invalid JSON"
+    assert errors[6] == "Item already exists"
+    assert errors[7] == "The product team for this product was not imported"
+    assert errors[8] == "Could not find ProductTeam for key ('not-a-team')"
+    assert INVALID_ODS_CODE in errors[9]
+    assert errors[10] == ("BulkImportRow.product.product_team_id: field required")
+
+
+@pytest.mark.parametrize(
+    "version",
+    [
+        "1",
+    ],
+)
+def test_index_empty_body(version):
+    with mock_table_cpm(TABLE_NAME) as client, mock.patch.dict(
+        os.environ,
+        {
+            "DYNAMODB_TABLE": TABLE_NAME,
+            "AWS_DEFAULT_REGION": "eu-west-2",
+        },
+        clear=True,
+    ):
+        from api.bulkImport.index import cache, handler
+
+        cache["DYNAMODB_CLIENT"] = client
+        result = handler(event={"headers": {"version": version}, "body": "\n"})
+
+    assert result["statusCode"] == 400
+    assert json_loads(result["body"]) == {
+        "errors": [
+            {
+                "code": "VALIDATION_ERROR",
+                "message": "BulkImportIncomingParams.rows: ensure this value has at least 1 items",
+            }
+        ]
+    }
+
+
+@pytest.mark.parametrize(
+    "version",
+    [
+        "1",
+    ],
+)
+def test_index_alias_taken_after_read(version):
+    """An alias that is taken after it was read is not overwritten"""
+    org = Root.create_ods_organisation(ods_code=ODS_CODE)
+    existing_product_team = org.create_product_team(
+        name="existing-team", keys=_keys(EXISTING_ALIAS)
+    )
+    body = _ndjson(
+        {
+            "product_team": {
+                "name": "new-team",
+                "ods_code": ODS_CODE,
+                "keys": _keys(EXISTING_ALIAS),
+            }
+        },
+        {"product": {"product_team_id": EXISTING_ALIAS, "name": "new-product"}},
+    )
+
+    with mock_table_cpm(TABLE_NAME) as client, mock.patch.dict(
+        os.environ,
+        {
+            "DYNAMODB_TABLE": TABLE_NAME,
+            "AWS_DEFAULT_REGION": "eu-west-2",
+        },
+        clear=True,
+    ), mock.patch(
+        "api.bulkImport.src.v1.steps.are_valid_ods_codes",
+        return_value={ODS_CODE: True},
+    ), mock.patch.object(
+        ProductTeamRepository,
+        "read_many",
+        side_effect=lambda ids: [None] * len(ids),
+    ):
+        from api.bulkImport.index import cache, handler
+
+        cache["DYNAMODB_CLIENT"] = client
+
+        product_team_repo = ProductTeamRepository(
+            table_name=TABLE_NAME, dynamodb_client=client
+        )
+        product_team_repo.write(entity=existing_product_team)
+
+        result = handler(event={"headers": {"version": version}, "body": body})
+
+        assert result["statusCode"] == 200
+        results = json_loads(result["body"])["results"]
+        product_team = product_team_repo.read(id=EXISTING_ALIAS)
+        products = CpmProductRepository(
+            table_name=TABLE_NAME, dynamodb_client=client
+        ).search_by_product_team(product_team_id=product_team.id, status="active")
+
+    assert results == [
+        {"line": 1, "status": "failed", "error": "Item already exists"},
+        {
+            "line": 2,
+            "status": "failed",
+            "error": "The product team for this product was not imported",
+        },
+    ]
+    assert product_team.id == existing_product_team.id
+    assert products == []
+
+
+@pytest.mark.parametrize(
+    "version",
+    [
+        "1",
+    ],
+)
+def test_index_product_team_not_written(version):
+    body = _ndjson(
+        {
+            "product_team": {
+                "name": "new-team",
+                "ods_code": ODS_CODE,
+                "keys": _keys(NEW_ALIAS),
+            }
+        },
+        {"product": {"product_team_id": NEW_ALIAS, "name": "new-product"}},
+    )
+
+    with mock_table_cpm(TABLE_NAME) as client, mock.patch.dict(
+        os.environ,
+        {
+            "DYNAMODB_TABLE": TABLE_NAME,
+            "AWS_DEFAULT_REGION": "eu-west-2",
+        },
+        clear=True,
+    ), mock.patch(
+        "api.bulkImport.src.v1.steps.are_valid_ods_codes",
+        return_value={ODS_CODE: True},
+    ), mock.patch.object(
+        ProductTeamRepository,
+        "write",
+        side_effect=UnhandledTransaction(
+            message="oops", code="ThrottlingException", unhandled_transactions=[]
+        ),
+    ):
+        from api.bulkImport.index import cache, handler
+
+        cache["DYNAMODB_CLIENT"] = client
+        result = handler(event={"headers": {"version": version}, "body": body})
+
+        assert result["statusCode"] == 200
+        results = json_loads(result["body"])["results"]
+        item_count = client.scan(TableName=TABLE_NAME)["Count"]
+
+    assert results == [
+        {"line": 1, "status": "failed", "error": "Could not be written, please retry"},
+        {
+            "line": 2,
+            "status": "failed",
+            "error": "The product team for this product was not imported",
+        },
+    ]
+    assert item_count == 0
+
+
+@pytest.mark.parametrize(
+    "version",
+    [
+        "1",
+    ],
+)
+def test_index_product_id_already_issued(version):
+    """A product is never overwritten, but written with a new id instead"""
+    org = Root.create_ods_organisation(ods_code=ODS_CODE)
+    existing_product_team = org.create_product_team(
+        name="existing-team", keys=_keys(EXISTING_ALIAS)
+    )
+    existing_product = existing_product_team.create_cpm_product(name="existing-product")
+    body = _ndjson(
+        {"product": {"product_team_id": EXISTING_ALIAS, "name": "new-product"}},
+    )
+
+    with mock_table_cpm(TABLE_NAME) as client, mock.patch.dict(
+        os.environ,
+        {
+            "DYNAMODB_TABLE": TABLE_NAME,
+            "AWS_DEFAULT_REGION": "eu-west-2",
+        },
+        clear=True,
+    ), mock.patch(
+        "api.bulkImport.src.v1.steps.reserve_product_id",
+        return_value=str(existing_product.id),
+    ):
+        from api.bulkImport.index import cache, handler
+
+        cache["DYNAMODB_CLIENT"] = client
+
+        ProductTeamRepository(table_name=TABLE_NAME, dynamodb_client=client).write(
+            entity=existing_product_team
+        )
+        product_repo = CpmProductRepository(
+            table_name=TABLE_NAME, dynamodb_client=client
+        )
+        product_repo.write(existing_product)
+
+        result = handler(event={"headers": {"version": version}, "body": body})
+
+        assert result["statusCode"] == 200
+        ((result,),) = json_loads(result["body"]).values()
+        products = product_repo.search_by_product_team(
+            product_team_id=existing_product_team.id, status="active"
+        )
+        product = product_repo.read(id=existing_product.id)
+
+    assert result["status"] == "created"
+    assert result["id"] != str(existing_product.id)
+    assert sorted(product.name for product in products) == [
+        "existing-product",
+        "new-product",
+    ]
+    assert product == existing_product
+
+
+@pytest.mark.parametrize(
+    "version",
+    [
+        "1",
+    ],
+)
+def test_index_product_team_deleted_after_read(version):
+    org = Root.create_ods_organisation(ods_code=ODS_CODE)
+    deleted_product_team = org.create_product_team(
+        name="deleted-team", keys=_keys(EXISTING_ALIAS)
+    )
+    body = _ndjson(
+        {"product": {"product_team_id": EXISTING_ALIAS, "name": "new-product"}},
+    )
+
+    with mock_table_cpm(TABLE_NAME) as client, mock.patch.dict(
+        os.environ,
+        {
+            "DYNAMODB_TABLE": TABLE_NAME,
+            "AWS_DEFAULT_REGION": "eu-west-2",
+        },
+        clear=True,
+    ), mock.patch.object(
+        ProductTeamRepository,
+        "read_many",
+        side_effect=lambda ids: [deleted_product_team] * len(ids),
+    ):
+        from api.bulkImport.index import cache, handler
+
+        cache["DYNAMODB_CLIENT"] = client
+        result = handler(event={"headers": {"version": version}, "body": body})
+
+        assert result["statusCode"] == 200
+        results = json_loads(result["body"])["results"]
+        item_count = client.scan(TableName=TABLE_NAME)["Count"]
+
+    assert results == [
+        {
+            "line": 1,
+            "status": "failed",
+            "error": f"Could not find ProductTeam for key ('{deleted_product_team.id}')",
+        },
+    ]
+    assert item_count == 0
+
+
+@pytest.mark.parametrize(
+    "version",
+    [
+        "1",
+    ],
+)
+def test_index_product_not_written(version):
+    org = Root.create_ods_organisation(ods_code=ODS_CODE)
+    existing_product_team = org.create_product_team(
+        name="existing-team", keys=_keys(EXISTING_ALIAS)
+    )
+    body = _ndjson(
+        {"product": {"product_team_id": EXISTING_ALIAS, "name": "new-product"}},
+    )
+
+    with mock_table_cpm(TABLE_NAME) as client, mock.patch.dict(
+        os.environ,
+        {
+            "DYNAMODB_TABLE": TABLE_NAME,
+            "AWS_DEFAULT_REGION": "eu-west-2",
+        },
+        clear=True,
+    ), mock.patch.object(
+        CpmProductRepository,
+        "write",
+        side_effect=UnhandledTransaction(
+            message="oops", code="ThrottlingException", unhandled_transactions=[]
+        ),
+    ):
+        from api.bulkImport.index import cache, handler
+
+        cache["DYNAMODB_CLIENT"] = client
+        ProductTeamRepository(table_name=TABLE_NAME, dynamodb_client=client).write(
+            entity=existing_product_team
+        )
+        result = handler(event={"headers": {"version": version}, "body": body})
+
+    assert result["statusCode"] == 200
+    assert json_loads(result["body"])["results"] == [
+        {"line": 1, "status": "failed", "error": "Could not be written, please retry"},
+    ]
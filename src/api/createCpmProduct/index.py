@@ -1,4 +1,10 @@
 from api_utils.api_step_chain import execute_step_chain
+from domain.api.common_steps.create_cpm_product import (
+    PRODUCT_ID_RESERVATIONS,
+    product_id_reservations,
+)
+from domain.api.common_steps.product_team import PRODUCT_TEAM_CACHE
+from domain.repository.product_team_repository.cache import ProductTeamCache
 from event.aws.client import dynamodb_client
 from event.environment import BaseEnvironment
 from event.logging.logger import setup_logger
@@ -11,9 +17,15 @@ class Environment(BaseEnvironment):
 
 
 versioned_steps = {"1": v1_steps}
+environment = Environment.build()
+client = dynamodb_client()
 cache = {
-    **Environment.build().dict(),
-    "DYNAMODB_CLIENT": dynamodb_client(),
+    **environment.dict(),
+    "DYNAMODB_CLIENT": client,
+    PRODUCT_TEAM_CACHE: ProductTeamCache(),
+    PRODUCT_ID_RESERVATIONS: product_id_reservations(
+        table_name=environment.DYNAMODB_TABLE, dynamodb_client=client
+    ),
 }
 
 
@@ -23,4 +35,5 @@ def handler(event: dict, context=None):
         event=event,
         cache=cache,
         versioned_steps=versioned_steps,
+        context=context,
     )
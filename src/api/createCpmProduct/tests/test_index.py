@@ -2,9 +2,13 @@ import json
 import os
 from unittest import mock
 
+import orjson
 import pytest
+from domain.api.common_steps.product_team import PRODUCT_TEAM_CACHE
 from domain.core.root import Root
+from domain.repository.cpm_product_repository import CpmProductRepository
 from domain.repository.product_team_repository import ProductTeamRepository
+from domain.repository.product_team_repository.cache import ProductTeamCache
 from event.json import json_loads
 
 from test_helpers.dynamodb import mock_table_cpm
@@ -58,7 +62,7 @@ def test_index(version):
     result = _mock_test(version=version, params=json.dumps(product_payload))
 
     product = json_loads(result["body"])
-    expected_body = json.dumps(
+    expected_body = orjson.dumps(
         {
             "id": product["id"],
             "cpm_product_team_id": product["cpm_product_team_id"],
@@ -71,7 +75,7 @@ def test_index(version):
             "deleted_on": None,
             "keys": [],
         }
-    )
+    ).decode()
     expected = {
         "statusCode": 201,
         "body": expected_body,
@@ -133,7 +137,7 @@ def test_index_no_such_product_team(version):
                 },
             }
         )
-    expected_result = json.dumps(
+    expected_result = orjson.dumps(
         {
             "errors": [
                 {
@@ -142,7 +146,7 @@ def test_index_no_such_product_team(version):
                 }
             ],
         }
-    )
+    ).decode()
 
     expected = {
         "statusCode": 404,
@@ -156,3 +160,62 @@ def test_index_no_such_product_team(version):
     _response_assertions(
         result=result, expected=expected, check_body=True, check_content_length=True
     )
+
+
+@pytest.mark.parametrize(
+    "version",
+    [
+        "1",
+    ],
+)
+def test_index_product_team_deleted_since_cached(version):
+    org = Root.create_ods_organisation(ods_code=product_team_payload["ods_code"])
+    product_team = org.create_product_team(
+        name=product_team_payload["name"], keys=product_team_payload["keys"]
+    )
+
+    with mock_table_cpm(table_name=TABLE_NAME) as client, mock.patch.dict(
+        os.environ,
+        {
+            "DYNAMODB_TABLE": TABLE_NAME,
+            "AWS_DEFAULT_REGION": "eu-west-2",
+        },
+        clear=True,
+    ):
+        from api.createCpmProduct.index import cache, handler
+
+        cache["DYNAMODB_CLIENT"] = client
+        product_team_repo = ProductTeamRepository(
+            table_name=TABLE_NAME, dynamodb_client=client
+        )
+        product_team_repo.write(entity=product_team)
+
+        # The product team is cached, and then deleted by another container
+        product_team_cache: ProductTeamCache = cache[PRODUCT_TEAM_CACHE]
+        product_team_cache.put(product_team)
+        product_team.clear_events()
+        product_team.delete()
+        product_team_repo.write(entity=product_team)
+
+        result = handler(
+            event={
+                "headers": {"version": version},
+                "body": json.dumps(product_payload),
+                "pathParameters": {"product_team_id": product_team.id},
+            }
+        )
+        products = CpmProductRepository(
+            table_name=TABLE_NAME, dynamodb_client=client
+        ).search_by_product_team(product_team_id=product_team.id, status="all")
+
+    assert result["statusCode"] == 404
+    assert json_loads(result["body"]) == {
+        "errors": [
+            {
+                "code": "RESOURCE_NOT_FOUND",
+                "message": f"Could not find ProductTeam for key ('{product_team.id}')",
+            }
+        ]
+    }
+    assert products == []
+    assert product_team_cache.get(product_team.id) is None
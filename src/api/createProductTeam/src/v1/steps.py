@@ -3,6 +3,7 @@ from http import HTTPStatus
 from aws_lambda_powertools.utilities.data_classes import APIGatewayProxyEvent
 from domain.core.product_team import ProductTeam
 from domain.core.root import Root
+from domain.logging.step_decorators import skip_result_logging
 from domain.ods import validate_ods_code
 from domain.repository.product_team_repository import ProductTeamRepository
 from domain.request_models import CreateProductTeamIncomingParams
@@ -44,6 +45,7 @@ def create_product_team(data, cache) -> ProductTeam:
     return product_team
 
 
+@skip_result_logging
 def save_product_team(data, cache) -> dict:
     product_team: ProductTeam = data[create_product_team]
     product_team_repo = ProductTeamRepository(
@@ -52,9 +54,9 @@ def save_product_team(data, cache) -> dict:
     return product_team_repo.write(entity=product_team)
 
 
-def set_http_status(data, cache) -> tuple[HTTPStatus, dict]:
+def set_http_status(data, cache) -> tuple[HTTPStatus, ProductTeam]:
     product_team: ProductTeam = data[create_product_team]
-    return HTTPStatus.CREATED, product_team.state()
+    return HTTPStatus.CREATED, product_team
 
 
 steps = [
@@ -2,6 +2,7 @@ import json
 import os
 from unittest import mock
 
+import orjson
 import pytest
 from event.json import json_loads
 
@@ -39,7 +40,7 @@ def test_index(version):
             }
         )
     result_body = json_loads(result["body"])
-    expected_body = json.dumps(
+    expected_body = orjson.dumps(
         {
             "id": result_body["id"],
             "name": "FOOBAR Product Team",
@@ -55,7 +56,7 @@ def test_index(version):
                 }
             ],
         }
-    )
+    ).decode()
     expected = {
         "statusCode": 201,
         "body": expected_body,
@@ -90,7 +91,7 @@ def test_index_bad_payload(version):
         result = handler(
             event={"headers": {"version": version}, "body": json.dumps({})}
         )
-    expected_body = json.dumps(
+    expected_body = orjson.dumps(
         {
             "errors": [
                 {
@@ -103,7 +104,7 @@ def test_index_bad_payload(version):
                 },
             ],
         }
-    )
+    ).decode()
     expected = {
         "statusCode": 400,
         "body": expected_body,
@@ -141,7 +142,7 @@ def test_index_duplicated_keys(version):
                 "body": json.dumps(CPM_PRODUCT_TEAM_NO_ID_DUPED_KEYS),
             }
         )
-    expected_body = json.dumps(
+    expected_body = orjson.dumps(
         {
             "errors": [
                 {
@@ -150,7 +151,7 @@ def test_index_duplicated_keys(version):
                 }
             ]
         }
-    )
+    ).decode()
     expected = {
         "statusCode": 400,
         "body": expected_body,
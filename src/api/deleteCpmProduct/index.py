@@ -1,5 +1,7 @@
 from api_utils.api_step_chain import execute_step_chain
+from domain.api.common_steps.product_team import PRODUCT_TEAM_CACHE
 from domain.logging.step_decorators import logging_step_decorators
+from domain.repository.product_team_repository.cache import ProductTeamCache
 from event.aws.client import dynamodb_client
 from event.environment import BaseEnvironment
 from event.logging.logger import setup_logger
@@ -15,6 +17,7 @@ versioned_steps = {"1": v1_steps}
 cache = {
     **Environment.build().dict(),
     "DYNAMODB_CLIENT": dynamodb_client(),
+    PRODUCT_TEAM_CACHE: ProductTeamCache(),
 }
 
 
@@ -24,6 +27,7 @@ def handler(event: dict, context=None):
         event=event,
         cache=cache,
         versioned_steps=versioned_steps,
+        context=context,
     )
 
 
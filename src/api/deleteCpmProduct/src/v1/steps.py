@@ -1,10 +1,16 @@
 from http import HTTPStatus
 
 from aws_lambda_powertools.utilities.data_classes import APIGatewayProxyEvent
+from domain.api.common_steps.product_team import (
+    product_team_must_be_active,
+    product_team_repository,
+    read_product_team_by_id,
+)
 from domain.core.cpm_product import CpmProduct
 from domain.core.product_team import ProductTeam
+from domain.logging.step_decorators import skip_result_logging
 from domain.repository.cpm_product_repository import CpmProductRepository
-from domain.repository.product_team_repository import ProductTeamRepository
+from domain.repository.errors import ItemNotFound
 from domain.request_models import CpmProductPathParams
 from domain.response.validation_errors import mark_validation_errors_as_inbound
 from event.step_chain import StepChain
@@ -16,34 +22,49 @@ def parse_path_params(data, cache) -> CpmProductPathParams:
     return CpmProductPathParams(**event.path_parameters)
 
 
-def read_product_team(data, cache) -> ProductTeam:
-    path_params: CpmProductPathParams = data[parse_path_params]
-    product_team_repo = ProductTeamRepository(
-        table_name=cache["DYNAMODB_TABLE"], dynamodb_client=cache["DYNAMODB_CLIENT"]
-    )
-    return product_team_repo.read(id=path_params.product_team_id)
-
-
 def read_product(data, cache) -> CpmProduct:
+    """
+    The product team is not read if the product is found under the given
+    product team id, since the product is deleted on condition that the
+    product team is still active. Otherwise the product team id may be an
+    alias, so the product team is read to find the product under its id.
+    """
     path_params: CpmProductPathParams = data[parse_path_params]
-    product_team: ProductTeam = data[read_product_team]
-
     product_repo = CpmProductRepository(
         table_name=cache["DYNAMODB_TABLE"], dynamodb_client=cache["DYNAMODB_CLIENT"]
     )
-    cpm_product = product_repo.read(
-        product_team_id=product_team.id, id=path_params.product_id
-    )
-    return cpm_product
+    try:
+        return product_repo.read(
+            product_team_id=path_params.product_team_id, id=path_params.product_id
+        )
+    except ItemNotFound:
+        product_team: ProductTeam = read_product_team_by_id(
+            cache=cache, product_team_id=path_params.product_team_id
+        )
+        if product_team.id == path_params.product_team_id:
+            raise
+    return product_repo.read(product_team_id=product_team.id, id=path_params.product_id)
 
 
+@skip_result_logging
 def delete_product(data, cache) -> CpmProduct:
     product: CpmProduct = data[read_product]
     product_repo: CpmProductRepository = CpmProductRepository(
         table_name=cache["DYNAMODB_TABLE"], dynamodb_client=cache["DYNAMODB_CLIENT"]
     )
+    product_team_repo = product_team_repository(cache=cache)
     product.delete()
-    return product_repo.write(product)
+    with product_team_must_be_active(
+        cache=cache,
+        product_team_id=product.cpm_product_team_id,
+        aliases=[product.product_team_id] if product.product_team_id else [],
+    ):
+        return product_repo.write(
+            product,
+            condition_checks=[
+                product_team_repo.active_condition_check(id=product.cpm_product_team_id)
+            ],
+        )
 
 
 def set_http_status(data, cache) -> tuple[int, None]:
@@ -56,7 +77,6 @@ def set_http_status(data, cache) -> tuple[int, None]:
 
 steps = [
     parse_path_params,
-    read_product_team,
     read_product,
     delete_product,
     set_http_status,
@@ -73,7 +73,7 @@ def test_index():
         assert response["statusCode"] == 200
         assert (
             response["body"]
-            == '{"code": "RESOURCE_DELETED", "message": "P.AAA-AAA has been deleted."}'
+            == '{"code":"RESOURCE_DELETED","message":"P.AAA-AAA has been deleted."}'
         )
 
         # Retrieve the created resource
@@ -108,6 +108,45 @@ def test_index():
     }
 
 
+def test_index_does_not_read_product_team():
+    with mock_lambda() as (index, product_team), mock.patch(
+        "api.deleteCpmProduct.src.v1.steps.read_product_team_by_id"
+    ) as mocked_read_product_team_by_id:
+        response = index.handler(
+            event={
+                "headers": {"version": VERSION},
+                "pathParameters": {
+                    "product_team_id": product_team.id,
+                    "product_id": PRODUCT_ID,
+                },
+            }
+        )
+
+    assert response["statusCode"] == 200
+    mocked_read_product_team_by_id.assert_not_called()
+
+
+def test_index_by_product_team_alias():
+    with mock_lambda() as (index, product_team):
+        response = index.handler(
+            event={
+                "headers": {"version": VERSION},
+                "pathParameters": {
+                    "product_team_id": product_team.keys[0].key_value,
+                    "product_id": PRODUCT_ID,
+                },
+            }
+        )
+
+        repo = CpmProductRepository(
+            table_name=TABLE_NAME, dynamodb_client=index.cache["DYNAMODB_CLIENT"]
+        )
+        with pytest.raises(ItemNotFound):
+            repo.read(product_team_id=product_team.id, id=PRODUCT_ID)
+
+    assert response["statusCode"] == 200
+
+
 @pytest.mark.parametrize(
     ["path_parameters", "error_code", "status_code"],
     [
@@ -1,4 +1,6 @@
 from api_utils.api_step_chain import execute_step_chain
+from domain.api.common_steps.product_team import PRODUCT_TEAM_CACHE
+from domain.repository.product_team_repository.cache import ProductTeamCache
 from event.aws.client import dynamodb_client
 from event.environment import BaseEnvironment
 from event.logging.logger import setup_logger
@@ -11,7 +13,11 @@ class Environment(BaseEnvironment):
 
 
 versioned_steps = {"1": v1_steps}
-cache = {**Environment.build().dict(), "DYNAMODB_CLIENT": dynamodb_client()}
+cache = {
+    **Environment.build().dict(),
+    "DYNAMODB_CLIENT": dynamodb_client(),
+    PRODUCT_TEAM_CACHE: ProductTeamCache(),
+}
 
 
 def handler(event: dict, context=None):
@@ -20,4 +26,5 @@ def handler(event: dict, context=None):
         event=event,
         cache=cache,
         versioned_steps=versioned_steps,
+        context=context,
     )
@@ -1,9 +1,11 @@
 from http import HTTPStatus
 
 from aws_lambda_powertools.utilities.data_classes import APIGatewayProxyEvent
+from domain.api.common_steps.product_team import product_team_repository
 from domain.core.enum import Status
 from domain.core.error import ConflictError
 from domain.core.product_team import ProductTeam
+from domain.logging.step_decorators import skip_result_logging
 from domain.repository.cpm_product_repository import CpmProductRepository
 from domain.repository.product_team_repository import ProductTeamRepository
 from domain.request_models import ProductTeamPathParams
@@ -19,6 +21,8 @@ def parse_path_params(data, cache) -> ProductTeamPathParams:
 
 def read_product_team(data, cache) -> ProductTeam:
     path_params: ProductTeamPathParams = data[parse_path_params]
+    # Bypass the cache so that a deletion made by another container is never
+    # masked by a stale entry
     product_team_repo: ProductTeamRepository = ProductTeamRepository(
         table_name=cache["DYNAMODB_TABLE"], dynamodb_client=cache["DYNAMODB_CLIENT"]
     )
@@ -41,11 +45,11 @@ def read_products(data, cache):
         )
 
 
+@skip_result_logging
 def delete_product_team(data, cache) -> ProductTeamRepository:
     product_team: ProductTeam = data[read_product_team]
-    product_team_repo: ProductTeamRepository = ProductTeamRepository(
-        table_name=cache["DYNAMODB_TABLE"], dynamodb_client=cache["DYNAMODB_CLIENT"]
-    )
+    # Writing the deletion invalidates this product team in the cache
+    product_team_repo = product_team_repository(cache=cache)
     product_team.delete()
     return product_team_repo.write(product_team)
 
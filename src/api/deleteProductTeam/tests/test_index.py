@@ -1,7 +1,7 @@
-import json
 import os
 from unittest import mock
 
+import orjson
 import pytest
 from domain.core.root import Root
 from domain.repository.cpm_product_repository.v1 import CpmProductRepository
@@ -50,12 +50,12 @@ def test_index(version):
                 "pathParameters": {"product_team_id": product_team.id},
             }
         )
-    expected_result = json.dumps(
+    expected_result = orjson.dumps(
         {
             "code": "RESOURCE_DELETED",
             "message": f"{product_team.id} has been deleted.",
         }
-    )
+    ).decode()
 
     expected = {
         "statusCode": 200,
@@ -95,7 +95,7 @@ def test_index_no_such_product_team(version, product_id):
             }
         )
 
-    expected_result = json.dumps(
+    expected_result = orjson.dumps(
         {
             "errors": [
                 {
@@ -104,7 +104,7 @@ def test_index_no_such_product_team(version, product_id):
                 }
             ],
         }
-    )
+    ).decode()
 
     expected = {
         "statusCode": 404,
@@ -157,12 +157,12 @@ def test_index_by_alias(version):
                 },
             }
         )
-    expected_result = json.dumps(
+    expected_result = orjson.dumps(
         {
             "code": "RESOURCE_DELETED",
             "message": f"{product_team.id} has been deleted.",
         }
-    )
+    ).decode()
 
     expected = {
         "statusCode": 200,
@@ -218,7 +218,7 @@ def test_index_existing_products(version):
                 "pathParameters": {"product_team_id": product_team.id},
             }
         )
-    expected_result = json.dumps(
+    expected_result = orjson.dumps(
         {
             "errors": [
                 {
@@ -227,7 +227,7 @@ def test_index_existing_products(version):
                 }
             ]
         }
-    )
+    ).decode()
 
     expected = {
         "statusCode": 409,
@@ -278,12 +278,12 @@ def test_index_create_multiple_times(version):
                 "pathParameters": {"product_team_id": product_team.id},
             }
         )
-    expected_result = json.dumps(
+    expected_result = orjson.dumps(
         {
             "code": "RESOURCE_DELETED",
             "message": f"{product_team.id} has been deleted.",
         }
-    )
+    ).decode()
 
     expected = {
         "statusCode": 200,
@@ -321,12 +321,12 @@ def test_index_create_multiple_times(version):
                 "pathParameters": {"product_team_id": product_team.id},
             }
         )
-    expected_result = json.dumps(
+    expected_result = orjson.dumps(
         {
             "code": "RESOURCE_DELETED",
             "message": f"{product_team.id} has been deleted.",
         }
-    )
+    ).decode()
 
     expected = {
         "statusCode": 200,
@@ -23,4 +23,5 @@ def handler(event: dict, context=None):
         event=event,
         cache=cache,
         versioned_steps=versioned_steps,
+        context=context,
     )
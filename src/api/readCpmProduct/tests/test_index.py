@@ -1,7 +1,7 @@
-import json
 import os
 from unittest import mock
 
+import orjson
 import pytest
 from domain.core.root import Root
 from domain.repository.cpm_product_repository import CpmProductRepository
@@ -91,6 +91,52 @@ def test_index(version):
         assert result["headers"][key] == value
 
 
+@pytest.mark.parametrize(
+    "version",
+    [
+        "1",
+    ],
+)
+def test_index_fields(version):
+    org = Root.create_ods_organisation(ods_code=ODS_CODE)
+    product_team = org.create_product_team(
+        name=PRODUCT_TEAM_NAME, keys=PRODUCT_TEAM_KEYS
+    )
+    cpm_product = product_team.create_cpm_product(
+        name=PRODUCT_NAME, product_id=PRODUCT_ID
+    )
+
+    with mock_table_cpm(TABLE_NAME) as client, mock.patch.dict(
+        os.environ,
+        {
+            "DYNAMODB_TABLE": TABLE_NAME,
+            "AWS_DEFAULT_REGION": "eu-west-2",
+        },
+        clear=True,
+    ):
+        CpmProductRepository(table_name=TABLE_NAME, dynamodb_client=client).write(
+            cpm_product
+        )
+
+        from api.readCpmProduct.index import cache, handler
+
+        cache["DYNAMODB_CLIENT"] = client
+        result = handler(
+            event={
+                "headers": {"version": version},
+                "pathParameters": {"product_id": PRODUCT_ID},
+                "queryStringParameters": {"fields": "id,name,created_on"},
+            }
+        )
+
+    assert result["statusCode"] == 200
+    assert json_loads(result["body"]) == {
+        "id": PRODUCT_ID,
+        "name": PRODUCT_NAME,
+        "created_on": cpm_product.state()["created_on"],
+    }
+
+
 @pytest.mark.parametrize(
     "version",
     [
@@ -126,7 +172,7 @@ def test_index_no_such_cpm_product(version):
             }
         )
 
-    expected_result = json.dumps(
+    expected_result = orjson.dumps(
         {
             "errors": [
                 {
@@ -135,7 +181,7 @@ def test_index_no_such_cpm_product(version):
                 }
             ],
         }
-    )
+    ).decode()
 
     expected = {
         "statusCode": 404,
@@ -20,4 +20,5 @@ def handler(event: dict, context=None):
         event=event,
         cache=cache,
         versioned_steps=versioned_steps,
+        context=context,
     )
@@ -22,9 +22,9 @@ def read_product_team(data, cache) -> ProductTeam:
     return product_team_repo.read(id=path_params.product_team_id)
 
 
-def return_product_team(data, cache) -> tuple[HTTPStatus, dict]:
+def return_product_team(data, cache) -> tuple[HTTPStatus, ProductTeam]:
     product_team: ProductTeam = data[read_product_team]
-    return HTTPStatus.OK, product_team.state()
+    return HTTPStatus.OK, product_team
 
 
 steps = [parse_path_params, read_product_team, return_product_team]
@@ -1,7 +1,7 @@
-import json
 import os
 from unittest import mock
 
+import orjson
 import pytest
 from domain.core.root import Root
 from domain.repository.product_team_repository import ProductTeamRepository
@@ -51,7 +51,7 @@ def test_index(version):
             }
         )
     result_body = json_loads(result["body"])
-    expected_result = json.dumps(
+    expected_result = orjson.dumps(
         {
             "id": result_body["id"],
             "name": "FOOBAR Product Team",
@@ -67,7 +67,7 @@ def test_index(version):
                 }
             ],
         }
-    )
+    ).decode()
 
     expected = {
         "statusCode": 200,
@@ -107,7 +107,7 @@ def test_index_no_such_product_team(version, product_id):
             }
         )
 
-    expected_result = json.dumps(
+    expected_result = orjson.dumps(
         {
             "errors": [
                 {
@@ -116,7 +116,7 @@ def test_index_no_such_product_team(version, product_id):
                 }
             ],
         }
-    )
+    ).decode()
 
     expected = {
         "statusCode": 404,
@@ -170,7 +170,7 @@ def test_index_by_alias(version):
             }
         )
     result_body = json_loads(result["body"])
-    expected_result = json.dumps(
+    expected_result = orjson.dumps(
         {
             "id": result_body["id"],
             "name": "FOOBAR Product Team",
@@ -186,7 +186,7 @@ def test_index_by_alias(version):
                 }
             ],
         }
-    )
+    ).decode()
 
     expected = {
         "statusCode": 200,
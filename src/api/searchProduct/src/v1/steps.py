@@ -1,15 +1,37 @@
+import asyncio
 from http import HTTPStatus
+from typing import Iterable
 
 from aws_lambda_powertools.utilities.data_classes import APIGatewayProxyEvent
+from domain.api.common_steps.product_team import (
+    product_team_repository,
+    read_product_team_by_id,
+)
+from domain.core.cpm_product import CpmProduct
 from domain.core.enum import Status
+from domain.logging.step_decorators import skip_result_logging
 from domain.repository.cpm_product_repository import CpmProductRepository
+from domain.repository.cpm_repository.aio import run_in_executor
 from domain.repository.errors import ItemNotFound
-from domain.repository.product_team_repository.v1 import ProductTeamRepository
+from domain.repository.pagination import (
+    decode_fan_out_page_token,
+    encode_fan_out_page_token,
+)
 from domain.request_models.v1 import SearchProductQueryParams
-from domain.response.response_models import SearchProductResponse
+from domain.response.response_models import (
+    SEARCH_PRODUCT_GROUPING_FIELDS,
+    SearchProductResponse,
+)
 from domain.response.validation_errors import mark_validation_errors_as_inbound
 from event.step_chain import StepChain
 
+SEARCH_PRODUCT_PAGE_SIZE = 500
+# Searches for several organisations or product teams are made concurrently,
+# at most this many at a time, and share SEARCH_PRODUCT_PAGE_SIZE between them
+SEARCH_PRODUCT_MAX_CONCURRENT_QUERIES = 10
+
+type ProductPages = Iterable[tuple[list[CpmProduct | dict], str | None]]
+
 
 @mark_validation_errors_as_inbound
 def _parse_event_query(query_params: dict):
@@ -26,37 +48,140 @@ def parse_event_query(data, cache):
     }
 
 
-def query_products(data, cache) -> list:
+def _product_team_ids(cache, aliases: Iterable[str]) -> dict[str, str]:
+    """The id of each product team, by the given id or alias, if it exists"""
+    aliases = list(aliases)
+    product_teams = product_team_repository(cache=cache).read_many(ids=aliases)
+    product_team_ids = {}
+    for alias, product_team in zip(aliases, product_teams):
+        # Skip aliases of the same product team, so that it is only searched once
+        if (
+            product_team is not None
+            and product_team.id not in product_team_ids.values()
+        ):
+            product_team_ids[alias] = product_team.id
+    return product_team_ids
+
+
+async def _search_many(
+    product_repo: CpmProductRepository,
+    cache,
+    query_params: dict,
+    fields: list[str] | None,
+) -> ProductPages:
+    """
+    Search concurrently for the products of several organisations or product
+    teams. The returned token resumes each search that has more results.
+    """
+    if "product_team_id" in query_params:
+        values = query_params["product_team_id"]
+        search = product_repo.aio.search_page_by_product_team
+    else:
+        values = query_params["organisation_code"]
+        search = product_repo.aio.search_page_by_organisation
+
+    page_token = query_params.get("page_token")
+    if page_token:
+        page_tokens = decode_fan_out_page_token(page_token=page_token, values=values)
+    else:
+        page_tokens = dict.fromkeys(values)
+
+    if "product_team_id" in query_params:
+        search_ids = await run_in_executor(
+            _product_team_ids, cache=cache, aliases=list(page_tokens)
+        )
+    else:
+        search_ids = {value: value for value in page_tokens}
+    if not search_ids:
+        return []
+
+    page_size = max(SEARCH_PRODUCT_PAGE_SIZE // len(search_ids), 1)
+    semaphore = asyncio.Semaphore(SEARCH_PRODUCT_MAX_CONCURRENT_QUERIES)
+
+    async def _search(value: str):
+        async with semaphore:
+            return await search(
+                search_ids[value],
+                status=Status.ACTIVE,
+                page_size=page_size,
+                page_token=page_tokens[value],
+                fields=fields,
+            )
+
+    pages = await asyncio.gather(*map(_search, search_ids))
+    next_page_tokens = {
+        value: next_page_token
+        for value, (_, next_page_token) in zip(search_ids, pages)
+        if next_page_token is not None
+    }
+    next_page_token = (
+        encode_fan_out_page_token(next_page_tokens) if next_page_tokens else None
+    )
+    return [(products, next_page_token) for products, _ in pages]
+
+
+@skip_result_logging
+async def query_products(data, cache) -> ProductPages:
     event_data: dict = data[parse_event_query]
     query_params: dict = event_data.get("query_params")
+    page_token = query_params.get("page_token")
+    fields = query_params.get("fields")
+    if fields is not None:
+        # Products are grouped in the response by these fields
+        fields = list(dict.fromkeys([*fields, *SEARCH_PRODUCT_GROUPING_FIELDS]))
     product_repo = CpmProductRepository(
         table_name=cache["DYNAMODB_TABLE"], dynamodb_client=cache["DYNAMODB_CLIENT"]
     )
 
-    if "product_team_id" in query_params:
-        product_team_repo = ProductTeamRepository(
-            table_name=cache["DYNAMODB_TABLE"], dynamodb_client=cache["DYNAMODB_CLIENT"]
+    filter_values = query_params.get("product_team_id") or query_params.get(
+        "organisation_code"
+    )
+    if len(filter_values) > 1:
+        return await _search_many(
+            product_repo=product_repo,
+            cache=cache,
+            query_params=query_params,
+            fields=fields,
         )
+
+    # A single search is streamed a page at a time
+    (filter_value,) = filter_values
+    if "product_team_id" in query_params:
         # Allow product team id or product team alias
         try:
-            product_team = product_team_repo.read(id=query_params["product_team_id"])
+            product_team = read_product_team_by_id(
+                cache=cache, product_team_id=filter_value
+            )
         except ItemNotFound:
             return []
         product_team_id = product_team.id
-        return product_repo.search_by_product_team(
-            product_team_id, status=Status.ACTIVE
+        return product_repo.search_pages_by_product_team(
+            product_team_id,
+            status=Status.ACTIVE,
+            page_size=SEARCH_PRODUCT_PAGE_SIZE,
+            page_token=page_token,
+            fields=fields,
         )
-    elif "organisation_code" in query_params:
-        return product_repo.search_by_organisation(
-            query_params["organisation_code"], status=Status.ACTIVE
+    else:
+        return product_repo.search_pages_by_organisation(
+            filter_value,
+            status=Status.ACTIVE,
+            page_size=SEARCH_PRODUCT_PAGE_SIZE,
+            page_token=page_token,
+            fields=fields,
         )
 
 
-def return_products(data, cache) -> tuple[HTTPStatus, str]:
-    cpm_products = data[query_products]
-    response = SearchProductResponse(cpm_products)
+def return_products(data, cache) -> tuple[HTTPStatus, dict]:
+    # Products are grouped a page at a time, so that only one page of models
+    # is held in memory at once
+    event_data: dict = data[parse_event_query]
+    response = SearchProductResponse(fields=event_data["query_params"].get("fields"))
+    for cpm_products, next_page_token in data[query_products]:
+        response.extend(cpm_products)
+        response.next_page_token = next_page_token
 
-    return HTTPStatus.OK, response.state()
+    return HTTPStatus.OK, response.dict()
 
 
 steps = [
@@ -1,7 +1,7 @@
-import json
 import os
 from unittest import mock
 
+import orjson
 import pytest
 from domain.core.root import Root
 from domain.repository.cpm_product_repository import CpmProductRepository
@@ -9,10 +9,13 @@ from domain.repository.product_team_repository import ProductTeamRepository
 from event.json import json_loads
 
 from conftest import dynamodb_client_with_sleep
+from test_helpers.dynamodb import mock_table_cpm
 from test_helpers.response_assertions import _response_assertions
 from test_helpers.terraform import read_terraform_output
+from test_helpers.uuid import consistent_uuid
 from test_helpers.validate_search_response import validate_product_result_body
 
+TABLE_NAME = "hiya"
 VERSION = "1"
 ODS_CODE = "F5H1R"
 PRODUCT_TEAM_NAME = "product-team-name"
@@ -71,7 +74,7 @@ def test_no_results():
             }
         )
 
-    expected_result = json.dumps({"results": []})
+    expected_result = orjson.dumps({"results": []}).decode()
     expected = {
         "statusCode": 200,
         "body": expected_result,
@@ -128,7 +131,7 @@ def test_search_by_product_team_id():
             }
         )
 
-    expected_result = json.dumps(
+    expected_result = orjson.dumps(
         {
             "results": [
                 {
@@ -143,7 +146,7 @@ def test_search_by_product_team_id():
                 }
             ]
         }
-    )
+    ).decode()
 
     expected = {
         "statusCode": 200,
@@ -203,7 +206,7 @@ def test_search_by_product_team_alias():
             }
         )
 
-    expected_result = json.dumps(
+    expected_result = orjson.dumps(
         {
             "results": [
                 {
@@ -218,7 +221,7 @@ def test_search_by_product_team_alias():
                 }
             ]
         }
-    )
+    ).decode()
 
     expected = {
         "statusCode": 200,
@@ -279,7 +282,7 @@ def test_index_org_code():
             }
         )
 
-    expected_result = json.dumps(
+    expected_result = orjson.dumps(
         {
             "results": [
                 {
@@ -294,7 +297,7 @@ def test_index_org_code():
                 }
             ]
         }
-    )
+    ).decode()
 
     expected = {
         "statusCode": 200,
@@ -569,3 +572,318 @@ def test_index_no_org():
 
     assert result["statusCode"] == 200
     assert result_body == {"results": []}
+
+
+def test_index_org_code_paginated():
+    org = Root.create_ods_organisation(ods_code=ODS_CODE)
+    product_team = org.create_product_team(name=PRODUCT_TEAM_NAME)
+    products = [
+        product_team.create_cpm_product(name=PRODUCT_NAME, product_id=product_id)
+        for product_id in ("P.AAA-CCC", "P.AAA-DDD", "P.AAA-EEE")
+    ]
+
+    with mock_table_cpm(TABLE_NAME) as client, mock.patch.dict(
+        os.environ,
+        {
+            "DYNAMODB_TABLE": TABLE_NAME,
+            "AWS_DEFAULT_REGION": "eu-west-2",
+        },
+        clear=True,
+    ), mock.patch("api.searchProduct.src.v1.steps.SEARCH_PRODUCT_PAGE_SIZE", 2):
+        from api.searchProduct.index import cache, handler
+
+        cache["DYNAMODB_CLIENT"] = client
+
+        ProductTeamRepository(table_name=TABLE_NAME, dynamodb_client=client).write(
+            entity=product_team
+        )
+        product_repo = CpmProductRepository(
+            table_name=TABLE_NAME, dynamodb_client=client
+        )
+        for product in products:
+            product_repo.write(entity=product)
+
+        params = {"organisation_code": ODS_CODE}
+        result_bodies = []
+        while True:
+            result = handler(
+                event={
+                    "headers": {"version": VERSION},
+                    "queryStringParameters": params,
+                    "multiValueHeaders": {"Host": ["foo.co.uk"]},
+                }
+            )
+            assert result["statusCode"] == 200
+            result_bodies.append(json_loads(result["body"]))
+            if "next_page_token" not in result_bodies[-1]:
+                break
+            params = {
+                "organisation_code": ODS_CODE,
+                "page_token": result_bodies[-1]["next_page_token"],
+            }
+
+        invalid_page_token_result = handler(
+            event={
+                "headers": {"version": VERSION},
+                "queryStringParameters": {
+                    "product_team_id": product_team.id,
+                    "page_token": result_bodies[0]["next_page_token"],
+                },
+                "multiValueHeaders": {"Host": ["foo.co.uk"]},
+            }
+        )
+
+    assert len(result_bodies) == 2
+    product_ids = [
+        product["id"]
+        for result_body in result_bodies
+        for org_result in result_body["results"]
+        for team_result in org_result["product_teams"]
+        for product in team_result["products"]
+    ]
+    assert sorted(product_ids) == [str(product.id) for product in products]
+
+    assert invalid_page_token_result["statusCode"] == 400
+    invalid_page_token_body = json_loads(invalid_page_token_result["body"])
+    assert invalid_page_token_body["errors"][0]["code"] == "VALIDATION_ERROR"
+
+
+def test_index_fields():
+    product_team = _create_org()
+    product = product_team.create_cpm_product(name=PRODUCT_NAME, product_id=PRODUCT_ID)
+
+    with mock_table_cpm(TABLE_NAME) as client, mock.patch.dict(
+        os.environ,
+        {
+            "DYNAMODB_TABLE": TABLE_NAME,
+            "AWS_DEFAULT_REGION": "eu-west-2",
+        },
+        clear=True,
+    ):
+        from api.searchProduct.index import cache, handler
+
+        cache["DYNAMODB_CLIENT"] = client
+
+        ProductTeamRepository(table_name=TABLE_NAME, dynamodb_client=client).write(
+            entity=product_team
+        )
+        CpmProductRepository(table_name=TABLE_NAME, dynamodb_client=client).write(
+            entity=product
+        )
+
+        with mock.patch.object(client, "query", wraps=client.query) as query:
+            result = handler(
+                event={
+                    "headers": {"version": VERSION},
+                    "queryStringParameters": {
+                        "organisation_code": ODS_CODE,
+                        "fields": "id,name",
+                    },
+                    "multiValueHeaders": {"Host": ["foo.co.uk"]},
+                }
+            )
+
+        invalid_fields_result = handler(
+            event={
+                "headers": {"version": VERSION},
+                "queryStringParameters": {
+                    "organisation_code": ODS_CODE,
+                    "fields": "id,pk",
+                },
+                "multiValueHeaders": {"Host": ["foo.co.uk"]},
+            }
+        )
+
+    assert result["statusCode"] == 200
+    assert json_loads(result["body"]) == {
+        "results": [
+            {
+                "org_code": ODS_CODE,
+                "product_teams": [
+                    {
+                        "product_team_id": "808a36db-a52a-4130-b71e-d9cbcbaed15b",
+                        "cpm_product_team_id": product_team.id,
+                        "products": [{"id": PRODUCT_ID, "name": PRODUCT_NAME}],
+                    }
+                ],
+            }
+        ]
+    }
+    # Only the requested fields, and those that products are grouped by, are read
+    (projected_attributes,) = {
+        frozenset(
+            call.kwargs["ExpressionAttributeNames"][placeholder]
+            for placeholder in call.kwargs["ProjectionExpression"].split(", ")
+        )
+        for call in query.call_args_list
+    }
+    assert projected_attributes == {
+        "id",
+        "name",
+        "ods_code",
+        "cpm_product_team_id",
+        "product_team_id",
+    }
+
+    assert invalid_fields_result["statusCode"] == 400
+    invalid_fields_body = json_loads(invalid_fields_result["body"])
+    assert invalid_fields_body["errors"][0]["code"] == "VALIDATION_ERROR"
+    assert invalid_fields_body["errors"][0]["message"].startswith(
+        "SearchProductQueryParams.fields: Unknown fields ['pk']"
+    )
+
+
+def _search(handler, params: dict) -> tuple[int, dict]:
+    result = handler(
+        event={
+            "headers": {"version": VERSION},
+            "queryStringParameters": params,
+            "multiValueHeaders": {"Host": ["foo.co.uk"]},
+        }
+    )
+    return result["statusCode"], json_loads(result["body"])
+
+
+def _product_ids(result_bodies: list[dict]) -> list[str]:
+    return sorted(
+        product["id"]
+        for result_body in result_bodies
+        for org_result in result_body["results"]
+        for team_result in org_result["product_teams"]
+        for product in team_result["products"]
+    )
+
+
+ALIASES = {
+    ods_code: consistent_uuid(n)
+    for n, ods_code in enumerate(["AAA", "BBB", "CCC"], start=1)
+}
+
+
+def _create_products_for_orgs(client, ods_codes: list[str], n_products: int):
+    product_team_repo = ProductTeamRepository(
+        table_name=TABLE_NAME, dynamodb_client=client
+    )
+    product_repo = CpmProductRepository(table_name=TABLE_NAME, dynamodb_client=client)
+    product_teams, products = [], []
+    for ods_code in ods_codes:
+        org = Root.create_ods_organisation(ods_code=ods_code)
+        product_team = org.create_product_team(
+            name=PRODUCT_TEAM_NAME,
+            keys=[{"key_type": "product_team_id", "key_value": ALIASES[ods_code]}],
+        )
+        product_team_repo.write(entity=product_team)
+        product_teams.append(product_team)
+        for _ in range(n_products):
+            product = product_team.create_cpm_product(name=PRODUCT_NAME)
+            product_repo.write(entity=product)
+            products.append(product)
+    return product_teams, products
+
+
+def test_index_multiple_org_codes():
+    ods_codes = ["AAA", "BBB", "CCC"]
+    with mock_table_cpm(TABLE_NAME) as client, mock.patch.dict(
+        os.environ,
+        {"DYNAMODB_TABLE": TABLE_NAME, "AWS_DEFAULT_REGION": "eu-west-2"},
+        clear=True,
+    ):
+        from api.searchProduct.index import cache, handler
+
+        cache["DYNAMODB_CLIENT"] = client
+        _, products = _create_products_for_orgs(
+            client, ods_codes=ods_codes, n_products=2
+        )
+
+        with mock.patch.object(client, "query", wraps=client.query) as query:
+            status_code, result_body = _search(
+                handler, {"organisation_code": "AAA,CCC,DDD"}
+            )
+
+    assert status_code == 200
+    assert [org_result["org_code"] for org_result in result_body["results"]] == [
+        "AAA",
+        "CCC",
+    ]
+    assert _product_ids([result_body]) == sorted(
+        str(product.id) for product in products if product.ods_code != "BBB"
+    )
+    assert "next_page_token" not in result_body
+    assert query.call_count == 3
+
+
+def test_index_multiple_product_team_ids():
+    ods_codes = ["AAA", "BBB", "CCC"]
+    with mock_table_cpm(TABLE_NAME) as client, mock.patch.dict(
+        os.environ,
+        {"DYNAMODB_TABLE": TABLE_NAME, "AWS_DEFAULT_REGION": "eu-west-2"},
+        clear=True,
+    ):
+        from api.searchProduct.index import cache, handler
+
+        cache["DYNAMODB_CLIENT"] = client
+        (team_a, team_b, _), products = _create_products_for_orgs(
+            client, ods_codes=ods_codes, n_products=2
+        )
+
+        # By id and alias, including both for the same product team
+        status_code, result_body = _search(
+            handler,
+            {
+                "product_team_id": ",".join(
+                    [team_a.id, ALIASES["BBB"], ALIASES["AAA"], "does-not-exist"]
+                )
+            },
+        )
+
+    assert status_code == 200
+    assert _product_ids([result_body]) == sorted(
+        str(product.id)
+        for product in products
+        if product.cpm_product_team_id in (team_a.id, team_b.id)
+    )
+
+
+def test_index_multiple_org_codes_paginated():
+    ods_codes = ["AAA", "BBB"]
+    with mock_table_cpm(TABLE_NAME) as client, mock.patch.dict(
+        os.environ,
+        {"DYNAMODB_TABLE": TABLE_NAME, "AWS_DEFAULT_REGION": "eu-west-2"},
+        clear=True,
+    ), mock.patch("api.searchProduct.src.v1.steps.SEARCH_PRODUCT_PAGE_SIZE", 4):
+        from api.searchProduct.index import cache, handler
+
+        cache["DYNAMODB_CLIENT"] = client
+        _, products = _create_products_for_orgs(
+            client, ods_codes=ods_codes, n_products=3
+        )
+
+        # Each organisation is searched for 4 / 2 = 2 products at a time
+        params = {"organisation_code": "AAA,BBB"}
+        result_bodies = []
+        while True:
+            status_code, result_body = _search(handler, params)
+            assert status_code == 200
+            result_bodies.append(result_body)
+            if "next_page_token" not in result_body:
+                break
+            params = {
+                "organisation_code": "AAA,BBB",
+                "page_token": result_body["next_page_token"],
+            }
+
+        invalid_page_token_status_code, invalid_page_token_body = _search(
+            handler,
+            {
+                "organisation_code": "AAA,CCC",
+                "page_token": result_bodies[0]["next_page_token"],
+            },
+        )
+
+    assert len(result_bodies) == 2
+    assert _product_ids(result_bodies) == sorted(
+        str(product.id) for product in products
+    )
+
+    assert invalid_page_token_status_code == 400
+    assert invalid_page_token_body["errors"][0]["code"] == "VALIDATION_ERROR"
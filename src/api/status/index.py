@@ -1,6 +1,7 @@
 from domain.logging.step_decorators import logging_step_decorators
 from domain.response.steps import response_steps
 from event.aws.client import dynamodb_client
+from event.aws.retry import retry_budget
 from event.environment import BaseEnvironment
 from event.logging.logger import setup_logger
 from event.status.steps import steps
@@ -17,14 +18,15 @@ cache = {
 }
 step_decorators = [*logging_step_decorators]
 post_steps = [*response_steps]
+api_chain = StepChain(step_chain=steps, step_decorators=step_decorators)
+response_chain = StepChain(step_chain=post_steps, step_decorators=step_decorators)
 
 
 def handler(event: dict, context=None):
     setup_logger(service_name=__file__)
 
-    api_chain = StepChain(step_chain=steps, step_decorators=step_decorators)
-    api_chain.run(cache=cache, init=event)
+    with retry_budget(context=context):
+        _, result = api_chain.execute(cache=cache, init=event)
 
-    response_chain = StepChain(step_chain=post_steps, step_decorators=step_decorators)
-    response_chain.run(init=(api_chain.result, None))
-    return response_chain.result
+    _, response = response_chain.execute(init=(result, None))
+    return response
@@ -1,8 +1,8 @@
-import json
 import os
 from http import HTTPStatus
 from unittest import mock
 
+import orjson
 import pytest
 from event.status.steps import StatusNotOk, _status_check
 
@@ -41,12 +41,12 @@ def test_index():
 
         result = handler(event={})
 
-    expected_result = json.dumps(
+    expected_result = orjson.dumps(
         {
             "code": "OK",
             "message": "Transaction successful",
         }
-    )
+    ).decode()
 
     expected = {
         "statusCode": 200,
@@ -77,7 +77,7 @@ def test_index_not_ok():
 
         result = handler(event={})
 
-    expected_body = json.dumps(
+    expected_body = orjson.dumps(
         {
             "errors": [
                 {
@@ -86,7 +86,7 @@ def test_index_not_ok():
                 }
             ],
         }
-    )
+    ).decode()
 
     expected = {
         "statusCode": 503,
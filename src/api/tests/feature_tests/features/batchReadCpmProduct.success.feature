@@ -0,0 +1,41 @@
+Feature: Batch Read CPM Product - success scenarios
+  These scenarios demonstrate successful CPM Product batch reads
+
+  Background:
+    Given "default" request headers:
+      | name          | value   |
+      | version       | 1       |
+      | Authorization | letmein |
+
+  Scenario: Batch read existing and unknown CpmProducts
+    Given I have already made a "POST" request with "default" headers to "ProductTeam" with body:
+      | path             | value                                |
+      | name             | My Great Product Team                |
+      | ods_code         | F5H1R                                |
+      | keys.0.key_type  | product_team_id                      |
+      | keys.0.key_value | 8babe222-5c78-42c6-8aa6-a3c69943030a |
+    Given I note the response field "$.id" as "product_team_id"
+    And I have already made a "POST" request with "default" headers to "ProductTeam/${ note(product_team_id) }/Product" with body:
+      | path | value            |
+      | name | My Great Product |
+    And I note the response field "$.id" as "product_id"
+    When I make a "POST" request with "default" headers to "Product/_batch-read" with body:
+      | path                       | value                                |
+      | products.0.product_team_id | 8babe222-5c78-42c6-8aa6-a3c69943030a |
+      | products.0.product_id      | ${ note(product_id) }                |
+      | products.1.product_team_id | ${ note(product_team_id) }           |
+      | products.1.product_id      | P.XXX-YYY                            |
+    Then I receive a status code "200" with body
+      | path                                | value                                |
+      | results.0.id                        | ${ note(product_id) }                |
+      | results.0.cpm_product_team_id       | ${ note(product_team_id) }           |
+      | results.0.product_team_id           | 8babe222-5c78-42c6-8aa6-a3c69943030a |
+      | results.0.name                      | My Great Product                     |
+      | results.0.ods_code                  | F5H1R                                |
+      | results.0.status                    | active                               |
+      | results.0.keys                      | []                                   |
+      | results.0.created_on                | << ignore >>                         |
+      | results.0.updated_on                | << ignore >>                         |
+      | results.0.deleted_on                | << ignore >>                         |
+      | not_found.0.product_team_id         | ${ note(product_team_id) }           |
+      | not_found.0.product_id              | P.XXX-YYY                            |
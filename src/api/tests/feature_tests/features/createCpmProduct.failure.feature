@@ -27,7 +27,7 @@ Feature: Create CPM Product - failure scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 219              |
+      | Content-Length | 211              |
 
   Scenario: Cannot create a Cpm Product with a Cpm Product that is missing fields (no name)
     Given I have already made a "POST" request with "default" headers to "ProductTeam" with body:
@@ -48,7 +48,7 @@ Feature: Create CPM Product - failure scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 105              |
+      | Content-Length | 101              |
 
   Scenario: Cannot create a Cpm Product with an invalid body (extra parameter is not allowed)
     Given I have already made a "POST" request with "default" headers to "ProductTeam" with body:
@@ -69,7 +69,7 @@ Feature: Create CPM Product - failure scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 119              |
+      | Content-Length | 115              |
 
   Scenario: Cannot create a Cpm Product with corrupt body
     Given I have already made a "POST" request with "default" headers to "ProductTeam" with body:
@@ -90,7 +90,7 @@ Feature: Create CPM Product - failure scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 115              |
+      | Content-Length | 111              |
 
   Scenario: Cannot create a Cpm Product with a Product Team that does not exist
     When I make a "POST" request with "default" headers to "ProductTeam/f9518c12-6c83-4544-97db-d9dd1d64da97/Product" with body:
@@ -103,7 +103,7 @@ Feature: Create CPM Product - failure scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 134              |
+      | Content-Length | 130              |
 
   Scenario: Cannot create a Cpm Product with an empty name
     Given I have already made a "POST" request with "default" headers to "ProductTeam" with body:
@@ -123,4 +123,4 @@ Feature: Create CPM Product - failure scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 137              |
+      | Content-Length | 133              |
@@ -34,7 +34,7 @@ Feature: Create CPM Product - success scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 312              |
+      | Content-Length | 293              |
     When I make a "GET" request with "default" headers to "Product/${ note(product_id) }"
     Then I receive a status code "200" with body
       | path                | value                                |
@@ -51,7 +51,7 @@ Feature: Create CPM Product - success scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 312              |
+      | Content-Length | 293              |
 
     Examples:
       | product_team_id                      |
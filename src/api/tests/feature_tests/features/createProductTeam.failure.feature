@@ -27,7 +27,7 @@ Feature: Create Product Team - failure scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 76               |
+      | Content-Length | 72               |
 
   Scenario: Cannot create a ProductTeam with invalid key_type
     When I make a "POST" request with "default" headers to "ProductTeam" with body:
@@ -43,7 +43,7 @@ Feature: Create Product Team - failure scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 175              |
+      | Content-Length | 171              |
 
   Scenario: Cannot create a ProductTeam that is missing fields
     When I make a "POST" request with "default" headers to "ProductTeam" with body:
@@ -58,7 +58,7 @@ Feature: Create Product Team - failure scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 110              |
+      | Content-Length | 106              |
 
   Scenario: Cannot create a ProductTeam with a syntactically invalid ODS Code
     When I make a "POST" request with "default" headers to "ProductTeam" with body:
@@ -74,7 +74,7 @@ Feature: Create Product Team - failure scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 178              |
+      | Content-Length | 174              |
 
   Scenario: Cannot create a ProductTeam with an ODS code that is syntatically correct but doesnt exist
     When I make a "POST" request with "default" headers to "ProductTeam" with body:
@@ -90,7 +90,7 @@ Feature: Create Product Team - failure scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 167              |
+      | Content-Length | 163              |
 
   Scenario: Cannot create a ProductTeam with corrupt body
     When I make a "POST" request with "default" headers to "ProductTeam" with body:
@@ -104,7 +104,7 @@ Feature: Create Product Team - failure scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 115              |
+      | Content-Length | 111              |
 
   Scenario: Cannot create a ProductTeam with an empty name
     When I make a "POST" request with "default" headers to "ProductTeam" with body:
@@ -120,7 +120,7 @@ Feature: Create Product Team - failure scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 138              |
+      | Content-Length | 134              |
 
   Scenario: Cannot create a ProductTeam with a missing name
     When I make a "POST" request with "default" headers to "ProductTeam" with body:
@@ -135,7 +135,7 @@ Feature: Create Product Team - failure scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 106              |
+      | Content-Length | 102              |
 
   Scenario: Cannot create a ProductTeam with empty product team id key
     When I make a "POST" request with "default" headers to "ProductTeam" with body:
@@ -151,7 +151,7 @@ Feature: Create Product Team - failure scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 272              |
+      | Content-Length | 268              |
 
   Scenario: Successfully create a ProductTeam with duplicated product_team_id keys
     When I make a "POST" request with "default" headers to "ProductTeam" with body:
@@ -171,4 +171,4 @@ Feature: Create Product Team - failure scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 152              |
+      | Content-Length | 148              |
@@ -28,7 +28,7 @@ Feature: Create Product Team - success scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 306              |
+      | Content-Length | 288              |
     Given I note the response field "$.id" as "product_team_id"
     When I make a "GET" request with "default" headers to "ProductTeam/${ note(product_team_id) }"
     Then I receive a status code "200" with body
@@ -64,7 +64,7 @@ Feature: Create Product Team - success scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 306              |
+      | Content-Length | 288              |
     When I make a "GET" request with "default" headers to "ProductTeam/0a78ee8f-5bcf-4db1-9341-ef1d67248715"
     Then I receive a status code "200" with body
       | path             | value                                |
@@ -99,7 +99,7 @@ Feature: Create Product Team - success scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 299              |
+      | Content-Length | 281              |
     Given I note the response field "$.id" as "product_team_id"
     When I make a "GET" request with "default" headers to "ProductTeam/${ note(product_team_id) }"
     Then I receive a status code "200" with body
@@ -133,7 +133,7 @@ Feature: Create Product Team - success scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 299              |
+      | Content-Length | 281              |
     Given I note the response field "$.id" as "product_team_id"
     When I make a "GET" request with "default" headers to "ProductTeam/${ note(product_team_id) }"
     Then I receive a status code "200" with body
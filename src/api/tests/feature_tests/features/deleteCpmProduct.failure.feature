@@ -27,7 +27,7 @@ Feature: Delete CPM Product - failure scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 101              |
+      | Content-Length | 97               |
 
   Scenario: Unknown Product ID
     Given I have already made a "POST" request with "default" headers to "ProductTeam" with body:
@@ -45,4 +45,4 @@ Feature: Delete CPM Product - failure scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 146              |
+      | Content-Length | 142              |
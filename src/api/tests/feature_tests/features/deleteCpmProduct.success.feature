@@ -27,7 +27,7 @@ Feature: Delete CPM Product - success scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 70               |
+      | Content-Length | 67               |
 
     Examples:
       | product_team_id                      |
@@ -55,7 +55,7 @@ Feature: Delete CPM Product - success scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 106              |
+      | Content-Length | 102              |
 
     Examples:
       | product_team_id                      | product_id            |
@@ -23,7 +23,7 @@ Feature: Delete Product Team - failure scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 101              |
+      | Content-Length | 97               |
 
   Scenario Outline: CPM Product Team has associated products
     Given I have already made a "POST" request with "default" headers to "ProductTeam" with body:
@@ -45,7 +45,7 @@ Feature: Delete Product Team - failure scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 132              |
+      | Content-Length | 128              |
 
     Examples:
       | product_team_id                      |
@@ -68,7 +68,7 @@ Feature: Delete Product Team - failure scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 134              |
+      | Content-Length | 130              |
 
     Examples:
       | product_team_id                      |
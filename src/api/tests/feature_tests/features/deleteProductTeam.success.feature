@@ -23,7 +23,7 @@ Feature: Delete Product Team - success scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 97               |
+      | Content-Length | 94               |
 
     Examples:
       | product_team_id                      |
@@ -111,7 +111,7 @@ Feature: Delete Product Team - success scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 97               |
+      | Content-Length | 94               |
     When I make a "GET" request with "default" headers to "ProductTeam/${ note(product_team_id_2) }"
     Then I receive a status code "404" with body
       | path             | value                                                               |
@@ -143,4 +143,4 @@ Feature: Delete Product Team - success scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 97               |
+      | Content-Length | 94               |
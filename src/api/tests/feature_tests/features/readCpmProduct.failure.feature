@@ -23,7 +23,7 @@ Feature: Read CPM Product - failure scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 106              |
+      | Content-Length | 102              |
 
   Scenario: Can't read a deleted Product
     Given I have already made a "POST" request with "default" headers to "ProductTeam" with body:
@@ -46,4 +46,4 @@ Feature: Read CPM Product - failure scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 106              |
+      | Content-Length | 102              |
@@ -35,7 +35,7 @@ Feature: Read CPM Product - success scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 312              |
+      | Content-Length | 293              |
 
     Examples:
       | product_team_id                      | product_id            |
@@ -68,7 +68,7 @@ Feature: Read CPM Product - success scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 278              |
+      | Content-Length | 259              |
 
     Examples:
       | product_team_id            | product_id            |
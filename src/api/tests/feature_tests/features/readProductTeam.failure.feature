@@ -16,4 +16,4 @@ Feature: Read Product Team - failure scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 134              |
+      | Content-Length | 130              |
@@ -16,7 +16,7 @@ Feature: Search Products - failures scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 183              |
+      | Content-Length | 179              |
 
   Scenario: Unsuccessfully search a Product with unknown query param
     When I make a "GET" request with "default" headers to "Product?product_team_id=123&foo=bar"
@@ -27,7 +27,7 @@ Feature: Search Products - failures scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 113              |
+      | Content-Length | 109              |
 
   Scenario: Unsuccessfully search a Product with too many query param
     When I make a "GET" request with "default" headers to "Product?product_team_id=123&organisation_code=XYZ"
@@ -38,4 +38,4 @@ Feature: Search Products - failures scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 183              |
+      | Content-Length | 179              |
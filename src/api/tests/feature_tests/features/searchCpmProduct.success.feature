@@ -22,7 +22,7 @@ Feature: Search Products - success scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 15               |
+      | Content-Length | 14               |
 
   Scenario Outline: Successfully search one Product with product team id or alias
     Given I have already made a "POST" request with "default" headers to "ProductTeam" with body:
@@ -55,7 +55,7 @@ Feature: Search Products - success scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 507              |
+      | Content-Length | 479              |
 
     Examples:
       | product_team_id                      |
@@ -93,7 +93,7 @@ Feature: Search Products - success scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 507              |
+      | Content-Length | 479              |
 
   Scenario Outline: Successfully search more than one Product with product team id or alias
     Given I have already made a "POST" request with "default" headers to "ProductTeam" with body:
@@ -154,7 +154,7 @@ Feature: Search Products - success scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 1141             |
+      | Content-Length | 1073             |
 
     Examples:
       | product_team_id                      |
@@ -211,7 +211,7 @@ Feature: Search Products - success scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 827              |
+      | Content-Length | 774              |
 
   Scenario: Deleted Products not returned in search
     Given I have already made a "POST" request with "default" headers to "ProductTeam" with body:
@@ -263,4 +263,4 @@ Feature: Search Products - success scenarios
     And the response headers contain:
       | name           | value            |
       | Content-Type   | application/json |
-      | Content-Length | 825              |
+      | Content-Length | 777              |
@@ -21,6 +21,8 @@ def get_endpoint_lambda_mapping() -> ENDPOINT_LAMBDA_MAPPING:
         query_parameters = {'value': something}
     """
 
+    import api.batchReadCpmProduct.index
+    import api.bulkImport.index
     import api.createCpmProduct.index
     import api.createProductTeam.index
     import api.deleteCpmProduct.index
@@ -34,6 +36,8 @@ def get_endpoint_lambda_mapping() -> ENDPOINT_LAMBDA_MAPPING:
         "POST": {
             "ProductTeam": api.createProductTeam.index,
             "ProductTeam/{product_team_id}/Product": api.createCpmProduct.index,
+            "Product/_batch-read": api.batchReadCpmProduct.index,
+            "ProductTeam/_bulk-import": api.bulkImport.index,
         },
         "GET": {
             "ProductTeam/{product_team_id}": api.readProductTeam.index,
@@ -92,6 +92,32 @@ def test_parse_path_delete_product_team():
     ) == ({"product_team_id": "123"}, {}, api.deleteProductTeam.index)
 
 
+def test_parse_path_batch_read_cpm_product():
+    with api_lambda_environment_variables():
+        import api.batchReadCpmProduct.index
+
+        endpoint_lambda_mapping = get_endpoint_lambda_mapping()
+
+    assert parse_api_path(
+        method="POST",
+        path="Product/_batch-read",
+        endpoint_lambda_mapping=endpoint_lambda_mapping,
+    ) == ({}, {}, api.batchReadCpmProduct.index)
+
+
+def test_parse_path_bulk_import():
+    with api_lambda_environment_variables():
+        import api.bulkImport.index
+
+        endpoint_lambda_mapping = get_endpoint_lambda_mapping()
+
+    assert parse_api_path(
+        method="POST",
+        path="ProductTeam/_bulk-import",
+        endpoint_lambda_mapping=endpoint_lambda_mapping,
+    ) == ({}, {}, api.bulkImport.index)
+
+
 def test_parse_path_create_cpm_product():
     with api_lambda_environment_variables():
         import api.createCpmProduct.index
@@ -1,4 +1,5 @@
-from types import ModuleType
+from functools import cache as _cache
+from types import FunctionType, ModuleType
 
 from api_utils.versioning.constants import VersioningStepArgs
 from api_utils.versioning.steps import (
@@ -6,11 +7,35 @@ from api_utils.versioning.steps import (
     get_steps_for_requested_version,
     versioning_steps,
 )
-from domain.logging.step_decorators import logging_step_decorators
+from domain.logging.step_decorators import (
+    logging_step_decorators,
+    profiling_step_decorators,
+    sampled_logging,
+)
 from domain.response.steps import response_steps
+from event.aws.retry import retry_budget
+from event.environment import BaseEnvironment
 from event.step_chain import StepChain
 
+
+class ProfilingEnvironment(BaseEnvironment):
+    STEP_PROFILING: bool = False
+
+
 STEP_DECORATORS = [*logging_step_decorators]
+if ProfilingEnvironment.build().STEP_PROFILING:
+    # Profiling is applied innermost, so that it excludes the cost of logging
+    STEP_DECORATORS += profiling_step_decorators
+
+# Chains are built (and their steps decorated) once, and reused across
+# invocations with StepChain.execute, so that they keep no invocation's data
+VERSION_CHAIN = StepChain(step_chain=versioning_steps, step_decorators=STEP_DECORATORS)
+RESPONSE_CHAIN = StepChain(step_chain=response_steps, step_decorators=STEP_DECORATORS)
+
+
+@_cache
+def _api_chain(steps: tuple[FunctionType]) -> StepChain:
+    return StepChain(step_chain=list(steps), step_decorators=STEP_DECORATORS)
 
 
 def lower_case_keys(_dict: dict[str, str]):
@@ -18,14 +43,21 @@ def lower_case_keys(_dict: dict[str, str]):
 
 
 def execute_step_chain(
+    event: dict, cache: dict, versioned_steps: dict[str, ModuleType], context=None
+):
+    # AWS client retries are bounded by the time remaining in this invocation
+    with retry_budget(context=context), sampled_logging():
+        return _execute_step_chain(
+            event=event, cache=cache, versioned_steps=versioned_steps
+        )
+
+
+def _execute_step_chain(
     event: dict, cache: dict, versioned_steps: dict[str, ModuleType]
 ):
     event["headers"] = lower_case_keys(event.get("headers", {}))
 
-    version_chain = StepChain(
-        step_chain=versioning_steps, step_decorators=STEP_DECORATORS
-    )
-    version_chain.run(
+    version_data, version_result = VERSION_CHAIN.execute(
         init={
             VersioningStepArgs.EVENT: event,
             VersioningStepArgs.VERSIONED_STEPS: versioned_steps,
@@ -33,17 +65,12 @@ def execute_step_chain(
     )
 
     version = None
-    if isinstance(version_chain.result, Exception):
-        result = version_chain.result
+    if isinstance(version_result, Exception):
+        result = version_result
     else:
-        version = version_chain.data[get_largest_possible_version]
-        steps = version_chain.data[get_steps_for_requested_version]
-        api_chain = StepChain(step_chain=steps, step_decorators=STEP_DECORATORS)
-        api_chain.run(cache=cache, init=event)
-        result = api_chain.result
-
-    response_chain = StepChain(
-        step_chain=response_steps, step_decorators=STEP_DECORATORS
-    )
-    response_chain.run(init=(result, version))
-    return response_chain.result
+        version = version_data[get_largest_possible_version]
+        steps = version_data[get_steps_for_requested_version]
+        _, result = _api_chain(tuple(steps)).execute(cache=cache, init=event)
+
+    _, response = RESPONSE_CHAIN.execute(init=(result, version))
+    return response
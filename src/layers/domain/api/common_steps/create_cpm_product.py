@@ -1,18 +1,86 @@
 from http import HTTPStatus
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 from aws_lambda_powertools.utilities.data_classes import APIGatewayProxyEvent
 from domain.api.common_steps.general import parse_event_body
+from domain.api.common_steps.product_team import (
+    product_team_must_be_active,
+    product_team_repository,
+    read_product_team_by_id,
+)
 from domain.core.cpm_product import CpmProduct
+from domain.core.cpm_system_id import (
+    PRODUCT_ID_POOL_FILE,
+    ProductId,
+    product_id_from_index,
+)
+from domain.core.cpm_system_id.pool import IdPool
 from domain.core.product_team import ProductTeam
 from domain.repository.cpm_product_repository import CpmProductRepository
-from domain.repository.product_team_repository import ProductTeamRepository
+from domain.repository.cpm_system_id_repository import (
+    CpmSystemIdRepository,
+    IdPoolReservations,
+)
+from domain.repository.errors import AlreadyExistsError
+from domain.repository.transaction import TransactItem
 from domain.request_models import CreateCpmProductIncomingParams, ProductTeamPathParams
 from domain.response.validation_errors import mark_validation_errors_as_inbound
 from event.step_chain import StepChain
 
 if TYPE_CHECKING:
-    from mypy_boto3_dynamodb.type_defs import TransactWriteItemsOutputTypeDef
+    from mypy_boto3_dynamodb import DynamoDBClient
+
+PRODUCT_ID_RESERVATIONS = "PRODUCT_ID_RESERVATIONS"
+# Each attempt after the first is made with a new product id
+PRODUCT_WRITE_MAX_ATTEMPTS = 3
+
+
+def product_id_reservations(
+    table_name: str, dynamodb_client: "DynamoDBClient"
+) -> IdPoolReservations | None:
+    """Reservations from the pre-generated product id pool, if one was deployed"""
+    if not PRODUCT_ID_POOL_FILE.exists():
+        return None
+    return IdPoolReservations(
+        pool=IdPool(PRODUCT_ID_POOL_FILE),
+        repository=CpmSystemIdRepository(
+            table_name=table_name, model=ProductId, dynamodb_client=dynamodb_client
+        ),
+    )
+
+
+def reserve_product_id(cache: dict) -> str | None:
+    reservations: IdPoolReservations = cache.get(PRODUCT_ID_RESERVATIONS)
+    if reservations is None:
+        return None
+    index = reservations.next_id()
+    return None if index is None else product_id_from_index(index)
+
+
+def write_new_cpm_product(
+    product_repo: CpmProductRepository,
+    product_team: ProductTeam,
+    product: CpmProduct,
+    cache: dict,
+    condition_checks: Iterable[TransactItem] = (),
+) -> CpmProduct:
+    """
+    Write a new product, which claims its id across the whole table. If the
+    id had already been given to another product (e.g. by another lambda
+    container) then the product is recreated with a new id and written again.
+    Returns the product that was written.
+    """
+    for attempt in range(1, PRODUCT_WRITE_MAX_ATTEMPTS + 1):
+        try:
+            product_repo.write(product, condition_checks=condition_checks)
+        except AlreadyExistsError:
+            if attempt == PRODUCT_WRITE_MAX_ATTEMPTS:
+                raise
+            product = product_team.create_cpm_product(
+                name=product.name, product_id=reserve_product_id(cache=cache)
+            )
+        else:
+            return product
 
 
 @mark_validation_errors_as_inbound
@@ -29,11 +97,14 @@ def parse_incoming_cpm_product(data, cache) -> CreateCpmProductIncomingParams:
 
 
 def read_product_team(data, cache) -> ProductTeam:
+    """
+    Only reads from the table on a cache miss, since the product is written
+    on condition that the product team is still active
+    """
     path_params: ProductTeamPathParams = data[parse_path_params]
-    product_team_repo = ProductTeamRepository(
-        table_name=cache["DYNAMODB_TABLE"], dynamodb_client=cache["DYNAMODB_CLIENT"]
+    return read_product_team_by_id(
+        cache=cache, product_team_id=path_params.product_team_id
     )
-    return product_team_repo.read(id=path_params.product_team_id)
 
 
 def create_cpm_product(
@@ -41,23 +112,39 @@ def create_cpm_product(
 ) -> CpmProduct:
     incoming_product: CreateCpmProductIncomingParams = data[parse_incoming_cpm_product]
     product_team: ProductTeam = data[read_product_team]
-    product = product_team.create_cpm_product(name=incoming_product.name)
+    # Without a reserved id, the product allocates its own id
+    product = product_team.create_cpm_product(
+        name=incoming_product.name, product_id=reserve_product_id(cache=cache)
+    )
     return product
 
 
-def write_cpm_product(
-    data: dict[str, CpmProduct], cache
-) -> list["TransactWriteItemsOutputTypeDef"]:
+def write_cpm_product(data: dict[str, CpmProduct], cache) -> CpmProduct:
+    product_team: ProductTeam = data[read_product_team]
     product: CpmProduct = data[create_cpm_product]
     product_repo = CpmProductRepository(
         table_name=cache["DYNAMODB_TABLE"], dynamodb_client=cache["DYNAMODB_CLIENT"]
     )
-    return product_repo.write(product)
+    product_team_repo = product_team_repository(cache=cache)
+    with product_team_must_be_active(
+        cache=cache,
+        product_team_id=product_team.id,
+        aliases=[key.key_value for key in product_team.keys],
+    ):
+        return write_new_cpm_product(
+            product_repo=product_repo,
+            product_team=product_team,
+            product=product,
+            cache=cache,
+            condition_checks=[
+                product_team_repo.active_condition_check(id=product_team.id)
+            ],
+        )
 
 
 def set_http_status(data, cache) -> tuple[HTTPStatus, CpmProduct]:
-    product: CpmProduct = data[create_cpm_product]
-    return HTTPStatus.CREATED, product.state()
+    product: CpmProduct = data[write_cpm_product]
+    return HTTPStatus.CREATED, product
 
 
 before_steps = [
@@ -0,0 +1,49 @@
+from contextlib import contextmanager
+
+from domain.core.product_team import ProductTeam
+from domain.repository.errors import ItemNotActive, ItemNotFound
+from domain.repository.product_team_repository import ProductTeamRepository
+from domain.repository.product_team_repository.cache import ProductTeamCache
+from nhs_context_logging import add_fields
+from nhs_context_logging.logger import logging_context
+
+PRODUCT_TEAM_CACHE = "PRODUCT_TEAM_CACHE"
+
+
+def product_team_repository(cache: dict) -> ProductTeamRepository:
+    """ProductTeamRepository backed by the lambda's ProductTeamCache, if it has one"""
+    return ProductTeamRepository(
+        table_name=cache["DYNAMODB_TABLE"],
+        dynamodb_client=cache["DYNAMODB_CLIENT"],
+        product_team_cache=cache.get(PRODUCT_TEAM_CACHE),
+    )
+
+
+def read_product_team_by_id(cache: dict, product_team_id: str) -> ProductTeam:
+    product_team_repo = product_team_repository(cache=cache)
+    try:
+        return product_team_repo.read(id=product_team_id)
+    finally:
+        _log_product_team_cache_stats(product_team_repo.product_team_cache)
+
+
+@contextmanager
+def product_team_must_be_active(
+    cache: dict, product_team_id: str, aliases: list[str] = ()
+):
+    """
+    For writes made with the product team's active_condition_check, which are
+    cancelled if the product team has been deleted since it was read or cached
+    """
+    try:
+        yield
+    except ItemNotActive:
+        product_team_cache: ProductTeamCache = cache.get(PRODUCT_TEAM_CACHE)
+        if product_team_cache is not None:
+            product_team_cache.invalidate(id=product_team_id, aliases=aliases)
+        raise ItemNotFound(product_team_id, item_type=ProductTeam)
+
+
+def _log_product_team_cache_stats(product_team_cache: ProductTeamCache | None):
+    if product_team_cache is not None and logging_context.current():
+        add_fields(product_team_cache=product_team_cache.stats())
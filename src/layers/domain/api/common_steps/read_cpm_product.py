@@ -3,7 +3,7 @@ from http import HTTPStatus
 from aws_lambda_powertools.utilities.data_classes import APIGatewayProxyEvent
 from domain.core.cpm_product import CpmProduct
 from domain.repository.cpm_product_repository import CpmProductRepository
-from domain.request_models import CpmProductReadPathParams
+from domain.request_models import CpmProductReadPathParams, CpmProductReadQueryParams
 from domain.response.validation_errors import mark_validation_errors_as_inbound
 from event.step_chain import StepChain
 
@@ -14,23 +14,33 @@ def parse_path_params(data, cache) -> CpmProductReadPathParams:
     return CpmProductReadPathParams(**event.path_parameters)
 
 
-def read_product(data, cache) -> CpmProduct:
+@mark_validation_errors_as_inbound
+def parse_query_params(data, cache) -> CpmProductReadQueryParams:
+    event = APIGatewayProxyEvent(data[StepChain.INIT])
+    return CpmProductReadQueryParams(**(event.query_string_parameters or {}))
+
+
+def read_product(data, cache) -> CpmProduct | dict:
     path_params: CpmProductReadPathParams = data[parse_path_params]
+    query_params: CpmProductReadQueryParams = data[parse_query_params]
 
     product_repo = CpmProductRepository(
         table_name=cache["DYNAMODB_TABLE"], dynamodb_client=cache["DYNAMODB_CLIENT"]
     )
-    cpm_product = product_repo.read(id=path_params.product_id)
+    cpm_product = product_repo.read(
+        id=path_params.product_id, fields=query_params.fields
+    )
     return cpm_product
 
 
-def product_to_dict(data, cache) -> tuple[str, dict]:
-    product: CpmProduct = data[read_product]
-    return HTTPStatus.OK, product.state()
+def product_to_dict(data, cache) -> tuple[HTTPStatus, CpmProduct | dict]:
+    product: CpmProduct | dict = data[read_product]
+    return HTTPStatus.OK, product
 
 
 before_steps = [
     parse_path_params,
+    parse_query_params,
     read_product,
 ]
 after_steps = [
@@ -1,9 +1,19 @@
 import json
+from array import array
+from unittest import mock
 
 import pytest
-from domain.api.common_steps.create_cpm_product import before_steps
+from domain.api.common_steps.create_cpm_product import (
+    PRODUCT_ID_RESERVATIONS,
+    after_steps,
+    before_steps,
+    product_id_reservations,
+)
 from domain.core.cpm_product import CpmProduct
+from domain.core.cpm_system_id import product_id_to_index
+from domain.core.cpm_system_id.pool import write_id_pool
 from domain.core.root import Root
+from domain.repository.cpm_product_repository import CpmProductRepository
 from domain.repository.errors import ItemNotFound
 from domain.repository.product_team_repository import ProductTeamRepository
 from domain.response.validation_errors import (
@@ -83,3 +93,80 @@ def test_create_product_steps_good_input():
     assert isinstance(step_chain.result, CpmProduct)
     assert step_chain.result.cpm_product_team_id == product_team.id
     assert step_chain.result.ods_code == ods_code
+
+
+def test_create_product_steps_with_reserved_product_id(tmp_path):
+    org = Root.create_ods_organisation(ods_code=CPM_PRODUCT_TEAM_NO_ID["ods_code"])
+    product_team = org.create_product_team(
+        name=CPM_PRODUCT_TEAM_NO_ID["name"], keys=CPM_PRODUCT_TEAM_NO_ID["keys"]
+    )
+    event = {
+        "body": json.dumps({"name": "foo"}),
+        "pathParameters": {"product_team_id": str(product_team.id)},
+    }
+    pool_file = tmp_path / "product_id_pool.bin"
+    write_id_pool(pool_file, array("I", [product_id_to_index("P.XXX-YYY")]))
+
+    step_chain = StepChain(step_chain=before_steps)
+
+    mocked_cache = {"DYNAMODB_CLIENT": dynamodb_client(), "DYNAMODB_TABLE": TABLE_NAME}
+    with mock_table_cpm(table_name=TABLE_NAME), mock.patch(
+        "domain.api.common_steps.create_cpm_product.PRODUCT_ID_POOL_FILE", pool_file
+    ):
+        mocked_cache[PRODUCT_ID_RESERVATIONS] = product_id_reservations(
+            table_name=TABLE_NAME, dynamodb_client=mocked_cache["DYNAMODB_CLIENT"]
+        )
+        ProductTeamRepository(
+            table_name=TABLE_NAME, dynamodb_client=mocked_cache["DYNAMODB_CLIENT"]
+        ).write(product_team)
+        step_chain.run(init=event, cache=mocked_cache)
+        assert str(step_chain.result.id) == "P.XXX-YYY"
+
+        # Once the pool is exhausted, products allocate their own ids
+        step_chain.run(init=event, cache=mocked_cache)
+        assert str(step_chain.result.id) != "P.XXX-YYY"
+
+
+def test_create_product_steps_retry_with_new_id_if_already_issued(tmp_path):
+    org = Root.create_ods_organisation(ods_code=CPM_PRODUCT_TEAM_NO_ID["ods_code"])
+    product_team = org.create_product_team(
+        name=CPM_PRODUCT_TEAM_NO_ID["name"], keys=CPM_PRODUCT_TEAM_NO_ID["keys"]
+    )
+    event = {
+        "body": json.dumps({"name": "foo"}),
+        "pathParameters": {"product_team_id": str(product_team.id)},
+    }
+    pool_file = tmp_path / "product_id_pool.bin"
+    write_id_pool(
+        pool_file,
+        array(
+            "I", [product_id_to_index("P.XXX-YYY"), product_id_to_index("P.XXX-XXX")]
+        ),
+    )
+
+    step_chain = StepChain(step_chain=[*before_steps, *after_steps])
+
+    mocked_cache = {"DYNAMODB_CLIENT": dynamodb_client(), "DYNAMODB_TABLE": TABLE_NAME}
+    with mock_table_cpm(table_name=TABLE_NAME), mock.patch(
+        "domain.api.common_steps.create_cpm_product.PRODUCT_ID_POOL_FILE", pool_file
+    ):
+        mocked_cache[PRODUCT_ID_RESERVATIONS] = product_id_reservations(
+            table_name=TABLE_NAME, dynamodb_client=mocked_cache["DYNAMODB_CLIENT"]
+        )
+        ProductTeamRepository(
+            table_name=TABLE_NAME, dynamodb_client=mocked_cache["DYNAMODB_CLIENT"]
+        ).write(product_team)
+        product_repo = CpmProductRepository(
+            table_name=TABLE_NAME, dynamodb_client=mocked_cache["DYNAMODB_CLIENT"]
+        )
+        # e.g. issued to another team's product by another container
+        other_product_team = org.create_product_team(name="other-team")
+        product_repo.write(
+            other_product_team.create_cpm_product(name="other", product_id="P.XXX-YYY")
+        )
+
+        step_chain.run(init=event, cache=mocked_cache)
+        _, product = step_chain.result
+        assert str(product.id) == "P.XXX-XXX"
+        assert product_repo.read(id="P.XXX-XXX").name == "foo"
+        assert product_repo.read(id="P.XXX-YYY").name == "other"
@@ -0,0 +1,148 @@
+import fcntl
+import mmap
+import os
+import random
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+from typing import Iterable
+
+# Matches any byte in which at least one id is unallocated
+_NOT_FULL = re.compile(rb"[^\xff]")
+
+
+class IdSpaceExhausted(Exception):
+    pass
+
+
+class IdBitmap:
+    """
+    One bit per id in [0, size), backed by a memory-mapped file if a path is
+    provided (so that allocations persist across invocations of a warm lambda
+    container) or else by anonymous memory. The file is sparse, so only pages
+    containing allocated ids take up memory or disk. Processes that share the
+    file should only modify it whilst holding 'locked()'.
+    """
+
+    def __init__(self, size: int, path: Path = None):
+        self.size = size
+        self.n_bytes = n_bytes = (size + 7) // 8
+        self._fd = None
+        if path is None:
+            self._mmap = mmap.mmap(-1, n_bytes)
+        else:
+            self._fd = fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+            with self.locked():
+                if os.fstat(fd).st_size < n_bytes:
+                    os.ftruncate(fd, n_bytes)
+                self._mmap = mmap.mmap(fd, n_bytes)
+
+        # Bits beyond 'size' in the final byte don't correspond to an id
+        padding = n_bytes * 8 - size
+        if padding:
+            with self.locked():
+                self._mmap[-1] |= (0xFF << (8 - padding)) & 0xFF
+
+    @contextmanager
+    def locked(self):
+        """Exclusive lock on the file, if any, across processes"""
+        if self._fd is None:
+            yield
+            return
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def __contains__(self, index: int) -> bool:
+        byte, bit = divmod(index, 8)
+        return bool(self._mmap[byte] & (1 << bit))
+
+    def add(self, index: int) -> bool:
+        """Set the bit for this index, returning False if it was already set"""
+        if not 0 <= index < self.size:
+            raise IndexError(index)
+        byte, bit = divmod(index, 8)
+        value = self._mmap[byte]
+        if value & (1 << bit):
+            return False
+        self._mmap[byte] = value | (1 << bit)
+        return True
+
+    def add_range(self, start: int, stop: int):
+        """
+        Set the bits for every index in [start, stop), a whole byte at a time
+        other than at the edges of the range
+        """
+        if not 0 <= start <= stop <= self.size:
+            raise IndexError(start, stop)
+        head_stop = min(stop, -(-start // 8) * 8)
+        tail_start = max(head_stop, stop // 8 * 8)
+        for index in (*range(start, head_stop), *range(tail_start, stop)):
+            self.add(index)
+        self._mmap[head_stop // 8 : tail_start // 8] = b"\xff" * (
+            (tail_start - head_stop) // 8
+        )
+
+    def next_clear(self, start: int = 0) -> int | None:
+        """
+        An unset index from the first byte with one, searching from 'start'
+        and wrapping around, or None if every index is set
+        """
+        start_byte = start // 8
+        match = _NOT_FULL.search(self._mmap, start_byte) or _NOT_FULL.search(
+            self._mmap, 0, start_byte + 1
+        )
+        if match is None:
+            return None
+        byte = match.start()
+        value = self._mmap[byte]
+        bit = (~value & (value + 1)).bit_length() - 1  # lowest unset bit
+        return byte * 8 + bit
+
+    def close(self):
+        self._mmap.close()
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class IdAllocator:
+    """
+    Allocates random indices from an IdBitmap of reserved and issued ids.
+    After 'max_attempts' random picks that are all taken, the next free index
+    after the last pick is taken instead, so an allocation never makes more
+    than 'max_attempts' guesses and only fails if every id has been issued.
+    """
+
+    def __init__(
+        self, bitmap: IdBitmap, max_attempts: int = 8, rng: random.Random = None
+    ):
+        self.bitmap = bitmap
+        self.max_attempts = max_attempts
+        self.rng = rng or random.Random()
+        self._lock = Lock()
+
+    def reserve(self, indices: Iterable[int]):
+        with self._lock, self.bitmap.locked():
+            for index in indices:
+                self.bitmap.add(index)
+
+    def reserve_range(self, indices: range):
+        with self._lock, self.bitmap.locked():
+            self.bitmap.add_range(indices.start, indices.stop)
+
+    def allocate(self) -> int:
+        with self._lock, self.bitmap.locked():
+            for _ in range(self.max_attempts):
+                index = self.rng.randrange(self.bitmap.size)
+                if self.bitmap.add(index):
+                    return index
+
+            index = self.bitmap.next_clear(start=index)
+            if index is None:
+                raise IdSpaceExhausted(f"All {self.bitmap.size} ids have been issued")
+            self.bitmap.add(index)
+            return index
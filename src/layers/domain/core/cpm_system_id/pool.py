@@ -0,0 +1,71 @@
+import mmap
+import random
+import sys
+from array import array
+from pathlib import Path
+from typing import Collection
+
+# File format: the magic bytes, followed by the ids as little-endian uint32s
+ID_POOL_MAGIC = b"CPMIDP01"
+ID_POOL_TYPECODE = "I"
+
+
+def generate_id_pool(
+    size: int,
+    id_space: int,
+    reserved: Collection[int] = (),
+    rng: random.Random = None,
+    start: int = 0,
+) -> array:
+    """
+    Draw 'size' distinct, randomly ordered ids from [start, id_space) that are
+    not 'reserved'. The ids are drawn in bulk, in a single call to
+    random.sample, rather than one at a time with a check for collisions.
+    """
+    rng = rng or random.Random()
+    n_candidates = min(size + len(reserved), id_space - start)
+    candidates = rng.sample(range(start, id_space), k=n_candidates)
+    pool = array(ID_POOL_TYPECODE, (id for id in candidates if id not in reserved))
+    if len(pool) < size:
+        raise ValueError(f"Unable to draw {size} unreserved ids from {id_space}")
+    return pool[:size]
+
+
+def write_id_pool(path: Path, ids: array):
+    data = ids
+    if sys.byteorder != "little":
+        data = array(ID_POOL_TYPECODE, ids)
+        data.byteswap()
+    with open(path, "wb") as file:
+        file.write(ID_POOL_MAGIC)
+        data.tofile(file)
+
+
+class IdPool:
+    """
+    Read-only, memory-mapped view of an id pool written by 'write_id_pool', so
+    that loading a pool of millions of ids doesn't read them all into memory
+    """
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[: len(ID_POOL_MAGIC)] != ID_POOL_MAGIC:
+            self._mmap.close()
+            raise ValueError(f"'{path}' is not an id pool")
+        if sys.byteorder != "little":
+            raise NotImplementedError("Id pools can only be read on little-endian")
+        self._ids = memoryview(self._mmap)[len(ID_POOL_MAGIC) :].cast(ID_POOL_TYPECODE)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, position: int) -> int:
+        return self._ids[position]
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def close(self):
+        self._ids.release()
+        self._mmap.close()
@@ -0,0 +1,110 @@
+import fcntl
+import os
+import random
+
+import pytest
+from domain.core.cpm_system_id.bitmap import IdAllocator, IdBitmap, IdSpaceExhausted
+
+
+@pytest.mark.parametrize("size", [1, 8, 13, 1000])
+def test_id_bitmap_add(size):
+    bitmap = IdBitmap(size=size)
+    for index in range(size):
+        assert index not in bitmap
+        assert bitmap.add(index) is True
+        assert index in bitmap
+        assert bitmap.add(index) is False
+
+    with pytest.raises(IndexError):
+        bitmap.add(size)
+
+
+@pytest.mark.parametrize(
+    ["start", "stop"], [(0, 0), (3, 5), (0, 16), (3, 20), (8, 13), (5, 37)]
+)
+def test_id_bitmap_add_range(start, stop):
+    bitmap = IdBitmap(size=37)
+    bitmap.add_range(start, stop)
+    assert [index for index in range(37) if index in bitmap] == list(range(start, stop))
+
+    with pytest.raises(IndexError):
+        bitmap.add_range(start, 38)
+
+
+def test_id_bitmap_next_clear():
+    bitmap = IdBitmap(size=20)
+    for index in range(20):
+        if index != 3:
+            bitmap.add(index)
+
+    # The only free index is found, wrapping around from the end
+    assert bitmap.next_clear(start=0) == 3
+    assert bitmap.next_clear(start=17) == 3
+
+    # Padding bits beyond the size are never returned
+    bitmap.add(3)
+    assert bitmap.next_clear(start=0) is None
+
+
+def test_id_bitmap_persists_to_file(tmp_path):
+    path = tmp_path / "bitmap"
+    bitmap = IdBitmap(size=1000, path=path)
+    bitmap.add(123)
+    bitmap.close()
+
+    bitmap = IdBitmap(size=1000, path=path)
+    assert 123 in bitmap
+    assert 124 not in bitmap
+
+
+def test_id_bitmap_shared_file_is_locked(tmp_path):
+    path = tmp_path / "bitmap"
+    bitmap = IdBitmap(size=1000, path=path)
+    other_bitmap = IdBitmap(size=1000, path=path)
+
+    with bitmap.locked():
+        fd = os.open(path, os.O_RDWR)
+        try:
+            with pytest.raises(BlockingIOError):
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        finally:
+            os.close(fd)
+
+    # Allocations by either are visible to the other
+    IdAllocator(bitmap=bitmap).reserve([1])
+    IdAllocator(bitmap=other_bitmap).reserve([2])
+    assert 2 in bitmap
+    assert 1 in other_bitmap
+    bitmap.close()
+    other_bitmap.close()
+
+
+def test_id_allocator_never_collides():
+    size = 1000
+    allocator = IdAllocator(bitmap=IdBitmap(size=size), rng=random.Random(1))
+    allocator.reserve(range(0, size, 2))
+
+    allocated = [allocator.allocate() for _ in range(size // 2)]
+    assert sorted(allocated) == list(range(1, size, 2))
+
+    with pytest.raises(IdSpaceExhausted):
+        allocator.allocate()
+
+
+def test_id_allocator_attempts_are_bounded():
+    class _Random(random.Random):
+        def __init__(self):
+            super().__init__()
+            self.n_calls = 0
+
+        def randrange(self, *args):
+            self.n_calls += 1
+            return 0
+
+    rng = _Random()
+    allocator = IdAllocator(bitmap=IdBitmap(size=100), max_attempts=3, rng=rng)
+    allocator.reserve([0, 1])
+
+    # Every random pick collides, so the next free id after the last pick is taken
+    assert allocator.allocate() == 2
+    assert rng.n_calls == 3
@@ -1,8 +1,19 @@
 import os
 from pathlib import Path
+from unittest import mock
 
 import pytest
-from domain.core.cpm_system_id import PRODUCT_TEAM_ID_PATTERN, ProductId, ProductTeamId
+from domain.core.cpm_system_id import (
+    PRODUCT_ID_BITMAP_FILE,
+    PRODUCT_ID_POOL_RANGE,
+    PRODUCT_ID_SPACE,
+    PRODUCT_TEAM_ID_PATTERN,
+    ProductId,
+    ProductTeamId,
+    product_id_from_index,
+    product_id_to_index,
+)
+from domain.core.cpm_system_id.v1 import _product_id_allocator
 from event.json import json_load
 
 PATH_TO_CPM_SYSTEM_IDS = Path(__file__).parent.parent
@@ -10,6 +21,16 @@ PRODUCT_IDS_GENERATED_FILE = f"{PATH_TO_CPM_SYSTEM_IDS}/generated_ids/product_id
 generated_product_ids = set()
 
 
+@pytest.fixture(autouse=True)
+def product_id_bitmap_file(tmp_path):
+    """Each test issues ids from a fresh allocator, recorded in its own file"""
+    path = tmp_path / "product_id_bitmap"
+    _product_id_allocator.cache_clear()
+    with mock.patch.dict(os.environ, {PRODUCT_ID_BITMAP_FILE: str(path)}):
+        yield path
+    _product_id_allocator.cache_clear()
+
+
 @pytest.fixture(scope="module")
 def _get_generated_ids():
     global generated_product_ids
@@ -64,3 +85,55 @@ def test_product_id_generator_validate_key_valid(valid_key):
 def test_product_id_generator_validate_key_invalid_format(invalid_key):
     is_valid = ProductId.validate_cpm_system_id(cpm_system_id=invalid_key)
     assert not is_valid
+
+
+@pytest.mark.parametrize(
+    ["product_id", "index"],
+    [
+        ["P.AAA-AAA", 0],
+        ["P.AAA-AAC", 1],
+        ["P.AAA-AC9", 49],
+        ["P.999-999", PRODUCT_ID_SPACE - 1],
+    ],
+)
+def test_product_id_index(product_id, index):
+    assert product_id_to_index(product_id) == index
+    assert product_id_from_index(index) == product_id
+    assert ProductId.validate_cpm_system_id(product_id_from_index(index))
+
+
+def test_product_id_create_skips_reserved_ids(_get_generated_ids):
+    reserved_indices = set(map(product_id_to_index, generated_product_ids))
+    allocator = _product_id_allocator()
+    assert reserved_indices
+    assert all(index in allocator.bitmap for index in reserved_indices)
+
+
+def test_product_id_create_skips_pool_range():
+    allocator = _product_id_allocator()
+    assert PRODUCT_ID_POOL_RANGE.start - 1 not in allocator.bitmap
+    assert PRODUCT_ID_POOL_RANGE.start in allocator.bitmap
+    assert PRODUCT_ID_POOL_RANGE.stop - 1 in allocator.bitmap
+    assert product_id_from_index(PRODUCT_ID_POOL_RANGE.start) == "P.9AA-AAA"
+
+    for _ in range(100):
+        index = product_id_to_index(ProductId.create().id)
+        assert index not in PRODUCT_ID_POOL_RANGE
+
+
+def test_product_id_create_records_issued_ids(product_id_bitmap_file: Path):
+    product_id = ProductId.create()
+
+    # Another process sharing the file sees the issued id
+    _product_id_allocator.cache_clear()
+    allocator = _product_id_allocator()
+    assert product_id_bitmap_file.exists()
+    assert product_id_to_index(product_id.id) in allocator.bitmap
+
+
+def test_product_id_create_without_bitmap_file():
+    with mock.patch.dict(os.environ, clear=True):
+        _product_id_allocator.cache_clear()
+        product_id = ProductId.create()
+        assert _product_id_allocator().bitmap._fd is None
+    assert ProductId.validate_cpm_system_id(product_id.id)
@@ -0,0 +1,52 @@
+import random
+
+import pytest
+from domain.core.cpm_system_id.pool import (
+    ID_POOL_MAGIC,
+    IdPool,
+    generate_id_pool,
+    write_id_pool,
+)
+
+
+def test_generate_id_pool():
+    reserved = set(range(0, 1000, 3))
+    pool = generate_id_pool(
+        size=500, id_space=1000, reserved=reserved, rng=random.Random(1)
+    )
+    assert len(pool) == 500
+    assert len(set(pool)) == 500
+    assert not reserved.intersection(pool)
+    assert all(0 <= id < 1000 for id in pool)
+
+
+def test_generate_id_pool_from_start():
+    pool = generate_id_pool(size=500, id_space=1000, start=400, reserved={400, 401})
+    assert len(set(pool)) == 500
+    assert all(402 <= id < 1000 for id in pool)
+
+
+def test_generate_id_pool_too_large():
+    with pytest.raises(ValueError):
+        generate_id_pool(size=10, id_space=20, reserved=set(range(15)))
+
+
+def test_id_pool_round_trip(tmp_path):
+    path = tmp_path / "pool.bin"
+    ids = generate_id_pool(size=1000, id_space=25**6)
+    write_id_pool(path, ids)
+    assert path.stat().st_size == len(ID_POOL_MAGIC) + 4 * len(ids)
+
+    pool = IdPool(path)
+    assert len(pool) == len(ids)
+    assert pool[0] == ids[0]
+    assert pool[-1] == ids[-1]
+    assert list(pool) == list(ids)
+    pool.close()
+
+
+def test_id_pool_not_a_pool(tmp_path):
+    path = tmp_path / "pool.bin"
+    path.write_bytes(b"[1, 2, 3]")
+    with pytest.raises(ValueError):
+        IdPool(path)
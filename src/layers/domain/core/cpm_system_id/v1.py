@@ -1,8 +1,6 @@
 import os
-import random
 import re
 from abc import ABC, abstractmethod
-from datetime import datetime
 from functools import cache
 from pathlib import Path
 from typing import Optional
@@ -12,6 +10,8 @@ from domain.core.base import BaseModel
 from event.json import json_load
 from pydantic import validator
 
+from .bitmap import IdAllocator, IdBitmap
+
 PRODUCT_ID_PART_LENGTH = 3
 PRODUCT_ID_NUMBER_OF_PARTS: int = 2
 PRODUCT_ID_VALID_CHARS = "ACDEFGHJKLMNPRTUVWXY34679"  # pragma: allowlist secret
@@ -19,8 +19,24 @@ PRODUCT_ID_PATTERN = re.compile(
     rf"^P\.[{PRODUCT_ID_VALID_CHARS}]{{{PRODUCT_ID_PART_LENGTH}}}-[{PRODUCT_ID_VALID_CHARS}]{{{PRODUCT_ID_PART_LENGTH}}}$"
 )
 
+PRODUCT_ID_LENGTH = PRODUCT_ID_PART_LENGTH * PRODUCT_ID_NUMBER_OF_PARTS
+PRODUCT_ID_SPACE = len(PRODUCT_ID_VALID_CHARS) ** PRODUCT_ID_LENGTH
+_PRODUCT_ID_CHAR_VALUES = {char: i for i, char in enumerate(PRODUCT_ID_VALID_CHARS)}
+
 PATH_TO_CPM_SYSTEM_IDS = Path(__file__).parent
 PRODUCT_IDS_GENERATED_FILE = f"{PATH_TO_CPM_SYSTEM_IDS}/generated_ids/product_ids.json"
+PRODUCT_ID_POOL_FILE = PATH_TO_CPM_SYSTEM_IDS / "generated_ids" / "product_id_pool.bin"
+# The id pool is only drawn from the ids beginning with the last valid char
+# (i.e. 'P.9'), so that the whole pool can be reserved as one contiguous range
+# rather than id by id
+PRODUCT_ID_POOL_RANGE = range(
+    PRODUCT_ID_SPACE - PRODUCT_ID_SPACE // len(PRODUCT_ID_VALID_CHARS),
+    PRODUCT_ID_SPACE,
+)
+# Path of the file in which to record the ids issued by this container (e.g. in
+# /tmp, so that they persist across invocations of a warm lambda container).
+# If unset, the ids are only recorded in memory for the life of the process.
+PRODUCT_ID_BITMAP_FILE = "PRODUCT_ID_BITMAP_FILE"
 PRODUCT_TEAM_ID_PATTERN = re.compile(
     r"^([a-fA-F0-9]{8}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{12})$"
 )
@@ -34,6 +50,38 @@ def _load_existing_ids():
     return set()
 
 
+def product_id_to_index(product_id: str) -> int:
+    """The position of 'P.XXX-XXX' in the product id space, read as base-25"""
+    index = 0
+    for char in product_id[2:].replace("-", ""):
+        index = index * len(PRODUCT_ID_VALID_CHARS) + _PRODUCT_ID_CHAR_VALUES[char]
+    return index
+
+
+def product_id_from_index(index: int) -> str:
+    chars = []
+    for _ in range(PRODUCT_ID_LENGTH):
+        index, value = divmod(index, len(PRODUCT_ID_VALID_CHARS))
+        chars.append(PRODUCT_ID_VALID_CHARS[value])
+    chars.reverse()
+    parts = (
+        "".join(chars[i : i + PRODUCT_ID_PART_LENGTH])
+        for i in range(0, PRODUCT_ID_LENGTH, PRODUCT_ID_PART_LENGTH)
+    )
+    return f"P.{'-'.join(parts)}"
+
+
+@cache
+def _product_id_allocator() -> IdAllocator:
+    path = os.environ.get(PRODUCT_ID_BITMAP_FILE) or None
+    bitmap = IdBitmap(size=PRODUCT_ID_SPACE, path=path and Path(path))
+    allocator = IdAllocator(bitmap=bitmap)
+    allocator.reserve(map(product_id_to_index, _load_existing_ids()))
+    # Never issue an id that the pool may hand out
+    allocator.reserve_range(PRODUCT_ID_POOL_RANGE)
+    return allocator
+
+
 class CpmSystemId(BaseModel, ABC):
     __root__: Optional[str]
 
@@ -67,15 +115,14 @@ class CpmSystemId(BaseModel, ABC):
 class ProductId(CpmSystemId):
     @classmethod
     def create(cls):
-        """No current_id needed, key is generated randomly."""
-        rng = random.Random(datetime.now().timestamp())
-        product_id = "-".join(
-            "".join(rng.choices(PRODUCT_ID_VALID_CHARS, k=PRODUCT_ID_PART_LENGTH))
-            for _ in range(PRODUCT_ID_NUMBER_OF_PARTS)
-        )
-        if f"P.{product_id}" in cls.load_existing_ids():
-            return cls.create()
-        return cls(__root__=f"P.{product_id}")
+        """
+        No current_id needed, key is allocated randomly from the ids that
+        are neither reserved (in PRODUCT_IDS_GENERATED_FILE or the id pool) nor
+        already issued by this container. Uniqueness across the table is
+        guaranteed by CpmProductRepository claiming the id when it is written.
+        """
+        index = _product_id_allocator().allocate()
+        return cls(__root__=product_id_from_index(index))
 
     @classmethod
     def validate_cpm_system_id(cls, cpm_system_id: str) -> bool:
@@ -18,3 +18,4 @@ class EntityType(StrEnum):
     PRODUCT_TEAM = auto()
     PRODUCT_TEAM_ALIAS = auto()
     PRODUCT = auto()
+    PRODUCT_ID = auto()  # claims a product id across the whole table
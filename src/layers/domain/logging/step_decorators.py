@@ -1,15 +1,125 @@
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
 from types import FunctionType
 
+from domain.logging.summary import summarise_result
 from domain.response.response_matrix import EXPECTED_EXCEPTIONS
+from event.aws.metrics import (
+    collect_step_metrics,
+    emit_metrics_record,
+    step_metrics_record,
+)
+from event.environment import BaseEnvironment
+from nhs_context_logging import add_fields
 from nhs_context_logging import log_action as _log_action
+from nhs_context_logging.logger import get_method_name
+
+
+class LoggingEnvironment(BaseEnvironment):
+    LOG_SUCCESS_SAMPLE_RATE: float = 1.0
+    LOG_RESULT_MAX_ITEMS: int = 10
+    LOG_RESULT_MAX_CHARS: int = 1000
+
+
+LOGGING_ENVIRONMENT = LoggingEnvironment.build()
+
+_log_successes: ContextVar[bool] = ContextVar("log_successes", default=True)
+
+
+@contextmanager
+def sampled_logging(sample_rate: float = None):
+    """
+    Head-based sampling: decide once, for the whole 'with' block (i.e. request),
+    whether successful steps are logged. Failed steps are always logged.
+    """
+    if sample_rate is None:
+        sample_rate = LOGGING_ENVIRONMENT.LOG_SUCCESS_SAMPLE_RATE
+    token = _log_successes.set(random.random() < sample_rate)
+    try:
+        yield
+    finally:
+        _log_successes.reset(token)
+
+
+def skip_result_logging(step: FunctionType) -> FunctionType:
+    """Never log the result of this step, e.g. since it is large or uninformative"""
+    step.skip_result_logging = True
+    return step
+
+
+def _log_result(function):
+    if getattr(function, "skip_result_logging", False):
+        return function
+
+    @wraps(function)
+    def _step(data, cache):
+        result = function(data=data, cache=cache)
+        add_fields(
+            action_result=summarise_result(
+                result,
+                max_items=LOGGING_ENVIRONMENT.LOG_RESULT_MAX_ITEMS,
+                max_chars=LOGGING_ENVIRONMENT.LOG_RESULT_MAX_CHARS,
+            )
+        )
+        return result
+
+    return _step
 
 
 def log_action(function):
-    return _log_action(
-        log_args=[], expected_errors=EXPECTED_EXCEPTIONS, log_result=True
-    )(function)
+    logged_step = _log_action(
+        log_args=[], expected_errors=EXPECTED_EXCEPTIONS, log_result=False
+    )(_log_result(function))
+
+    @wraps(function)
+    def _step(data, cache):
+        if _log_successes.get():
+            return logged_step(data=data, cache=cache)
+
+        # Not sampled, so only log the step if it fails
+        start = time.time()
+        try:
+            return function(data=data, cache=cache)
+        except Exception:
+            with _log_action(
+                action=get_method_name(function, data=data, cache=cache),
+                expected_errors=EXPECTED_EXCEPTIONS,
+                action_duration=float(f"{time.time() - start:0.7f}"),
+            ):
+                raise
+
+    return _step
+
+
+def profile_step(function):
+    """
+    Emit the wall time, DynamoDB calls, consumed capacity and bytes serialised
+    of each run of the step as an EMF record, whether or not the step raises
+    """
+
+    @wraps(function)
+    def _profiled_step(data, cache):
+        with collect_step_metrics() as metrics:
+            start = time.perf_counter()
+            try:
+                return function(data=data, cache=cache)
+            finally:
+                duration_ms = (time.perf_counter() - start) * 1000
+                record = step_metrics_record(
+                    step=function.__name__, duration_ms=duration_ms, metrics=metrics
+                )
+                emit_metrics_record(record)
+
+    return _profiled_step
 
 
 logging_step_decorators: list[FunctionType] = [
     log_action,
 ]
+
+profiling_step_decorators: list[FunctionType] = [
+    profile_step,
+]
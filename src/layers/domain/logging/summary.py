@@ -0,0 +1,59 @@
+from collections.abc import Mapping
+from enum import Enum
+from itertools import islice
+
+from pydantic import BaseModel
+
+TRUNCATED = "..."
+
+
+def _truncate(value: str, max_chars: int) -> str:
+    if len(value) <= max_chars:
+        return value
+    return f"{value[:max_chars]}{TRUNCATED} ({len(value)} chars)"
+
+
+def summarise_result(result, max_items: int, max_chars: int, depth: int = 2):
+    """
+    Bound the size of a step result before it is logged: collections are cut
+    to their first 'max_items' (with a count of what was dropped), strings to
+    'max_chars', and anything nested deeper than 'depth' is replaced by its
+    type name. The cost of summarising is therefore independent of the size
+    of the result.
+    """
+    if result is None or isinstance(result, (bool, int, float, Enum, Exception)):
+        return result
+    if isinstance(result, str):
+        return _truncate(result, max_chars=max_chars)
+    if isinstance(result, bytes):
+        return f"<bytes ({len(result)} bytes)>"
+    if depth == 0:
+        return f"<{type(result).__name__}>"
+
+    def _summarise(value):
+        return summarise_result(
+            value, max_items=max_items, max_chars=max_chars, depth=depth - 1
+        )
+
+    if isinstance(result, BaseModel):
+        fields = list(result.__fields__)
+        summary = {
+            field: _summarise(getattr(result, field)) for field in fields[:max_items]
+        }
+        if len(fields) > max_items:
+            summary[TRUNCATED] = f"{len(fields) - max_items} more fields"
+        return {type(result).__name__: summary}
+    if isinstance(result, Mapping):
+        summary = {}
+        for key, value in result.items():
+            if len(summary) == max_items:
+                summary[TRUNCATED] = f"{len(result) - max_items} more items"
+                break
+            summary[str(key)] = _summarise(value)
+        return summary
+    if isinstance(result, (list, tuple, set, frozenset)):
+        summary = [_summarise(item) for item in islice(result, max_items)]
+        if len(result) > max_items:
+            summary.append(f"{TRUNCATED} {len(result) - max_items} more items")
+        return summary
+    return _truncate(repr(result), max_chars=max_chars)
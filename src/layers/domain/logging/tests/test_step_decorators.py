@@ -1,6 +1,14 @@
 from unittest import mock
 
-from domain.logging.step_decorators import logging_step_decorators
+import orjson
+import pytest
+from domain.logging.step_decorators import (
+    logging_step_decorators,
+    profiling_step_decorators,
+    sampled_logging,
+    skip_result_logging,
+)
+from event.aws.metrics import record_bytes_serialised, record_client_call
 from event.logging.models import LogTemplate
 from event.step_chain import StepChain
 from nhs_context_logging.fixtures import (  # noqa: F401
@@ -117,3 +125,101 @@ def test_logging_step_decorators_with_non_fatal_error(log_capture):
         == "src.layers.domain.logging.tests.test_step_decorators.a_function"
     )
     assert parsed_log.action_status == "error"
+
+
+@pytest.mark.parametrize("raises", [False, True])
+def test_profiling_step_decorators(capsys, raises):
+    def a_function(data, cache):
+        record_client_call(
+            operation="query",
+            n_attempts=1,
+            response={"ConsumedCapacity": {"CapacityUnits": 0.5}},
+        )
+        record_bytes_serialised(n_bytes=42)
+        if raises:
+            raise ValueError("oops!")
+        return "return value!"
+
+    def another_function(data, cache):
+        return data[a_function]
+
+    step_chain = StepChain(
+        step_chain=[a_function, another_function],
+        step_decorators=profiling_step_decorators,
+    )
+    step_chain.run(init="init data!", cache={})
+    assert isinstance(step_chain.result, ValueError) is raises
+
+    records = list(map(orjson.loads, capsys.readouterr().out.splitlines()))
+    steps = [record["step"] for record in records]
+    assert steps == ["a_function"] if raises else ["a_function", "another_function"]
+
+    (record, *_) = records
+    assert record["Duration"] >= 0
+    assert record["DynamoDbCalls"] == 1
+    assert record["ConsumedCapacity"] == 0.5
+    assert record["BytesSerialised"] == 42
+
+
+def test_logging_step_decorators_summarise_large_results(log_capture):
+    def a_function(data, cache):
+        return list(range(1000))
+
+    step_chain = StepChain(
+        step_chain=[a_function], step_decorators=logging_step_decorators
+    )
+    step_chain.run(init="init data!", cache={})
+    assert step_chain.result == list(range(1000))
+
+    std_out, _ = log_capture
+    (log,) = std_out
+    assert log["action_result"] == [*range(10), "... 990 more items"]
+
+
+def test_logging_step_decorators_skip_result_logging(log_capture):
+    @skip_result_logging
+    def a_function(data, cache):
+        return "return value!"
+
+    step_chain = StepChain(
+        step_chain=[a_function], step_decorators=logging_step_decorators
+    )
+    step_chain.run(init="init data!", cache={})
+    assert step_chain.result == "return value!"
+
+    std_out, _ = log_capture
+    (log,) = std_out
+    assert "action_result" not in log
+    assert log["action_status"] == "succeeded"
+
+
+@pytest.mark.parametrize("sampled", [False, True])
+def test_logging_step_decorators_sampling(log_capture, sampled):
+    class MyException(Exception):
+        pass
+
+    def a_function(data, cache):
+        return "return value!"
+
+    def another_function(data, cache):
+        raise MyException("oops!")
+
+    step_chain = StepChain(
+        step_chain=[a_function, another_function],
+        step_decorators=logging_step_decorators,
+    )
+    with sampled_logging(sample_rate=1 if sampled else 0):
+        step_chain.run(init="init data!", cache={})
+    assert isinstance(step_chain.result, MyException)
+
+    # Successes are only logged if sampled, but failures are always logged
+    std_out, std_err = log_capture
+    assert [log["action"].split(".")[-1] for log in std_out] == (
+        ["a_function"] if sampled else []
+    )
+    (log,) = std_err
+    parsed_log = LogTemplate(**log)
+    assert parsed_log.action == (
+        "src.layers.domain.logging.tests.test_step_decorators.another_function"
+    )
+    assert parsed_log.action_status == "failed"
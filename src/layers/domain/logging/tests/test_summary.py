@@ -0,0 +1,53 @@
+from http import HTTPStatus
+
+import pytest
+from domain.logging.summary import summarise_result
+from pydantic import BaseModel
+
+
+class _Model(BaseModel):
+    name: str
+    items: list[int]
+
+
+@pytest.mark.parametrize(
+    ["result", "expected"],
+    [
+        [None, None],
+        [True, True],
+        [123, 123],
+        [HTTPStatus.OK, HTTPStatus.OK],
+        ["short", "short"],
+        ["x" * 12, "xxxxx... (12 chars)"],
+        [b"bytes", "<bytes (5 bytes)>"],
+        [[1, 2, 3], [1, 2, 3]],
+        [(1, 2, 3, 4, 5), [1, 2, 3, "... 2 more items"]],
+        [{1, 2, 3, 4}, [1, 2, 3, "... 1 more items"]],
+        [
+            {"a": 1, "b": 2, "c": 3, "d": 4},
+            {"a": 1, "b": 2, "c": 3, "...": "1 more items"},
+        ],
+        [[[[1]]], [["<list>"]]],
+        [
+            _Model(name="x" * 10, items=list(range(10))),
+            {
+                "_Model": {
+                    "name": "xxxxx... (10 chars)",
+                    "items": [0, 1, 2, "... 7 more items"],
+                }
+            },
+        ],
+    ],
+)
+def test_summarise_result(result, expected):
+    assert summarise_result(result, max_items=3, max_chars=5) == expected
+
+
+def test_summarise_result_is_bounded():
+    result = [{"id": str(i), "keys": list(range(1000))} for i in range(100_000)]
+    summary = summarise_result(result, max_items=2, max_chars=100)
+    assert summary == [
+        {"id": "0", "keys": "<list>"},
+        {"id": "1", "keys": "<list>"},
+        "... 99998 more items",
+    ]
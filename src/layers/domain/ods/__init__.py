@@ -1,17 +1,28 @@
 import re
+import threading
 import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from http import HTTPStatus
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
-import requests
-from requests.exceptions import RequestException
+if TYPE_CHECKING:
+    import requests
+
+# NB: 'requests' is slow to import and is only needed when an ODS code is
+# resolved, so it is imported on first use rather than at cold start
 
 ODS_API_BASE = "https://directory.spineservices.nhs.uk/ORD/2-0-0/organisations"
 ODS_API_ENDPOINT = f"{ODS_API_BASE}/" "{ods_code}"
+ODS_API_TIMEOUT_SECONDS = 10
 BACKOFF_BASE_SECONDS = 2
 WHITESPACE = re.compile(r"^(\s+)$")
 
+VALID_ODS_CODE_TTL_SECONDS = 24 * 60 * 60
+INVALID_ODS_CODE_TTL_SECONDS = 5 * 60
+MAX_CONCURRENT_ODS_REQUESTS = 10
+
 
 class InvalidOdsCodeError(Exception):
     def __init__(self, ods_code):
@@ -38,8 +49,8 @@ class OdsApiOfflineError(ExceptionGroup):
         return self
 
 
-def _construct_ods_url(ods_code: str) -> str:
-    return ODS_API_ENDPOINT.format(ods_code=ods_code)
+def _construct_ods_url(ods_code: str, endpoint: str = None) -> str:
+    return (endpoint or ODS_API_ENDPOINT).format(ods_code=ods_code)
 
 
 def _is_whitespace(item: str) -> bool:
@@ -47,18 +58,23 @@ def _is_whitespace(item: str) -> bool:
 
 
 def retry[RT, **P](max_attempts: int) -> Callable[[Callable[P, RT]], Callable[P, RT]]:
-    """Retrying on RequestException, with exponential back-off of 2*n seconds"""
+    """
+    Retrying on RequestException, with exponential back-off of 2**n seconds
+    between failed attempts
+    """
 
     def decorator(fn: Callable[P, RT]) -> Callable[P, RT]:
         @wraps(fn)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> Callable[P, RT]:
+            from requests.exceptions import RequestException
+
             exceptions = []
             for n in range(max_attempts):
                 try:
                     return fn(*args, **kwargs)
                 except RequestException as exc:
                     exceptions.append(exc)
-                finally:
+                if n < max_attempts - 1:
                     time.sleep(BACKOFF_BASE_SECONDS**n)
             raise OdsApiOfflineError(n, fn.__name__, exceptions)
 
@@ -68,12 +84,18 @@ def retry[RT, **P](max_attempts: int) -> Callable[[Callable[P, RT]], Callable[P,
 
 
 @retry(max_attempts=3)
-def is_valid_ods_code(ods_code: str) -> bool:
+def is_valid_ods_code(
+    ods_code: str, session: "requests.Session" = None, endpoint: str = None
+) -> bool:
+    """Uncached lookup of a single ODS code, see OdsResolver for the cached version"""
     if _is_whitespace(ods_code):
         return False
 
-    url = _construct_ods_url(ods_code=ods_code)
-    response = requests.get(url=url)
+    if session is None:
+        import requests as session
+
+    url = _construct_ods_url(ods_code=ods_code, endpoint=endpoint)
+    response = session.get(url=url, timeout=ODS_API_TIMEOUT_SECONDS)
     status_code = HTTPStatus(response.status_code)
 
     if status_code == HTTPStatus.OK:
@@ -89,6 +111,108 @@ def is_valid_ods_code(ods_code: str) -> bool:
     )
 
 
+class OdsResolver:
+    """
+    Resolves ODS codes against the ODS API over a persistent HTTP session,
+    caching valid codes for 'ttl' seconds and invalid codes for 'negative_ttl'
+    seconds. Failures (e.g. the ODS API being unavailable) are never cached.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = None,
+        ttl: float = VALID_ODS_CODE_TTL_SECONDS,
+        negative_ttl: float = INVALID_ODS_CODE_TTL_SECONDS,
+        max_workers: int = MAX_CONCURRENT_ODS_REQUESTS,
+    ):
+        self.endpoint = endpoint
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_workers = max_workers
+
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._cache: dict[str, tuple[float, bool]] = {}
+        self._lock = threading.Lock()
+
+    def _get_cached(self, ods_code: str) -> bool | None:
+        with self._lock:
+            expires_at, is_valid = self._cache.get(ods_code, (0, None))
+            if expires_at > time.monotonic():
+                return is_valid
+            self._cache.pop(ods_code, None)
+            return None
+
+    def _set_cached(self, ods_code: str, is_valid: bool):
+        ttl = self.ttl if is_valid else self.negative_ttl
+        with self._lock:
+            self._cache[ods_code] = (time.monotonic() + ttl, is_valid)
+
+    def is_valid_ods_code(self, ods_code: str) -> bool:
+        is_valid = self._get_cached(ods_code)
+        if is_valid is None:
+            is_valid = is_valid_ods_code(
+                ods_code=ods_code, session=self.session, endpoint=self.endpoint
+            )
+            self._set_cached(ods_code, is_valid)
+        return is_valid
+
+    def are_valid_ods_codes(self, ods_codes: Iterable[str]) -> dict[str, bool]:
+        """
+        Resolve each distinct ODS code, with uncached codes requested
+        concurrently. Raises OdsApiOfflineError if any code could not be resolved.
+        """
+        unique_ods_codes = list(dict.fromkeys(ods_codes))
+        results = {
+            ods_code: self._get_cached(ods_code) for ods_code in unique_ods_codes
+        }
+        unresolved = [
+            ods_code for ods_code, result in results.items() if result is None
+        ]
+
+        if len(unresolved) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(unresolved))
+            ) as executor:
+                resolved = executor.map(self.is_valid_ods_code, unresolved)
+                results.update(zip(unresolved, resolved))
+        elif unresolved:
+            (ods_code,) = unresolved
+            results[ods_code] = self.is_valid_ods_code(ods_code)
+        return results
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+
+_ods_resolver: OdsResolver = None
+
+
+def get_ods_resolver() -> OdsResolver:
+    """A module-level resolver, so that warm lambda containers share its cache"""
+    global _ods_resolver
+    if _ods_resolver is None:
+        _ods_resolver = OdsResolver()
+    return _ods_resolver
+
+
 def validate_ods_code(ods_code: str):
-    if not is_valid_ods_code(ods_code=ods_code):
+    if not get_ods_resolver().is_valid_ods_code(ods_code=ods_code):
         raise InvalidOdsCodeError(ods_code=ods_code)
+
+
+def are_valid_ods_codes(ods_codes: Iterable[str]) -> dict[str, bool]:
+    return get_ods_resolver().are_valid_ods_codes(ods_codes=ods_codes)
+
+
+def validate_ods_codes(ods_codes: Iterable[str]):
+    """Raises InvalidOdsCodeError for the first invalid ODS code"""
+    for ods_code, is_valid in are_valid_ods_codes(ods_codes=ods_codes).items():
+        if not is_valid:
+            raise InvalidOdsCodeError(ods_code=ods_code)
@@ -60,15 +60,15 @@ def test_is_valid_ods_code_raises_on_connection_error():
     "status_code",
     range(HTTPStatus.INTERNAL_SERVER_ERROR, HTTPStatus.GATEWAY_TIMEOUT + 1),
 )
-@mock.patch("domain.ods.requests")
+@mock.patch("requests.get")
 @mock.patch("domain.ods.BACKOFF_BASE_SECONDS", 0.1)  # to speed the test up
 def test_is_valid_ods_code_raises_on_ods_internal_server_error(
-    mocked_requests, status_code: HTTPStatus
+    mocked_get, status_code: HTTPStatus
 ):
     mocked_response = mock.Mock()
     mocked_response.status_code = status_code
     mocked_response.raise_for_status = lambda: _raise(status_code)
-    mocked_requests.get.return_value = mocked_response
+    mocked_get.return_value = mocked_response
 
     with pytest.raises(OdsApiOfflineError) as exception_wrapper:
         is_valid_ods_code(ods_code="any_old_thing")
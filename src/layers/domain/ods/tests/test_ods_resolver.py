@@ -0,0 +1,131 @@
+import os
+import subprocess
+import sys
+import time
+from unittest import mock
+
+import pytest
+from domain.ods import InvalidOdsCodeError, OdsApiOfflineError, OdsResolver
+
+from test_helpers.ods import stub_ods_server
+
+VALID_ODS_CODES = ["AAA", "BBB", "CCC"]
+
+
+def test_ods_resolver_caches_valid_and_invalid_ods_codes():
+    with stub_ods_server(ods_codes=VALID_ODS_CODES) as server:
+        resolver = OdsResolver(endpoint=server.endpoint)
+        for _ in range(3):
+            assert resolver.is_valid_ods_code("AAA")
+            assert not resolver.is_valid_ods_code("XXX")
+
+    assert server.requests == {"AAA": 1, "XXX": 1}
+
+
+def test_ods_resolver_does_not_request_whitespace():
+    with stub_ods_server(ods_codes=VALID_ODS_CODES) as server:
+        resolver = OdsResolver(endpoint=server.endpoint)
+        assert not resolver.is_valid_ods_code("   ")
+
+    assert server.requests == {}
+
+
+def test_ods_resolver_cache_expiry():
+    with stub_ods_server(ods_codes=VALID_ODS_CODES) as server:
+        resolver = OdsResolver(endpoint=server.endpoint, ttl=100, negative_ttl=10)
+        with mock.patch("time.monotonic", return_value=0):
+            resolver.is_valid_ods_code("AAA")
+            resolver.is_valid_ods_code("XXX")
+        with mock.patch("time.monotonic", return_value=50):
+            resolver.is_valid_ods_code("AAA")
+            resolver.is_valid_ods_code("XXX")
+
+    assert server.requests == {"AAA": 1, "XXX": 2}
+
+
+@mock.patch("domain.ods.time.sleep")
+def test_ods_resolver_does_not_back_off_on_success(mocked_sleep):
+    with stub_ods_server(ods_codes=VALID_ODS_CODES) as server:
+        resolver = OdsResolver(endpoint=server.endpoint)
+        assert resolver.is_valid_ods_code("AAA")
+        assert not resolver.is_valid_ods_code("XXX")
+
+    assert mocked_sleep.call_count == 0
+
+
+@mock.patch("domain.ods.time.sleep")
+def test_ods_resolver_backs_off_on_failure(mocked_sleep):
+    with stub_ods_server(ods_codes=VALID_ODS_CODES, failures={"AAA": 1}) as server:
+        resolver = OdsResolver(endpoint=server.endpoint)
+        assert resolver.is_valid_ods_code("AAA")
+
+    assert server.requests == {"AAA": 2}
+    assert mocked_sleep.call_count == 1
+
+
+@mock.patch("domain.ods.time.sleep")
+def test_ods_resolver_does_not_cache_failures(mocked_sleep):
+    with stub_ods_server(ods_codes=VALID_ODS_CODES, failures={"AAA": 3}) as server:
+        resolver = OdsResolver(endpoint=server.endpoint)
+        with pytest.raises(OdsApiOfflineError):
+            resolver.is_valid_ods_code("AAA")
+        assert resolver.is_valid_ods_code("AAA")
+
+    assert server.requests == {"AAA": 4}
+    assert mocked_sleep.call_count == 2
+
+
+def test_ods_resolver_are_valid_ods_codes():
+    ods_codes = ["AAA", "XXX", "BBB", "AAA", "YYY", "CCC", "XXX"]
+    with stub_ods_server(ods_codes=VALID_ODS_CODES, delay=0.2) as server:
+        resolver = OdsResolver(endpoint=server.endpoint)
+        assert resolver.is_valid_ods_code("AAA")
+        results = resolver.are_valid_ods_codes(ods_codes)
+
+    assert results == {
+        "AAA": True,
+        "XXX": False,
+        "BBB": True,
+        "YYY": False,
+        "CCC": True,
+    }
+    assert list(results) == ["AAA", "XXX", "BBB", "YYY", "CCC"]
+    assert server.requests == {"AAA": 1, "XXX": 1, "BBB": 1, "YYY": 1, "CCC": 1}
+
+
+def test_ods_resolver_are_valid_ods_codes_is_concurrent():
+    ods_codes = [f"A{i:02}" for i in range(10)]
+    with stub_ods_server(ods_codes=ods_codes, delay=0.2) as server:
+        resolver = OdsResolver(endpoint=server.endpoint, max_workers=10)
+        start = time.monotonic()
+        results = resolver.are_valid_ods_codes(ods_codes)
+        duration = time.monotonic() - start
+
+    assert all(results.values())
+    assert sum(server.requests.values()) == 10
+    assert duration < 1  # vs 2 seconds if requested one at a time
+
+
+def test_validate_ods_codes():
+    with stub_ods_server(ods_codes=VALID_ODS_CODES) as server, mock.patch(
+        "domain.ods._ods_resolver", OdsResolver(endpoint=server.endpoint)
+    ):
+        from domain.ods import validate_ods_code, validate_ods_codes
+
+        validate_ods_code("AAA")
+        validate_ods_codes(VALID_ODS_CODES)
+        with pytest.raises(InvalidOdsCodeError) as exception_wrapper:
+            validate_ods_codes(["AAA", "XXX", "YYY"])
+
+    assert str(exception_wrapper.value).endswith("/XXX'")
+
+
+def test_domain_ods_does_not_import_requests_until_used():
+    script = (
+        "import sys, domain.ods, domain.response.response_matrix;"
+        "assert 'requests' not in sys.modules;"
+        "domain.ods.OdsResolver();"
+        "assert 'requests' in sys.modules"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, "-c", script], check=True, env=env)
@@ -0,0 +1,169 @@
+import os
+from unittest import mock
+
+import pytest
+from domain.core.enum import Status
+from domain.core.root import Root
+from domain.repository.cpm_product_repository import CpmProductRepository
+from domain.repository.cpm_repository.active_index import backfill_active_keys
+from domain.repository.keys import TableKey
+from domain.repository.marshall import marshall
+
+from test_helpers.dynamodb import mock_table_cpm
+
+ODS_CODE = "F5H1R"
+TABLE_NAME = "my_table"
+
+
+@pytest.fixture
+def repository():
+    with mock_table_cpm(TABLE_NAME) as client, mock.patch.dict(
+        os.environ, {"ACTIVE_INDEX_READS": "true"}
+    ):
+        yield CpmProductRepository(table_name=TABLE_NAME, dynamodb_client=client)
+
+
+def _write_products(repository: CpmProductRepository):
+    """Write two active products and one deleted product"""
+    org = Root.create_ods_organisation(ods_code=ODS_CODE)
+    product_team = org.create_product_team(name="product-team-name")
+    products = [
+        product_team.create_cpm_product(name=name, product_id=product_id)
+        for name, product_id in [
+            ("product-a", "P.AAA-AAA"),
+            ("product-b", "P.AAA-CCC"),
+            ("product-c", "P.AAA-DDD"),
+        ]
+    ]
+    for product in products:
+        repository.write(product)
+
+    *active_products, deleted_product = products
+    deleted_product.clear_events()
+    deleted_product.delete()
+    repository.write(deleted_product)
+    return product_team, active_products, deleted_product
+
+
+def _get_item(repository: CpmProductRepository, product) -> dict:
+    return repository.client.get_item(
+        TableName=TABLE_NAME,
+        Key=marshall(
+            pk=TableKey.PRODUCT_TEAM.key(product.cpm_product_team_id),
+            sk=repository.table_key.key(product.id),
+        ),
+    )["Item"]
+
+
+def _search_by_organisation(repository: CpmProductRepository):
+    return repository.search_by_organisation(
+        organisation_code=ODS_CODE, status=Status.ACTIVE
+    )
+
+
+def _search_by_product_team(repository: CpmProductRepository, product_team):
+    return repository.search_by_product_team(
+        product_team_id=product_team.id, status=Status.ACTIVE
+    )
+
+
+def test__active_keys_are_removed_on_delete(repository: CpmProductRepository):
+    _, (active_product, _), deleted_product = _write_products(repository)
+
+    active_item = _get_item(repository, active_product)
+    assert active_item["pk_active"] == active_item["pk"]
+    assert active_item["pk_active_read_2"] == active_item["pk_read_2"]
+
+    deleted_item = _get_item(repository, deleted_product)
+    assert "pk_active" not in deleted_item
+    assert "pk_active_read_2" not in deleted_item
+
+
+@pytest.mark.parametrize(
+    ["search", "index_name"],
+    [
+        (
+            lambda repository, _: _search_by_organisation(repository),
+            "idx_gsi_active_read_2",
+        ),
+        (_search_by_product_team, "idx_gsi_active"),
+    ],
+)
+def test__active_search_only_reads_active_items(
+    repository: CpmProductRepository, search, index_name: str
+):
+    product_team, active_products, _ = _write_products(repository)
+
+    with mock.patch.object(
+        repository.client, "query", wraps=repository.client.query
+    ) as query:
+        results = search(repository, product_team)
+
+    assert sorted(results, key=lambda product: product.name) == active_products
+    ((_, query_args),) = query.call_args_list
+    assert query_args["IndexName"] == index_name
+    assert "FilterExpression" not in query_args
+
+
+def test__active_search_pages_through_active_index(
+    repository: CpmProductRepository,
+):
+    _, active_products, _ = _write_products(repository)
+
+    first_page, page_token = repository.search_page_by_organisation(
+        organisation_code=ODS_CODE, status=Status.ACTIVE, page_size=1
+    )
+    second_page, _ = repository.search_page_by_organisation(
+        organisation_code=ODS_CODE,
+        status=Status.ACTIVE,
+        page_size=1,
+        page_token=page_token,
+    )
+
+    assert first_page + second_page == active_products
+
+
+def test__active_index_reads_are_off_by_default():
+    with mock.patch.dict(os.environ, clear=True):
+        repository = CpmProductRepository(table_name=TABLE_NAME, dynamodb_client=None)
+    assert repository.active_index_reads is False
+
+
+def test__active_search_without_active_index_reads(
+    repository: CpmProductRepository,
+):
+    _, active_products, _ = _write_products(repository)
+    repository.active_index_reads = False
+
+    with mock.patch.object(
+        repository.client, "query", wraps=repository.client.query
+    ) as query:
+        results = _search_by_organisation(repository)
+
+    assert results == active_products
+    ((_, query_args),) = query.call_args_list
+    assert query_args["IndexName"] == "idx_gsi_read_2"
+    assert query_args["FilterExpression"] == "#status = :status"
+
+
+def test__backfill_active_keys(repository: CpmProductRepository):
+    product_team, active_products, deleted_product = _write_products(repository)
+    # Remove the active keys, as for items written before the active indexes
+    for product in active_products:
+        repository.client.update_item(
+            TableName=TABLE_NAME,
+            Key=marshall(
+                pk=TableKey.PRODUCT_TEAM.key(product_team.id),
+                sk=repository.table_key.key(product.id),
+            ),
+            UpdateExpression="REMOVE pk_active, pk_active_read_2",
+        )
+    assert _search_by_organisation(repository) == []
+    assert _search_by_product_team(repository, product_team) == []
+
+    assert backfill_active_keys(client=repository.client, table_name=TABLE_NAME) == 2
+    assert backfill_active_keys(client=repository.client, table_name=TABLE_NAME) == 0
+
+    assert _search_by_organisation(repository) == active_products
+    assert _search_by_product_team(repository, product_team) == active_products
+    assert "pk_active" not in _get_item(repository, deleted_product)
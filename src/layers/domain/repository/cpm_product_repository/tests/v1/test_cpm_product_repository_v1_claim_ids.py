@@ -0,0 +1,66 @@
+import pytest
+from domain.core.root import Root
+from domain.repository.cpm_product_repository import CpmProductRepository
+from domain.repository.errors import AlreadyExistsError
+from domain.repository.marshall import marshall
+
+from test_helpers.dynamodb import mock_table_cpm
+
+TABLE_NAME = "my_table"
+PRODUCT_ID = "P.AAA-AAA"
+
+
+@pytest.fixture
+def repository():
+    with mock_table_cpm(TABLE_NAME) as client:
+        yield CpmProductRepository(table_name=TABLE_NAME, dynamodb_client=client)
+
+
+def _product_teams(n: int):
+    org = Root.create_ods_organisation(ods_code="F5H1R")
+    return [org.create_product_team(name=f"product-team-{i}") for i in range(n)]
+
+
+def test__product_ids_are_unique_across_product_teams(
+    repository: CpmProductRepository,
+):
+    product_team, other_product_team = _product_teams(n=2)
+    product = product_team.create_cpm_product(name="product", product_id=PRODUCT_ID)
+    repository.write(product)
+
+    with pytest.raises(AlreadyExistsError):
+        repository.write(
+            other_product_team.create_cpm_product(name="other", product_id=PRODUCT_ID)
+        )
+
+    # Nothing was written for the other product team
+    assert repository.read(id=PRODUCT_ID) == product
+    assert (
+        repository.search_by_product_team(
+            product_team_id=other_product_team.id, status="all"
+        )
+        == []
+    )
+
+
+def test__claim_existing_ids(repository: CpmProductRepository):
+    product_team, other_product_team = _product_teams(n=2)
+    products = [
+        product_team.create_cpm_product(name="product", product_id=product_id)
+        for product_id in ["P.AAA-AAA", "P.AAA-CCC"]
+    ]
+    for product in products:
+        repository.write(product)
+    # As for a product written before product ids were claimed
+    repository.client.delete_item(
+        TableName=TABLE_NAME, Key=marshall(pk="P#P.AAA-AAA", sk="P#P.AAA-AAA")
+    )
+
+    assert sorted(repository.scan_ids()) == ["P.AAA-AAA", "P.AAA-CCC"]
+    assert repository.claim_existing_ids() == 1
+    assert repository.claim_existing_ids() == 0
+
+    with pytest.raises(AlreadyExistsError):
+        repository.write(
+            other_product_team.create_cpm_product(name="other", product_id="P.AAA-AAA")
+        )
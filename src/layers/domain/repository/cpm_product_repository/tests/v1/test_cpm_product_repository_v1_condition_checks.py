@@ -0,0 +1,84 @@
+import pytest
+from domain.core.root import Root
+from domain.repository.cpm_product_repository import CpmProductRepository
+from domain.repository.errors import ItemNotActive, ItemNotFound
+from domain.repository.product_team_repository import ProductTeamRepository
+
+from test_helpers.dynamodb import mock_table_cpm
+
+TABLE_NAME = "my_table"
+ALIAS = "808a36db-a52a-4130-b71e-d9cbcbaed15b"
+
+
+@pytest.fixture
+def repositories():
+    with mock_table_cpm(TABLE_NAME) as client:
+        yield (
+            ProductTeamRepository(table_name=TABLE_NAME, dynamodb_client=client),
+            CpmProductRepository(table_name=TABLE_NAME, dynamodb_client=client),
+        )
+
+
+@pytest.fixture
+def product_team():
+    org = Root.create_ods_organisation(ods_code="ABC")
+    return org.create_product_team(
+        name="product-team-name",
+        keys=[{"key_type": "product_team_id", "key_value": ALIAS}],
+    )
+
+
+def test__cpm_product_repository_write_product_team_is_active(
+    repositories: tuple[ProductTeamRepository, CpmProductRepository], product_team
+):
+    product_team_repo, product_repo = repositories
+    product_team_repo.write(product_team)
+    product = product_team.create_cpm_product(name="cpm-product-name")
+
+    (response,) = product_repo.write(
+        product,
+        condition_checks=[product_team_repo.active_condition_check(id=product_team.id)],
+    )
+
+    assert response["ResponseMetadata"]["HTTPStatusCode"] == 200
+    assert product_repo.read(product_team_id=product_team.id, id=product.id) == product
+
+
+def test__cpm_product_repository_write_product_team_does_not_exist(
+    repositories: tuple[ProductTeamRepository, CpmProductRepository], product_team
+):
+    product_team_repo, product_repo = repositories
+    product = product_team.create_cpm_product(name="cpm-product-name")
+
+    with pytest.raises(ItemNotActive):
+        product_repo.write(
+            product,
+            condition_checks=[
+                product_team_repo.active_condition_check(id=product_team.id)
+            ],
+        )
+
+    with pytest.raises(ItemNotFound):
+        product_repo.read(product_team_id=product_team.id, id=product.id)
+
+
+def test__cpm_product_repository_write_product_team_is_deleted(
+    repositories: tuple[ProductTeamRepository, CpmProductRepository], product_team
+):
+    product_team_repo, product_repo = repositories
+    product_team_repo.write(product_team)
+    product = product_team.create_cpm_product(name="cpm-product-name")
+    product_team.clear_events()
+    product_team.delete()
+    product_team_repo.write(product_team)
+
+    with pytest.raises(ItemNotActive):
+        product_repo.write(
+            product,
+            condition_checks=[
+                product_team_repo.active_condition_check(id=product_team.id)
+            ],
+        )
+
+    with pytest.raises(ItemNotFound):
+        product_repo.read(product_team_id=product_team.id, id=product.id)
@@ -0,0 +1,204 @@
+import pytest
+from domain.core.cpm_system_id import PRODUCT_ID_VALID_CHARS
+from domain.core.enum import Status
+from domain.core.root import Root
+from domain.repository.cpm_product_repository import CpmProductRepository
+from domain.repository.errors import InvalidPageToken
+from domain.repository.pagination import (
+    decode_fan_out_page_token,
+    encode_fan_out_page_token,
+    encode_page_token,
+)
+
+from test_helpers.dynamodb import mock_table_cpm
+
+ODS_CODE = "F5H1R"
+TABLE_NAME = "my_table"
+N_PRODUCTS = 7
+
+
+def _create_products(n_products: int = N_PRODUCTS, ods_code: str = ODS_CODE):
+    org = Root.create_ods_organisation(ods_code=ods_code)
+    product_team = org.create_product_team(name="product-team-name")
+    return product_team, [
+        product_team.create_cpm_product(
+            name=f"product-{char}", product_id=f"P.AAA-{char * 3}"
+        )
+        for char in PRODUCT_ID_VALID_CHARS[:n_products]
+    ]
+
+
+def _page_through(search, **kwargs) -> tuple[list, int]:
+    results, page_token, n_pages = [], None, 0
+    while True:
+        page, page_token = search(page_token=page_token, **kwargs)
+        results.extend(page)
+        n_pages += 1
+        if page_token is None:
+            return results, n_pages
+
+
+@pytest.fixture
+def repository():
+    with mock_table_cpm(TABLE_NAME) as client:
+        yield CpmProductRepository(table_name=TABLE_NAME, dynamodb_client=client)
+
+
+@pytest.mark.parametrize("page_size", [1, 2, 3, N_PRODUCTS, N_PRODUCTS + 1])
+def test__search_page_by_organisation(repository: CpmProductRepository, page_size: int):
+    _, products = _create_products()
+    for product in products:
+        repository.write(product)
+
+    results, n_pages = _page_through(
+        repository.search_page_by_organisation,
+        organisation_code=ODS_CODE,
+        status=Status.ACTIVE,
+        page_size=page_size,
+    )
+
+    assert sorted(results, key=lambda p: p.id.id) == products
+    assert n_pages >= -(-N_PRODUCTS // page_size)
+
+
+@pytest.mark.parametrize("page_size", [1, 3, N_PRODUCTS + 1])
+def test__search_page_by_product_team(repository: CpmProductRepository, page_size: int):
+    product_team, products = _create_products()
+    for product in products:
+        repository.write(product)
+
+    results, _ = _page_through(
+        repository.search_page_by_product_team,
+        product_team_id=product_team.id,
+        status=Status.ACTIVE,
+        page_size=page_size,
+    )
+
+    assert sorted(results, key=lambda p: p.id.id) == products
+
+
+def test__search_page_filters_status_across_pages(repository: CpmProductRepository):
+    _, products = _create_products()
+    for product in products:
+        repository.write(product)
+
+    for product in products[::2]:
+        product.clear_events()
+        product.delete()
+        repository.write(product)
+
+    results, _ = _page_through(
+        repository.search_page_by_organisation,
+        organisation_code=ODS_CODE,
+        status=Status.ACTIVE,
+        page_size=2,
+    )
+    assert sorted(results, key=lambda p: p.id.id) == products[1::2]
+
+
+def test__search_by_organisation_follows_all_pages(
+    repository: CpmProductRepository,
+):
+    _, products = _create_products()
+    for product in products:
+        repository.write(product)
+
+    # Force DynamoDB to return a LastEvaluatedKey on every page
+    query = repository.client.query
+    repository.client.query = lambda **kwargs: query(**kwargs, Limit=1)
+
+    results = repository.search_by_organisation(
+        organisation_code=ODS_CODE, status=Status.ACTIVE
+    )
+    assert sorted(results, key=lambda p: p.id.id) == products
+
+
+@pytest.mark.parametrize(
+    "page_token",
+    [
+        "not-base64!",
+        encode_page_token(["not", "a", "key"]),
+        encode_page_token({"pk": {"S": "PT#foo"}, "sk": {"S": "P#bar"}}),
+        encode_page_token(
+            {
+                "pk": {"S": "PT#foo"},
+                "sk": {"S": "P#bar"},
+                "pk_read_2": {"S": "ORG#NOT_THIS_ORG"},
+                "sk_read_2": {"S": "P#bar"},
+            }
+        ),
+        encode_page_token(
+            {
+                "pk": {"S": "PT#foo"},
+                "sk": {"N": "1"},
+                "pk_read_2": {"S": f"ORG#{ODS_CODE}"},
+                "sk_read_2": {"S": "P#bar"},
+            }
+        ),
+    ],
+)
+def test__search_page_by_organisation_invalid_page_token(
+    repository: CpmProductRepository, page_token: str
+):
+    with pytest.raises(InvalidPageToken):
+        repository.search_page_by_organisation(
+            organisation_code=ODS_CODE,
+            status=Status.ACTIVE,
+            page_size=1,
+            page_token=page_token,
+        )
+
+
+def test__search_pages_by_organisation_is_lazy(repository: CpmProductRepository):
+    _, products = _create_products()
+    for product in products:
+        repository.write(product)
+
+    # Force DynamoDB to return a LastEvaluatedKey on every page
+    query = repository.client.query
+    n_queries = 0
+
+    def _query(**kwargs):
+        nonlocal n_queries
+        n_queries += 1
+        return query(**{**kwargs, "Limit": 1})
+
+    repository.client.query = _query
+
+    pages = repository.search_pages_by_organisation(
+        organisation_code=ODS_CODE, status=Status.ACTIVE, page_size=N_PRODUCTS
+    )
+    assert n_queries == 0
+
+    results = []
+    for page, page_token in pages:
+        assert len(page) == 1
+        assert n_queries == len(results) + 1
+        results.extend(page)
+    assert page_token is None
+
+    assert sorted(results, key=lambda p: p.id.id) == products
+
+
+def test__fan_out_page_token():
+    page_tokens = {"BBB": "token-b", "AAA": "token-a"}
+    page_token = encode_fan_out_page_token(page_tokens)
+    assert (
+        decode_fan_out_page_token(page_token=page_token, values=["AAA", "BBB", "CCC"])
+        == page_tokens
+    )
+
+
+@pytest.mark.parametrize(
+    "page_token",
+    [
+        "not-base64!",
+        encode_page_token(["not", "a", "dict"]),
+        encode_fan_out_page_token({}),
+        encode_fan_out_page_token({"AAA": "token-a", "DDD": "token-d"}),
+        encode_fan_out_page_token({"AAA": 1}),
+    ],
+)
+def test__fan_out_page_token_invalid(page_token: str):
+    with pytest.raises(InvalidPageToken):
+        decode_fan_out_page_token(page_token=page_token, values=["AAA", "BBB"])
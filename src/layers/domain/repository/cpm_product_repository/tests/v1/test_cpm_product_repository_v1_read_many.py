@@ -0,0 +1,116 @@
+from unittest import mock
+
+import pytest
+from domain.core.cpm_system_id import PRODUCT_ID_VALID_CHARS
+from domain.core.root import Root
+from domain.repository.cpm_product_repository import CpmProductRepository
+from domain.repository.errors import UnprocessedKeys
+
+from test_helpers.dynamodb import mock_table_cpm
+
+TABLE_NAME = "my_table"
+
+
+def _create_products(n_products: int):
+    org = Root.create_ods_organisation(ods_code="F5H1R")
+    product_team = org.create_product_team(name="product-team-name")
+    return [
+        product_team.create_cpm_product(
+            name="product-name", product_id=f"P.{a}{a}{a}-{b}{b}{b}"
+        )
+        for a in PRODUCT_ID_VALID_CHARS
+        for b in PRODUCT_ID_VALID_CHARS
+    ][:n_products]
+
+
+def _keys(products):
+    return [(str(product.cpm_product_team_id), str(product.id)) for product in products]
+
+
+@pytest.fixture
+def repository():
+    with mock_table_cpm(TABLE_NAME) as client:
+        yield CpmProductRepository(table_name=TABLE_NAME, dynamodb_client=client)
+
+
+def test__cpm_product_repository_read_many(repository: CpmProductRepository):
+    products = _create_products(n_products=250)
+    for product in products:
+        repository.write(product)
+
+    keys = _keys(reversed(products))
+    with mock.patch.object(
+        repository.client,
+        "batch_get_item",
+        wraps=repository.client.batch_get_item,
+    ) as batch_get_item:
+        results = repository.read_many(keys=keys)
+
+    assert results == list(reversed(products))
+    assert batch_get_item.call_count == 3
+
+
+def test__cpm_product_repository_read_many_missing_and_duplicates(
+    repository: CpmProductRepository,
+):
+    product, deleted_product, unwritten_product = _create_products(n_products=3)
+    repository.write(product)
+    repository.write(deleted_product)
+    deleted_product.clear_events()
+    deleted_product.delete()
+    repository.write(deleted_product)
+
+    keys = _keys([unwritten_product, product, deleted_product, product])
+    results = repository.read_many(keys=keys)
+    assert results == [None, product, None, product]
+
+    results = repository.read_many(keys=keys, status="all")
+    assert results == [None, product, deleted_product, product]
+
+
+@mock.patch("domain.repository.cpm_repository.v1.time.sleep")
+def test__cpm_product_repository_read_many_unprocessed_keys(
+    mocked_sleep, repository: CpmProductRepository
+):
+    products = _create_products(n_products=3)
+    for product in products:
+        repository.write(product)
+
+    batch_get_item = repository.client.batch_get_item
+
+    def _batch_get_item_one_key_at_a_time(RequestItems):
+        ((table_name, request),) = RequestItems.items()
+        first_key, *other_keys = request["Keys"]
+        response = batch_get_item(RequestItems={table_name: {"Keys": [first_key]}})
+        if other_keys:
+            response["UnprocessedKeys"] = {table_name: {"Keys": other_keys}}
+        return response
+
+    with mock.patch.object(
+        repository.client,
+        "batch_get_item",
+        side_effect=_batch_get_item_one_key_at_a_time,
+    ):
+        results = repository.read_many(keys=_keys(products))
+
+    assert results == products
+    assert mocked_sleep.call_count == 2
+
+
+@mock.patch("domain.repository.cpm_repository.v1.time.sleep")
+def test__cpm_product_repository_read_many_unprocessed_keys_exhausted(
+    mocked_sleep, repository: CpmProductRepository
+):
+    (product,) = _create_products(n_products=1)
+    keys = _keys([product])
+
+    def _batch_get_item_never_processes(RequestItems):
+        return {"Responses": {}, "UnprocessedKeys": RequestItems}
+
+    with mock.patch.object(
+        repository.client,
+        "batch_get_item",
+        side_effect=_batch_get_item_never_processes,
+    ):
+        with pytest.raises(UnprocessedKeys):
+            repository.read_many(keys=keys)
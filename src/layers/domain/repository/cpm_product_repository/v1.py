@@ -1,4 +1,7 @@
+from typing import Iterator
+
 from attr import asdict
+from botocore.exceptions import ClientError
 from domain.core.cpm_product import (
     CpmProduct,
     CpmProductCreatedEvent,
@@ -9,6 +12,12 @@ from domain.core.enum import EntityType
 from domain.core.product_key import ProductKey
 from domain.repository.cpm_repository import Repository
 from domain.repository.keys import TableKey
+from domain.repository.marshall import marshall, marshall_value, unmarshall
+from domain.repository.transaction import (
+    ConditionExpression,
+    TransactionStatement,
+    TransactItem,
+)
 
 
 class CpmProductRepository(Repository[CpmProduct]):
@@ -21,14 +30,39 @@ class CpmProductRepository(Repository[CpmProduct]):
             table_key=TableKey.CPM_PRODUCT,
         )
 
-    def read(self, product_team_id: str = None, id: str = None, status: str = "active"):
+    def read(
+        self,
+        product_team_id: str = None,
+        id: str = None,
+        status: str = "active",
+        fields: list[str] = None,
+    ) -> CpmProduct | dict:
+        """Read a product, or only the given 'fields' of it as a dict."""
         if product_team_id:
-            return super()._read(parent_ids=(product_team_id,), id=id, status=status)
+            return super()._read(
+                parent_ids=(product_team_id,), id=id, status=status, fields=fields
+            )
         else:
             return super()._read(
-                parent_ids=(id,), id=id, status=status, gsi="idx_gsi_read_1"
+                parent_ids=(id,),
+                id=id,
+                status=status,
+                gsi="idx_gsi_read_1",
+                fields=fields,
             )
 
+    def read_many(
+        self, keys: list[tuple[str, str]], status: str = "active"
+    ) -> list[CpmProduct | None]:
+        """Read products by (product_team_id, product_id), in request order."""
+        return super()._read_many(
+            keys=[
+                (TableKey.PRODUCT_TEAM.key(product_team_id), self.table_key.key(id))
+                for product_team_id, id in keys
+            ],
+            status=status,
+        )
+
     def search_by_product_team(
         self, product_team_id: str, status: str
     ) -> list[CpmProduct]:
@@ -43,23 +77,154 @@ class CpmProductRepository(Repository[CpmProduct]):
         self, organisation_code: str, status: str
     ) -> list[CpmProduct]:
         """Search for products under a given Organisation using idx_gsi_read_2."""
-        self.parent_table_keys = (TableKey.ORG_CODE,)
         return super()._search(
             parent_ids=(TableKey.ORG_CODE.key(organisation_code),),
             sk_prefix="P#",
             gsi="idx_gsi_read_2",
             status=status,
+            parent_table_keys=(TableKey.ORG_CODE,),
         )
 
-    def handle_CpmProductCreatedEvent(self, event: CpmProductCreatedEvent):
-        return self.create_index(
-            id=event.id,
-            parent_key_parts=(event.cpm_product_team_id,),
-            data=asdict(event),
-            root=True,
-            row_type=EntityType.PRODUCT,
+    def search_pages_by_product_team(
+        self,
+        product_team_id: str,
+        status: str,
+        page_size: int,
+        page_token: str = None,
+        fields: list[str] = None,
+    ) -> Iterator[tuple[list[CpmProduct | dict], str | None]]:
+        """Lazily search for a page of products under a given Product Team."""
+        return super()._search_pages(
+            parent_ids=(TableKey.PRODUCT_TEAM.key(product_team_id),),
+            sk_prefix="P#",
+            status=status,
+            page_size=page_size,
+            page_token=page_token,
+            fields=fields,
+        )
+
+    def search_pages_by_organisation(
+        self,
+        organisation_code: str,
+        status: str,
+        page_size: int,
+        page_token: str = None,
+        fields: list[str] = None,
+    ) -> Iterator[tuple[list[CpmProduct | dict], str | None]]:
+        """Lazily search for a page of products under a given Organisation using idx_gsi_read_2."""
+        return super()._search_pages(
+            parent_ids=(TableKey.ORG_CODE.key(organisation_code),),
+            sk_prefix="P#",
+            gsi="idx_gsi_read_2",
+            status=status,
+            parent_table_keys=(TableKey.ORG_CODE,),
+            page_size=page_size,
+            page_token=page_token,
+            fields=fields,
+        )
+
+    def search_page_by_product_team(
+        self,
+        product_team_id: str,
+        status: str,
+        page_size: int,
+        page_token: str = None,
+        fields: list[str] = None,
+    ) -> tuple[list[CpmProduct | dict], str | None]:
+        """Search for a page of products under a given Product Team."""
+        return self._collect_pages(
+            self.search_pages_by_product_team(
+                product_team_id,
+                status=status,
+                page_size=page_size,
+                page_token=page_token,
+                fields=fields,
+            )
+        )
+
+    def search_page_by_organisation(
+        self,
+        organisation_code: str,
+        status: str,
+        page_size: int,
+        page_token: str = None,
+        fields: list[str] = None,
+    ) -> tuple[list[CpmProduct | dict], str | None]:
+        """Search for a page of products under a given Organisation using idx_gsi_read_2."""
+        return self._collect_pages(
+            self.search_pages_by_organisation(
+                organisation_code,
+                status=status,
+                page_size=page_size,
+                page_token=page_token,
+                fields=fields,
+            )
+        )
+
+    def claim_id(self, id: str) -> TransactItem:
+        """
+        Marker item that claims the product id across the whole table, so that
+        a product is only written if no other product has been given its id
+        """
+        pk = self.table_key.key(id)
+        return TransactItem(
+            Put=TransactionStatement(
+                TableName=self.table_name,
+                Item=marshall(pk=pk, sk=pk, row_type=EntityType.PRODUCT_ID),
+                ConditionExpression=ConditionExpression.MUST_NOT_EXIST,
+            )
         )
 
+    def scan_ids(self) -> Iterator[str]:
+        """The id of every product in the table, active or not"""
+        args = {
+            "TableName": self.table_name,
+            "ProjectionExpression": "#id",
+            "FilterExpression": "row_type = :row_type",
+            "ExpressionAttributeNames": {"#id": "id"},
+            "ExpressionAttributeValues": {
+                ":row_type": marshall_value(EntityType.PRODUCT)
+            },
+        }
+        while True:
+            response = self.retry_policy.call(self.client.scan, **args)
+            yield from (unmarshall(item)["id"] for item in response["Items"])
+            if "LastEvaluatedKey" not in response:
+                break
+            args["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    def claim_existing_ids(self) -> int:
+        """
+        Claim the ids of products that were written before ids were claimed,
+        returning the number of ids claimed. Ids that are already claimed are
+        skipped, so this can be rerun.
+        """
+        n_claimed = 0
+        for id in set(self.scan_ids()):
+            try:
+                self.retry_policy.call(
+                    self.client.put_item,
+                    **self.claim_id(id=id).Put.dict(exclude_none=True),
+                )
+            except ClientError as error:
+                if error.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                    raise
+            else:
+                n_claimed += 1
+        return n_claimed
+
+    def handle_CpmProductCreatedEvent(self, event: CpmProductCreatedEvent):
+        return [
+            self.create_index(
+                id=event.id,
+                parent_key_parts=(event.cpm_product_team_id,),
+                data=asdict(event),
+                root=True,
+                row_type=EntityType.PRODUCT,
+            ),
+            self.claim_id(id=event.id),
+        ]
+
     def handle_CpmProductKeyAddedEvent(self, event: CpmProductKeyAddedEvent):
         # Create a copy of the Product indexed against the new key
         new_key = ProductKey(**event.new_key)
@@ -1 +1,2 @@
+from .aio import AsyncRepository  # noqa: F401
 from .v1 import *  # noqa: F403, F401
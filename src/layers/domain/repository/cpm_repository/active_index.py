@@ -0,0 +1,87 @@
+from typing import TYPE_CHECKING, Iterator
+
+from botocore.exceptions import ClientError
+from domain.core.enum import Status
+from domain.repository.marshall import marshall, marshall_value, unmarshall
+from domain.repository.transaction import ConditionExpression
+from event.aws.retry import DEFAULT_RETRY_POLICY, RetryPolicy
+
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb import DynamoDBClient
+
+# Copies of the partition keys which are only set on active items, and so key
+# sparse indexes that searches for active items can query without reading
+# (or paying for) any inactive items
+ACTIVE_KEY_ATTRIBUTES = {"pk": "pk_active", "pk_read_2": "pk_active_read_2"}
+
+# The sparse index to search for active items instead of each index (or the table)
+ACTIVE_GSI_MAPPING = {None: "idx_gsi_active", "idx_gsi_read_2": "idx_gsi_active_read_2"}
+
+
+def active_key_attributes(item: dict) -> dict:
+    """The active index keys of an (unmarshalled) item, if it is active"""
+    if item.get("status") != Status.ACTIVE:
+        return {}
+    return {
+        active_attribute: item[attribute]
+        for attribute, active_attribute in ACTIVE_KEY_ATTRIBUTES.items()
+        if attribute in item
+    }
+
+
+def _scan_items_missing_active_keys(
+    client: "DynamoDBClient", table_name: str, retry_policy: RetryPolicy
+) -> Iterator[dict]:
+    args = {
+        "TableName": table_name,
+        "ProjectionExpression": ", ".join(["#status", "sk", *ACTIVE_KEY_ATTRIBUTES]),
+        "FilterExpression": "#status = :active AND attribute_not_exists(pk_active)",
+        "ExpressionAttributeNames": {"#status": "status"},
+        "ExpressionAttributeValues": {":active": marshall_value(Status.ACTIVE)},
+    }
+    while True:
+        response = retry_policy.call(client.scan, **args)
+        yield from map(unmarshall, response["Items"])
+        if "LastEvaluatedKey" not in response:
+            break
+        args["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def backfill_active_keys(
+    client: "DynamoDBClient",
+    table_name: str,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+) -> int:
+    """
+    Set the active index keys on active items that were written before the
+    sparse indexes existed, returning the number of items updated. Each update
+    is conditional on the item still being active, so that the backfill can be
+    run against a live table, and items that already have their active index
+    keys are skipped, so that an interrupted backfill can simply be rerun.
+    """
+    n_updated = 0
+    for item in _scan_items_missing_active_keys(
+        client=client, table_name=table_name, retry_policy=retry_policy
+    ):
+        active_keys = active_key_attributes(item)
+        try:
+            retry_policy.call(
+                client.update_item,
+                TableName=table_name,
+                Key=marshall(pk=item["pk"], sk=item["sk"]),
+                UpdateExpression="SET "
+                + ", ".join(f"{name} = :{name}" for name in active_keys),
+                ConditionExpression=ConditionExpression.MUST_BE_ACTIVE,
+                ExpressionAttributeNames={"#status": "status"},
+                ExpressionAttributeValues=marshall(
+                    **{":active": Status.ACTIVE},
+                    **{f":{name}": value for name, value in active_keys.items()},
+                ),
+            )
+        except ClientError as error:
+            # The item was deleted since it was scanned
+            if error.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+        else:
+            n_updated += 1
+    return n_updated
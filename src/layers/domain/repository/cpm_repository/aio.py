@@ -0,0 +1,62 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import partial, wraps
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+from event.aws.client import MAX_POOL_CONNECTIONS
+
+if TYPE_CHECKING:
+    from .v1 import Repository
+
+# One worker per pooled client connection, shared by every event loop
+EXECUTOR = ThreadPoolExecutor(
+    max_workers=MAX_POOL_CONNECTIONS, thread_name_prefix="repository"
+)
+
+
+async def run_in_executor[T](fn: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Run the blocking 'fn' in the shared executor. It runs in a copy of the
+    current context, so that its client calls share the caller's RetryBudget
+    and are recorded in the caller's step metrics.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        EXECUTOR, partial(copy_context().run, fn, *args, **kwargs)
+    )
+
+
+class AsyncRepository[ModelType]:
+    """
+    Awaitable view of a Repository, so that a step can make several
+    independent queries concurrently, e.g.
+
+        product_teams, products = await asyncio.gather(
+            product_team_repo.aio.read_many(ids=ids),
+            product_repo.aio.search_by_organisation(organisation_code, "active"),
+        )
+
+    boto3 clients are blocking (but thread-safe), so each method of the
+    underlying repository, including '_query', '_read', '_search' and 'write',
+    runs in a worker thread. Methods that return generators (e.g.
+    'search_pages_by_organisation') make their queries lazily, so they should
+    be consumed within the call, e.g. with 'aio.call(lambda: list(...))'.
+    """
+
+    def __init__(self, repository: "Repository[ModelType]"):
+        self.repository = repository
+
+    async def call[T](self, fn: Callable[[], T]) -> T:
+        return await run_in_executor(fn)
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        method = getattr(self.repository, name)
+        if not callable(method):
+            raise AttributeError(f"'{name}' is not a method of {self.repository}")
+
+        @wraps(method)
+        async def _method(*args, **kwargs):
+            return await run_in_executor(method, *args, **kwargs)
+
+        return _method
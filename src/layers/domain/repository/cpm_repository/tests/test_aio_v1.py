@@ -0,0 +1,131 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from domain.core.root import Root
+from domain.repository.cpm_product_repository import CpmProductRepository
+from domain.repository.cpm_repository import AsyncRepository
+from domain.repository.errors import ItemNotFound
+from domain.repository.product_team_repository import ProductTeamRepository
+from event.aws.retry import retry_budget
+
+from test_helpers.dynamodb import mock_table_cpm
+
+TABLE_NAME = "my_table"
+ODS_CODES = ["AAA", "BBB", "CCC"]
+
+
+@pytest.fixture
+def repositories():
+    with mock_table_cpm(TABLE_NAME) as client:
+        yield (
+            ProductTeamRepository(table_name=TABLE_NAME, dynamodb_client=client),
+            CpmProductRepository(table_name=TABLE_NAME, dynamodb_client=client),
+        )
+
+
+def _create_products(product_team_repo, product_repo):
+    products = []
+    for ods_code in ODS_CODES:
+        org = Root.create_ods_organisation(ods_code=ods_code)
+        product_team = org.create_product_team(name=f"{ods_code}-team")
+        product_team_repo.write(product_team)
+        product = product_team.create_cpm_product(name=f"{ods_code}-product")
+        product_repo.write(product)
+        products.append(product)
+    return products
+
+
+def test_async_repository(repositories):
+    product_team_repo, product_repo = repositories
+    products = _create_products(product_team_repo, product_repo)
+
+    async def _search_all():
+        return await asyncio.gather(
+            *(
+                product_repo.aio.search_by_organisation(
+                    organisation_code=ods_code, status="active"
+                )
+                for ods_code in ODS_CODES
+            )
+        )
+
+    assert isinstance(product_repo.aio, AsyncRepository)
+    assert asyncio.run(_search_all()) == [[product] for product in products]
+
+
+def test_async_repository_write_and_read(repositories):
+    product_team_repo, _ = repositories
+    org = Root.create_ods_organisation(ods_code="AAA")
+    product_team = org.create_product_team(name="team")
+
+    async def _write_and_read():
+        await product_team_repo.aio.write(product_team)
+        return await product_team_repo.aio._read(
+            parent_ids=(product_team.id,), id=product_team.id, status="active"
+        )
+
+    assert asyncio.run(_write_and_read()) == product_team
+
+
+def test_async_repository_raises(repositories):
+    product_team_repo, _ = repositories
+
+    with pytest.raises(ItemNotFound):
+        asyncio.run(product_team_repo.aio.read(id="does-not-exist"))
+
+
+def test_async_repository_call(repositories):
+    product_team_repo, product_repo = repositories
+    products = _create_products(product_team_repo, product_repo)
+    (product, *_) = products
+
+    pages = asyncio.run(
+        product_repo.aio.call(
+            lambda: list(
+                product_repo.search_pages_by_product_team(
+                    product.cpm_product_team_id, status="active", page_size=10
+                )
+            )
+        )
+    )
+    assert pages == [([product], None)]
+
+
+def test_async_repository_queries_are_concurrent(repositories):
+    product_team_repo, product_repo = repositories
+    _create_products(product_team_repo, product_repo)
+    query = product_repo.client.query
+    in_flight, max_in_flight, lock = 0, 0, threading.Lock()
+
+    def _slow_query(**kwargs):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        try:
+            time.sleep(0.05)
+            return query(**kwargs)
+        finally:
+            with lock:
+                in_flight -= 1
+
+    product_repo.client.query = _slow_query
+
+    async def _search_all():
+        return await asyncio.gather(
+            *(
+                product_repo.aio.search_by_organisation(
+                    organisation_code=ods_code, status="active"
+                )
+                for ods_code in ODS_CODES
+            )
+        )
+
+    with retry_budget() as budget:
+        asyncio.run(_search_all())
+
+    assert max_in_flight == len(ODS_CODES)
+    # The queries were recorded in the caller's RetryBudget
+    assert budget.stats()["attempts"] == {"_slow_query": len(ODS_CODES)}
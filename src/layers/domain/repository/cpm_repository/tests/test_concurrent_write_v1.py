@@ -0,0 +1,160 @@
+import threading
+import time
+from uuid import uuid4
+
+import pytest
+from domain.core.root import Root
+from domain.repository.cpm_repository.v1 import (
+    _split_chunks_into_waves,
+    _split_transactions_by_key,
+    client_request_token,
+)
+from domain.repository.errors import AlreadyExistsError
+from domain.repository.marshall import marshall
+from domain.repository.product_team_repository import ProductTeamRepository
+from domain.repository.transaction import TransactionStatement, TransactItem
+
+from test_helpers.dynamodb import mock_table_cpm
+
+TABLE_NAME = "my_table"
+N_KEYS = 6
+
+
+def _put(pk: str, sk: str = None) -> TransactItem:
+    return TransactItem(
+        Put=TransactionStatement(
+            TableName=TABLE_NAME, Item=marshall(pk=pk, sk=sk or pk)
+        )
+    )
+
+
+def _create_product_team(n_keys: int = N_KEYS):
+    org = Root.create_ods_organisation(ods_code="AAA")
+    return org.create_product_team(
+        name="product-team-name",
+        keys=[
+            {"key_type": "product_team_id", "key_value": str(uuid4())}
+            for _ in range(n_keys)
+        ],
+    )
+
+
+class _ConcurrencyCounter:
+    def __init__(self, transact_write_items, delay=0.05):
+        self.transact_write_items = transact_write_items
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            return self.transact_write_items(**kwargs)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+def test__split_chunks_into_waves():
+    chunks = [
+        [_put("a"), _put("b")],
+        [_put("c")],
+        [_put("a"), _put("d")],  # shares "a" with chunk 0
+        [_put("e")],
+        [_put("d"), _put("c")],  # shares "d" with chunk 2
+    ]
+    waves = _split_chunks_into_waves(chunks)
+    assert [[index for index, _ in wave] for wave in waves] == [[0, 1, 3], [2], [4]]
+
+
+def test__split_chunks_into_waves_preserves_split_by_key():
+    transact_items = [_put("a"), _put("b"), _put("a"), _put("c"), _put("b")]
+    chunks = list(_split_transactions_by_key(transact_items, n_max=100))
+    waves = _split_chunks_into_waves(chunks)
+    assert len(chunks) == 2
+    assert [[index for index, _ in wave] for wave in waves] == [[0], [1]]
+
+
+def test_client_request_token():
+    write_id = uuid4()
+    token = client_request_token(write_id, 0)
+    assert len(token) == 36
+    assert token == client_request_token(write_id, 0)
+    assert token != client_request_token(write_id, 1)
+    assert token != client_request_token(uuid4(), 0)
+
+
+def test_write_client_request_tokens_are_unique():
+    product_team = _create_product_team()
+
+    with mock_table_cpm(TABLE_NAME) as client:
+        repo = ProductTeamRepository(table_name=TABLE_NAME, dynamodb_client=client)
+        transact_write_items = client.transact_write_items
+        tokens = []
+
+        def _transact_write_items(**kwargs):
+            tokens.append(kwargs["ClientRequestToken"])
+            return transact_write_items(**kwargs)
+
+        client.transact_write_items = _transact_write_items
+        repo.write(product_team, batch_size=1)
+        with pytest.raises(AlreadyExistsError):
+            repo.write(product_team, batch_size=1)
+
+    assert len(tokens) == N_KEYS + 2
+    assert len(set(tokens)) == len(tokens)
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_write_concurrently(max_workers: int):
+    product_team = _create_product_team()
+
+    with mock_table_cpm(TABLE_NAME) as client:
+        repo = ProductTeamRepository(table_name=TABLE_NAME, dynamodb_client=client)
+        counter = _ConcurrencyCounter(client.transact_write_items)
+        client.transact_write_items = counter
+
+        responses = repo.write(product_team, batch_size=1, max_workers=max_workers)
+
+        assert len(responses) == N_KEYS + 1
+        assert counter.max_in_flight == max_workers
+        for key in product_team.keys:
+            assert repo.read(id=key.key_value) == product_team
+
+
+def test_write_concurrently_raises_first_error_and_stops():
+    product_team = _create_product_team()
+
+    with mock_table_cpm(TABLE_NAME) as client:
+        repo = ProductTeamRepository(table_name=TABLE_NAME, dynamodb_client=client)
+        repo.max_write_workers = 4
+        repo.write(product_team)
+
+        _product_team = repo.read(id=product_team.id)
+        _product_team.delete()
+        _product_team.events.insert(0, product_team.events[0])
+
+        transact_write_items = client.transact_write_items
+        calls = []
+
+        def _transact_write_items(**kwargs):
+            calls.append(kwargs)
+            return transact_write_items(**kwargs)
+
+        client.transact_write_items = _transact_write_items
+        with pytest.raises(AlreadyExistsError):
+            repo.write(_product_team, batch_size=1)
+
+        # Only the key-disjoint Puts are attempted: the Update and Deletes share
+        # keys with the failed Puts and so are never written
+        assert len(calls) == 2 * N_KEYS + 1
+        assert all(
+            "Put" in transact_item
+            for call in calls
+            for transact_item in call["TransactItems"]
+        )
+        assert repo.read(id=product_team.id) == product_team
@@ -0,0 +1,61 @@
+from domain.core.root import Root
+from domain.repository.product_team_repository import ProductTeamRepository
+from event.aws.metrics import collect_step_metrics
+
+from test_helpers.dynamodb import mock_table_cpm
+from test_helpers.sample_data import CPM_PRODUCT_TEAM_NO_ID
+
+TABLE_NAME = "my_table"
+
+
+def _create_product_team():
+    org = Root.create_ods_organisation(ods_code=CPM_PRODUCT_TEAM_NO_ID["ods_code"])
+    return org.create_product_team(
+        name=CPM_PRODUCT_TEAM_NO_ID["name"], keys=CPM_PRODUCT_TEAM_NO_ID["keys"]
+    )
+
+
+def test_repository_records_consumed_capacity_when_collecting():
+    product_team = _create_product_team()
+
+    with mock_table_cpm(TABLE_NAME) as client:
+        repo = ProductTeamRepository(table_name=TABLE_NAME, dynamodb_client=client)
+        transact_write_items = client.transact_write_items
+        transactions = []
+
+        def _transact_write_items(**kwargs):
+            transactions.append(kwargs)
+            return transact_write_items(**kwargs)
+
+        _transact_write_items.__name__ = transact_write_items.__name__
+        client.transact_write_items = _transact_write_items
+        with collect_step_metrics() as write_metrics:
+            repo.write(product_team)
+        with collect_step_metrics() as read_metrics:
+            assert repo.read(id=product_team.id) == product_team
+            assert repo.read_many(ids=[product_team.id]) == [product_team]
+
+    assert set(write_metrics.client_calls) == {"transact_write_items"}
+    # moto doesn't report consumed capacity for transactions, so check that it was asked
+    assert {kwargs["ReturnConsumedCapacity"] for kwargs in transactions} == {"TOTAL"}
+    assert read_metrics.client_calls.total() == 2  # one query, one batch get
+    assert read_metrics.consumed_capacity > 0
+
+
+def test_repository_does_not_request_consumed_capacity_by_default():
+    product_team = _create_product_team()
+
+    with mock_table_cpm(TABLE_NAME) as client:
+        repo = ProductTeamRepository(table_name=TABLE_NAME, dynamodb_client=client)
+        calls = []
+        query = client.query
+
+        def _query(**kwargs):
+            calls.append(kwargs)
+            return query(**kwargs)
+
+        client.query = _query
+        repo.write(product_team)
+        repo.read(id=product_team.id)
+
+    assert ["ReturnConsumedCapacity" in call for call in calls] == [False]
@@ -0,0 +1,96 @@
+from unittest import mock
+
+import pytest
+from botocore.exceptions import ClientError
+from domain.core.root import Root
+from domain.repository.errors import UnhandledTransaction
+from domain.repository.product_team_repository import ProductTeamRepository
+from event.aws.retry import RetryPolicy, retry_budget
+
+from test_helpers.dynamodb import mock_table_cpm
+from test_helpers.sample_data import CPM_PRODUCT_TEAM_NO_ID
+
+TABLE_NAME = "my_table"
+TRANSACTION_CONFLICT = ClientError(
+    error_response={
+        "Error": {"Code": "TransactionCanceledException", "Message": "Conflict"},
+        "CancellationReasons": [{"Code": "TransactionConflict"}],
+    },
+    operation_name="TransactWriteItems",
+)
+THROTTLED = ClientError(
+    error_response={"Error": {"Code": "ThrottlingException", "Message": "Slow down"}},
+    operation_name="Query",
+)
+
+
+def _create_product_team():
+    org = Root.create_ods_organisation(ods_code=CPM_PRODUCT_TEAM_NO_ID["ods_code"])
+    return org.create_product_team(
+        name=CPM_PRODUCT_TEAM_NO_ID["name"], keys=CPM_PRODUCT_TEAM_NO_ID["keys"]
+    )
+
+
+def _fail_first(fn, error: ClientError, n_failures: int = 1):
+    calls = []
+
+    def _fn(**kwargs):
+        calls.append(kwargs)
+        if len(calls) <= n_failures:
+            raise error
+        return fn(**kwargs)
+
+    _fn.__name__ = fn.__name__
+    return _fn, calls
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+@mock.patch("event.aws.retry.time.sleep")
+def test_repository_write_retries_transaction_conflicts(mocked_sleep, max_workers):
+    product_team = _create_product_team()
+
+    with mock_table_cpm(TABLE_NAME) as client, retry_budget() as budget:
+        repo = ProductTeamRepository(table_name=TABLE_NAME, dynamodb_client=client)
+        client.transact_write_items, calls = _fail_first(
+            client.transact_write_items, error=TRANSACTION_CONFLICT
+        )
+        repo.write(product_team, max_workers=max_workers)
+
+        # The retry is the same transaction, including its idempotency token
+        assert len(calls) == 2
+        assert calls[0] == calls[1]
+        assert repo.read(id=product_team.id) == product_team
+
+    assert mocked_sleep.call_count == 1
+    assert budget.stats()["retries"] == {"transact_write_items": 1}
+
+
+@mock.patch("event.aws.retry.time.sleep")
+def test_repository_write_gives_up_after_max_attempts(mocked_sleep):
+    product_team = _create_product_team()
+
+    with mock_table_cpm(TABLE_NAME) as client:
+        repo = ProductTeamRepository(table_name=TABLE_NAME, dynamodb_client=client)
+        repo.retry_policy = RetryPolicy(max_attempts=2)
+        client.transact_write_items, calls = _fail_first(
+            client.transact_write_items, error=TRANSACTION_CONFLICT, n_failures=2
+        )
+        with pytest.raises(UnhandledTransaction):
+            repo.write(product_team)
+
+    assert len(calls) == 2
+
+
+@mock.patch("event.aws.retry.time.sleep")
+def test_repository_read_retries_throttling(mocked_sleep):
+    product_team = _create_product_team()
+
+    with mock_table_cpm(TABLE_NAME) as client:
+        repo = ProductTeamRepository(table_name=TABLE_NAME, dynamodb_client=client)
+        repo.write(product_team)
+        client.query, calls = _fail_first(client.query, error=THROTTLED)
+
+        assert repo.read(id=product_team.id) == product_team
+
+    assert len(calls) == 2
+    assert mocked_sleep.call_count == 1
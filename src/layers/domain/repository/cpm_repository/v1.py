@@ -1,34 +1,72 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextvars import copy_context
 from enum import StrEnum
 from itertools import batched, chain
-from typing import TYPE_CHECKING, Generator, Iterable
+from typing import TYPE_CHECKING, Callable, Generator, Iterable, Iterator
+from uuid import UUID, uuid4, uuid5
 
 from domain.core.aggregate_root import AggregateRoot
-from domain.core.enum import EntityType
-from domain.repository.errors import ItemNotFound
+from domain.core.enum import EntityType, Status
+from domain.repository.cpm_repository.active_index import (
+    ACTIVE_GSI_MAPPING,
+    ACTIVE_KEY_ATTRIBUTES,
+    active_key_attributes,
+)
+from domain.repository.cpm_repository.aio import AsyncRepository
+from domain.repository.errors import ItemNotFound, UnprocessedKeys
+from domain.repository.hydration import hydrate
 from domain.repository.keys import KEY_SEPARATOR, TableKey
 from domain.repository.marshall import marshall, unmarshall
+from domain.repository.pagination import decode_page_token, encode_page_token
 from domain.repository.transaction import (
     ConditionExpression,
     Transaction,
     TransactionStatement,
     TransactItem,
+    active_condition_check,
+    dynamodb_projection_expression,
     handle_client_errors,
     update_transactions,
 )
+from event.aws.metrics import return_consumed_capacity
+from event.aws.retry import (
+    DEFAULT_RETRY_POLICY,
+    RetryPolicy,
+    current_retry_budget,
+    exponential_backoff_with_jitter,
+)
 
 if TYPE_CHECKING:
     from mypy_boto3_dynamodb import DynamoDBClient
     from mypy_boto3_dynamodb.type_defs import TransactWriteItemsOutputTypeDef
 
 BATCH_SIZE = 100
-
-pk_gsi_mapping = {"idx_gsi_read_1": "pk_read_1", "idx_gsi_read_2": "pk_read_2"}
-
-sk_gsi_mapping = {"idx_gsi_read_1": "sk_read_1", "idx_gsi_read_2": "sk_read_2"}
-
-
-class TooManyResults(Exception):
-    pass
+BATCH_GET_SIZE = 100
+BATCH_GET_MAX_RETRIES = 5
+# Key-disjoint transaction chunks are written serially unless this is raised
+MAX_WRITE_WORKERS = 1
+# Rows are written by this repository, so skip re-validating them on read
+TRUSTED_HYDRATION = True
+# Set to "true" to search for active items on the sparse active indexes rather
+# than with a status filter, only once the keys of existing active items have
+# been backfilled (see active_index.backfill_active_keys)
+ACTIVE_INDEX_READS = "ACTIVE_INDEX_READS"
+
+pk_gsi_mapping = {
+    "idx_gsi_read_1": "pk_read_1",
+    "idx_gsi_read_2": "pk_read_2",
+    "idx_gsi_active": "pk_active",
+    "idx_gsi_active_read_2": "pk_active_read_2",
+}
+
+sk_gsi_mapping = {
+    "idx_gsi_read_1": "sk_read_1",
+    "idx_gsi_read_2": "sk_read_2",
+    "idx_gsi_active": "sk",
+    "idx_gsi_active_read_2": "sk_read_2",
+}
 
 
 class QueryType(StrEnum):
@@ -36,16 +74,18 @@ class QueryType(StrEnum):
     BEGINS_WITH = "begins_with({}, {})"
 
 
+def _transact_item_key(transact_item: TransactItem) -> tuple[str, str]:
+    transaction_statement = transact_item.statement
+    item = transaction_statement.Key or transaction_statement.Item
+    return (item["pk"]["S"], item["sk"]["S"])
+
+
 def _split_transactions_by_key(
     transact_items: Iterable[TransactItem], n_max: int
 ) -> Generator[list[TransactItem], None, None]:
     buffer, keys = [], set()
     for transact_item in transact_items:
-        transaction_statement = (
-            transact_item.Put or transact_item.Delete or transact_item.Update
-        )
-        item = transaction_statement.Key or transaction_statement.Item
-        key = (item["pk"]["S"], item["sk"]["S"])
+        key = _transact_item_key(transact_item)
         if key in keys:
             yield from batched(buffer, n=n_max)
             buffer, keys = [], set()
@@ -54,15 +94,102 @@ def _split_transactions_by_key(
     yield from batched(buffer, n=n_max)
 
 
+def _split_chunks_into_waves(
+    chunks: Iterable[list[TransactItem]],
+) -> list[list[tuple[int, list[TransactItem]]]]:
+    """
+    Group (index, chunk) into waves that must be written in order. Each chunk
+    is placed in the wave after the latest chunk that it shares a key with, so
+    that the chunks within a wave are key-disjoint and can be written in any
+    order, whilst writes to the same key keep their original order.
+    """
+    waves: list[list[tuple[int, list[TransactItem]]]] = []
+    wave_by_key: dict[tuple[str, str], int] = {}
+    for index, chunk in enumerate(chunks):
+        keys = set(map(_transact_item_key, chunk))
+        wave = max((wave_by_key.get(key, -1) for key in keys), default=-1) + 1
+        if wave == len(waves):
+            waves.append([])
+        waves[wave].append((index, chunk))
+        wave_by_key.update(dict.fromkeys(keys, wave))
+    return waves
+
+
+def client_request_token(write_id: UUID, index: int) -> str:
+    """
+    Idempotency token for the index'th chunk of a write, so that retrying the
+    chunk within DynamoDB's ten minute idempotency window will not apply it
+    twice. Tokens are unique to each write, so that writing the same items
+    again is still rejected by the condition expressions.
+    """
+    return str(uuid5(write_id, str(index)))
+
+
+def _active_index_reads() -> bool:
+    return os.environ.get(ACTIVE_INDEX_READS, "").lower() == "true"
+
+
+def _consumed_capacity_args() -> dict:
+    # Requests are left unchanged unless consumed capacity is being collected
+    return_capacity = return_consumed_capacity()
+    if return_capacity == "NONE":
+        return {}
+    return {"ReturnConsumedCapacity": return_capacity}
+
+
 def transact_write_chunk(
-    client: "DynamoDBClient", chunk: list[TransactItem]
+    client: "DynamoDBClient",
+    chunk: list[TransactItem],
+    client_request_token: str = None,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
 ) -> "TransactWriteItemsOutputTypeDef":
-    transaction = Transaction(TransactItems=chunk)
+    transaction = Transaction(
+        TransactItems=chunk,
+        ClientRequestToken=client_request_token,
+        ReturnConsumedCapacity=return_consumed_capacity(),
+    )
     with handle_client_errors(commands=chunk):
-        _response = client.transact_write_items(**transaction.dict(exclude_none=True))
+        _response = retry_policy.call(
+            client.transact_write_items, **transaction.dict(exclude_none=True)
+        )
     return _response
 
 
+def batch_get_chunk(
+    client: "DynamoDBClient",
+    table_name: str,
+    keys: list[dict],
+    max_retries: int = BATCH_GET_MAX_RETRIES,
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+) -> list[dict]:
+    """
+    Read up to BATCH_GET_SIZE items by primary key, retrying any UnprocessedKeys
+    (e.g. due to throttling or the 16 MB response limit) with backoff.
+    """
+    items = []
+    request_items = {table_name: {"Keys": keys}}
+    n_retries = 0
+    while True:
+        response = retry_policy.call(
+            client.batch_get_item,
+            RequestItems=request_items,
+            **_consumed_capacity_args(),
+        )
+        items.extend(response["Responses"].get(table_name, []))
+        request_items = response.get("UnprocessedKeys")
+        if not request_items:
+            return items
+        delay = exponential_backoff_with_jitter(n_retries=n_retries)
+        budget = current_retry_budget()
+        if n_retries == max_retries or (budget and not budget.allows(delay)):
+            raise UnprocessedKeys(
+                n_unprocessed_keys=len(request_items[table_name]["Keys"]),
+                n_retries=n_retries,
+            )
+        time.sleep(delay)
+        n_retries += 1
+
+
 class Repository[ModelType: AggregateRoot]:
 
     def __init__(
@@ -79,10 +206,32 @@ class Repository[ModelType: AggregateRoot]:
         self.batch_size = BATCH_SIZE
         self.parent_table_keys = parent_table_keys
         self.table_key = table_key
+        self.trusted_hydration = TRUSTED_HYDRATION
+        self.max_write_workers = MAX_WRITE_WORKERS
+        self.retry_policy = DEFAULT_RETRY_POLICY
+        self.active_index_reads = _active_index_reads()
+
+    @property
+    def aio(self) -> AsyncRepository[ModelType]:
+        """This repository's methods, as coroutines run in worker threads"""
+        return AsyncRepository(self)
+
+    def _hydrate(self, item: dict) -> ModelType:
+        if self.trusted_hydration:
+            return hydrate(self.model, item)
+        return self.model(**item)
 
-    def write(self, entity: ModelType, batch_size=None):
-        batch_size = batch_size or self.batch_size
+    def _loader(self, fields: list[str] = None) -> Callable[[dict], ModelType | dict]:
+        """
+        Items are hydrated into models, unless only some 'fields' were
+        projected, in which case just those fields of the item are returned.
+        The stored values are already in the form in which they are rendered.
+        """
+        if fields is None:
+            return self._hydrate
+        return lambda item: {field: item.get(field) for field in fields}
 
+    def _transact_items(self, entity: ModelType) -> Iterator[TransactItem]:
         def generate_transaction_statements(event):
             handler_name = f"handle_{type(event).__name__}"
             handler = getattr(self, handler_name)
@@ -93,18 +242,77 @@ class Repository[ModelType: AggregateRoot]:
 
             return transact_items
 
-        transact_items = chain.from_iterable(
+        return chain.from_iterable(
             (generate_transaction_statements(event) for event in entity.events)
         )
 
+    def write(
+        self,
+        entity: ModelType,
+        batch_size=None,
+        max_workers=None,
+        condition_checks: Iterable[TransactItem] = (),
+    ):
+        """
+        Write the entity's events as DynamoDB transactions of up to
+        'batch_size' items. Any 'condition_checks' (e.g. that the entity's
+        parent is still active) are made in the first transaction, so they only
+        guard the whole write if it fits into a single transaction. If
+        'max_workers' (or self.max_write_workers) is more than one, then
+        chunks that do not share any keys are written concurrently: a chunk
+        is only written once every earlier chunk that shares a key with it has
+        been written. As with serial writes, no further chunks are written
+        once a chunk has failed, although key-disjoint chunks that were
+        already in flight may have succeeded.
+        """
+        batch_size = batch_size or self.batch_size
+        max_workers = max_workers or self.max_write_workers
+
+        transact_items = chain(condition_checks, self._transact_items(entity))
+
+        write_id = uuid4()
+        chunks = _split_transactions_by_key(transact_items, batch_size)
+        if max_workers > 1:
+            return self._write_chunks_concurrently(
+                chunks=chunks, max_workers=max_workers, write_id=write_id
+            )
+
         responses = [
-            transact_write_chunk(client=self.client, chunk=transact_item_chunk)
-            for transact_item_chunk in _split_transactions_by_key(
-                transact_items, batch_size
+            transact_write_chunk(
+                client=self.client,
+                chunk=transact_item_chunk,
+                client_request_token=client_request_token(write_id, index),
+                retry_policy=self.retry_policy,
             )
+            for index, transact_item_chunk in enumerate(chunks)
         ]
         return responses
 
+    def _write_chunks_concurrently(
+        self, chunks: Iterable[list[TransactItem]], max_workers: int, write_id: UUID
+    ) -> list["TransactWriteItemsOutputTypeDef"]:
+        waves = _split_chunks_into_waves(chunks)
+        responses = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for wave in waves:
+                futures = {
+                    # Each chunk runs in a copy of this context to share its RetryBudget
+                    index: executor.submit(
+                        copy_context().run,
+                        transact_write_chunk,
+                        client=self.client,
+                        chunk=chunk,
+                        client_request_token=client_request_token(write_id, index),
+                        retry_policy=self.retry_policy,
+                    )
+                    for index, chunk in wave
+                }
+                # Wait for the whole wave, then raise the first error in chunk order
+                wait(futures.values())
+                for index, future in futures.items():
+                    responses[index] = future.result()
+        return [responses[index] for index in sorted(responses)]
+
     def create_index(
         self,
         id: str,
@@ -145,6 +353,8 @@ class Repository[ModelType: AggregateRoot]:
             item_data["pk_read_2"] = TableKey.ORG_CODE.key(data["ods_code"])
             item_data["sk_read_2"] = sort_key
 
+        item_data.update(active_key_attributes(item_data))
+
         return TransactItem(
             Put=TransactionStatement(
                 TableName=self.table_name,
@@ -160,8 +370,17 @@ class Repository[ModelType: AggregateRoot]:
             ]
         else:
             primary_keys = [marshall(pk=pk, sk=pk)]
+        # Inactive items are removed from the sparse active indexes
+        removed_fields = (
+            list(ACTIVE_KEY_ATTRIBUTES.values())
+            if data.get("status", Status.ACTIVE) != Status.ACTIVE
+            else []
+        )
         return update_transactions(
-            table_name=self.table_name, primary_keys=primary_keys, data=data
+            table_name=self.table_name,
+            primary_keys=primary_keys,
+            data=data,
+            removed_fields=removed_fields,
         )
 
     def delete_index(self, id: str):
@@ -174,17 +393,36 @@ class Repository[ModelType: AggregateRoot]:
             )
         )
 
-    def _query(
+    def active_condition_check(self, id: str) -> TransactItem:
+        """Condition that the root item with this id exists and is active"""
+        pk = self.table_key.key(id)
+        return active_condition_check(
+            table_name=self.table_name, key=marshall(pk=pk, sk=pk)
+        )
+
+    def _query_args(
         self,
         parent_ids: tuple[str],
         id: str = None,
         status: str = "all",
         gsi: str = None,
         sk_prefix: str = None,
-    ) -> list[dict]:
+        parent_table_keys: tuple[TableKey] = None,
+        fields: list[str] = None,
+    ) -> dict:
         """
-        Perform a query on the table with optional GSI and sk_prefix.
+        Build the arguments for a query on the table with optional GSI and
+        sk_prefix, optionally projecting only the given fields. Searches for
+        active items query the equivalent sparse active index, rather than
+        filtering out the inactive items after they have been read.
         """
+        if (
+            self.active_index_reads
+            and status == Status.ACTIVE
+            and id is None
+            and gsi in ACTIVE_GSI_MAPPING
+        ):
+            gsi, status = ACTIVE_GSI_MAPPING[gsi], "all"
 
         if gsi == "idx_gsi_read_1":
             pk = self.table_key.key(id)
@@ -195,9 +433,11 @@ class Repository[ModelType: AggregateRoot]:
             sk_condition = sk_query_type.format(sk_attribute_name, ":sk")
         else:
             # Ensure parent_ids are prefixed only once
+            if parent_table_keys is None:
+                parent_table_keys = self.parent_table_keys
             pk = KEY_SEPARATOR.join(
                 _id if _id.startswith(table_key.key("")) else table_key.key(_id)
-                for table_key, _id in zip(self.parent_table_keys, parent_ids)
+                for table_key, _id in zip(parent_table_keys, parent_ids)
             )
             pk_attribute_name = pk_gsi_mapping.get(gsi, "pk")
 
@@ -224,10 +464,65 @@ class Repository[ModelType: AggregateRoot]:
             args["ExpressionAttributeValues"][":status"] = {"S": status}
             # status is a reserved keyword so we need to alias it.
             args["ExpressionAttributeNames"] = {"#status": "status"}
-        result = self.client.query(**args)
-        if "LastEvaluatedKey" in result:
-            raise TooManyResults(f"Too many results for query ({(*parent_ids, id)})")
-        return list(map(unmarshall, result["Items"]))
+
+        if fields:
+            projection = dynamodb_projection_expression(fields)
+            args["ProjectionExpression"] = projection["ProjectionExpression"]
+            args["ExpressionAttributeNames"] = {
+                **args.get("ExpressionAttributeNames", {}),
+                **projection["ExpressionAttributeNames"],
+            }
+        return args
+
+    def _query_pages(
+        self, args: dict, exclusive_start_key: dict = None, limit: int = None
+    ) -> Generator[tuple[list[dict], dict | None], None, None]:
+        """
+        Follow LastEvaluatedKey through the result set, yielding each page of
+        items along with the key to resume from (None on the final page). If a
+        limit is provided then at most 'limit' items are evaluated in total.
+        """
+        remaining = limit
+        while True:
+            page_args = {**args, **_consumed_capacity_args()}
+            if exclusive_start_key:
+                page_args["ExclusiveStartKey"] = exclusive_start_key
+            if remaining is not None:
+                page_args["Limit"] = remaining
+
+            result = self.retry_policy.call(self.client.query, **page_args)
+            exclusive_start_key = result.get("LastEvaluatedKey")
+            yield list(map(unmarshall, result["Items"])), exclusive_start_key
+
+            if remaining is not None:
+                remaining -= result["ScannedCount"]
+            if not exclusive_start_key or remaining == 0:
+                break
+
+    def _query(
+        self,
+        parent_ids: tuple[str],
+        id: str = None,
+        status: str = "all",
+        gsi: str = None,
+        sk_prefix: str = None,
+        parent_table_keys: tuple[TableKey] = None,
+        fields: list[str] = None,
+    ) -> list[dict]:
+        """
+        Perform a query on the table with optional GSI and sk_prefix, reading
+        all pages of the result set.
+        """
+        args = self._query_args(
+            parent_ids=parent_ids,
+            id=id,
+            status=status,
+            gsi=gsi,
+            sk_prefix=sk_prefix,
+            parent_table_keys=parent_table_keys,
+            fields=fields,
+        )
+        return [item for items, _ in self._query_pages(args=args) for item in items]
 
     def _search(
         self,
@@ -235,6 +530,7 @@ class Repository[ModelType: AggregateRoot]:
         gsi: str = None,
         sk_prefix: str = None,
         status: str = "all",
+        parent_table_keys: tuple[TableKey] = None,
     ) -> list[ModelType]:
         """
         Perform a search query with optional GSI and sk_prefix.
@@ -243,19 +539,114 @@ class Repository[ModelType: AggregateRoot]:
             "parent_ids": parent_ids,
             "sk_prefix": sk_prefix,
             "status": status,
+            "parent_table_keys": parent_table_keys,
         }
 
         # If a GSI is provided, include it in the query parameters
         if gsi:
             query_params["gsi"] = gsi
 
-        return [self.model(**item) for item in self._query(**query_params)]
+        return list(map(self._hydrate, self._query(**query_params)))
+
+    def _search_pages(
+        self,
+        parent_ids: tuple[str],
+        page_size: int,
+        page_token: str = None,
+        gsi: str = None,
+        sk_prefix: str = None,
+        status: str = "all",
+        parent_table_keys: tuple[TableKey] = None,
+        fields: list[str] = None,
+    ) -> Iterator[tuple[list[ModelType | dict], str | None]]:
+        """
+        Perform a search query with optional GSI and sk_prefix, evaluating at
+        most 'page_size' items. The results are lazily yielded a DynamoDB page
+        at a time, each along with an opaque token for resuming the search
+        after that page, which is None once the search is exhausted. The
+        page_token is validated up front, rather than on first iteration.
+        If 'fields' are provided then only those fields of each item are read.
+        """
+        args = self._query_args(
+            parent_ids=parent_ids,
+            status=status,
+            gsi=gsi,
+            sk_prefix=sk_prefix,
+            parent_table_keys=parent_table_keys,
+            fields=fields,
+        )
+        gsi = args.get("IndexName")
+        pk_attribute_name = pk_gsi_mapping.get(gsi, "pk")
+        key_attributes = {"pk", "sk"}
+        if gsi:
+            key_attributes |= {pk_gsi_mapping[gsi], sk_gsi_mapping[gsi]}
+
+        exclusive_start_key = None
+        if page_token:
+            exclusive_start_key = decode_page_token(
+                page_token=page_token,
+                key_attributes=key_attributes,
+                partition_key=(
+                    pk_attribute_name,
+                    args["ExpressionAttributeValues"][":pk"]["S"],
+                ),
+            )
+
+        pages = self._query_pages(
+            args=args, exclusive_start_key=exclusive_start_key, limit=page_size
+        )
+        load = self._loader(fields=fields)
+        return (
+            (
+                list(map(load, items)),
+                encode_page_token(last_evaluated_key) if last_evaluated_key else None,
+            )
+            for items, last_evaluated_key in pages
+        )
+
+    @staticmethod
+    def _collect_pages(
+        pages: Iterable[tuple[list[ModelType], str | None]],
+    ) -> tuple[list[ModelType], str | None]:
+        results, next_page_token = [], None
+        for models, next_page_token in pages:
+            results.extend(models)
+        return results, next_page_token
+
+    def _read_many(
+        self, keys: list[tuple[str, str]], status: str = "all"
+    ) -> list[ModelType | None]:
+        """
+        Read items by their (pk, sk) in batches of BATCH_GET_SIZE. Results are
+        returned in request order, with None for keys that were not found (or
+        do not match the requested status).
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        items_by_key = {}
+        for chunk in batched(unique_keys, n=BATCH_GET_SIZE):
+            items = batch_get_chunk(
+                client=self.client,
+                table_name=self.table_name,
+                keys=[marshall(pk=pk, sk=sk) for pk, sk in chunk],
+                retry_policy=self.retry_policy,
+            )
+            for item in map(unmarshall, items):
+                if status == "all" or item["status"] == status:
+                    items_by_key[(item["pk"], item["sk"])] = item
+
+        models_by_key = {key: self._hydrate(item) for key, item in items_by_key.items()}
+        return [models_by_key.get(key) for key in keys]
 
     def _read(
-        self, parent_ids: tuple[str], id: str, status: str = "all", gsi: str = None
-    ) -> ModelType:
+        self,
+        parent_ids: tuple[str],
+        id: str,
+        status: str = "all",
+        gsi: str = None,
+        fields: list[str] = None,
+    ) -> ModelType | dict:
         items = self._query(
-            parent_ids=parent_ids or (id,), id=id, status=status, gsi=gsi
+            parent_ids=parent_ids or (id,), id=id, status=status, gsi=gsi, fields=fields
         )
         try:
             (item,) = items
@@ -263,4 +654,4 @@ class Repository[ModelType: AggregateRoot]:
             if id in parent_ids:
                 raise ItemNotFound(id, item_type=self.model)
             raise ItemNotFound(*filter(bool, parent_ids), id, item_type=self.model)
-        return self.model(**item)
+        return self._loader(fields=fields)(item)
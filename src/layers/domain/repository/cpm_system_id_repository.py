@@ -1,4 +1,7 @@
+from threading import Lock
+
 from domain.core.cpm_system_id import CpmSystemId
+from domain.core.cpm_system_id.pool import IdPool
 
 from .cpm_repository import Repository
 from .keys import TableKey
@@ -19,7 +22,7 @@ class CpmSystemIdRepository[T](Repository[T]):
     def read(self) -> T:
         pk = TableKey.CPM_SYSTEM_ID.key(self.model.__name__)
         args = {"TableName": self.table_name, "Key": marshall(pk=pk, sk=pk)}
-        result = self.client.get_item(**args)
+        result = self.retry_policy.call(self.client.get_item, **args)
 
         try:
             item = result["Item"]
@@ -29,6 +32,23 @@ class CpmSystemIdRepository[T](Repository[T]):
         entry = unmarshall(item)
         return self.model(__root__=entry["latest_system_id"])
 
+    def reserve_pool_positions(self, size: int) -> range:
+        """
+        Atomically reserve the next 'size' positions in the pool of
+        pre-generated ids for this model, which no other caller will receive
+        """
+        pk = marshall_value(TableKey.CPM_SYSTEM_ID.key(self.model.__name__))
+        kwargs = {
+            "TableName": self.table_name,
+            "Key": {"pk": pk, "sk": pk},
+            "UpdateExpression": "ADD pool_position :size",
+            "ExpressionAttributeValues": {":size": marshall_value(size)},
+            "ReturnValues": "UPDATED_NEW",
+        }
+        result = self.retry_policy.call(self.client.update_item, **kwargs)
+        stop = unmarshall(result["Attributes"])["pool_position"]
+        return range(stop - size, stop)
+
     def create_or_update(self, new_cpm_system_id) -> CpmSystemId:
         pk = marshall_value(TableKey.CPM_SYSTEM_ID.key(self.model.__name__))
         item_key = {"pk": pk, "sk": pk}
@@ -40,5 +60,47 @@ class CpmSystemIdRepository[T](Repository[T]):
                 ":new_value": marshall_value(new_cpm_system_id),
             },
         }
-        result = self.client.update_item(**kwargs)
+        result = self.retry_policy.call(self.client.update_item, **kwargs)
         return result
+
+
+POOL_BLOCK_SIZE = 16
+
+
+class IdPoolReservations:
+    """
+    Hands out ids from a pre-generated IdPool, shared by every lambda container.
+    Positions in the pool are reserved a block at a time with an atomic counter,
+    so that ids are unique across containers whilst only one DynamoDB write is
+    made per 'block_size' ids. Any unused positions of a block are lost when
+    the container is recycled.
+    """
+
+    def __init__(
+        self,
+        pool: IdPool,
+        repository: CpmSystemIdRepository,
+        block_size: int = POOL_BLOCK_SIZE,
+    ):
+        self.pool = pool
+        self.repository = repository
+        self.block_size = block_size
+        self.exhausted = False
+        self._positions = iter(())
+        self._lock = Lock()
+
+    def next_id(self) -> int | None:
+        """The next reserved id from the pool, or None if it is exhausted"""
+        with self._lock:
+            if self.exhausted:
+                return None
+            position = next(self._positions, None)
+            if position is None:
+                self._positions = iter(
+                    self.repository.reserve_pool_positions(size=self.block_size)
+                )
+                position = next(self._positions)
+            if position >= len(self.pool):
+                self.exhausted = True
+                return None
+        return self.pool[position]
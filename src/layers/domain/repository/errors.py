@@ -1,3 +1,4 @@
+from domain.core.error import NotFoundError
 from pydantic import BaseModel
 
 
@@ -16,6 +17,11 @@ class AlreadyExistsError(Exception):
         super().__init__(msg or "Item already exists")
 
 
+class ItemNotActive(NotFoundError):
+    def __init__(self, msg=None):
+        super().__init__(msg or "Item does not exist or is not active")
+
+
 class UnhandledTransaction(Exception):
     def __init__(
         self, message: str, code: str, unhandled_transactions: list[BaseModel]
@@ -24,3 +30,15 @@ class UnhandledTransaction(Exception):
             item.json(exclude_none=True) for item in unhandled_transactions
         )
         super().__init__(f"{code}: {message}\n{_unhandled_transactions}")
+
+
+class InvalidPageToken(ValueError):
+    def __init__(self, page_token: str):
+        super().__init__(f"Invalid page token '{page_token}'")
+
+
+class UnprocessedKeys(Exception):
+    def __init__(self, n_unprocessed_keys: int, n_retries: int):
+        super().__init__(
+            f"{n_unprocessed_keys} keys were not processed after {n_retries} retries"
+        )
@@ -0,0 +1,98 @@
+from datetime import datetime
+from enum import Enum
+from functools import cache
+from typing import Any, Callable
+
+from pydantic import BaseModel
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+
+ROOT_FIELD = "__root__"
+HYDRATION_ERRORS = (TypeError, ValueError, KeyError, AttributeError)
+
+type Converter = Callable[[Any], Any]
+
+
+def _identity(value):
+    return value
+
+
+def _to_datetime(value):
+    return datetime.fromisoformat(value) if type(value) is str else value
+
+
+def _to_enum(enum: type[Enum]) -> Converter:
+    def _convert(value):
+        return value if value is None else enum(value)
+
+    return _convert
+
+
+def _to_model(model: type[BaseModel]) -> Converter:
+    if ROOT_FIELD in model.__fields__:
+        return lambda value: model.construct(__root__=value)
+    return lambda value: value if value is None else construct(model, value)
+
+
+def _field_converter(field: ModelField) -> Converter:
+    _type = field.type_
+    if not isinstance(_type, type):
+        return _identity
+
+    if issubclass(_type, BaseModel):
+        convert = _to_model(_type)
+    elif issubclass(_type, Enum):
+        convert = _to_enum(_type)
+    elif issubclass(_type, datetime):
+        convert = _to_datetime
+    else:
+        return _identity
+
+    if field.shape == SHAPE_SINGLETON:
+        return convert
+    if field.shape == SHAPE_LIST:
+        return lambda values: values if values is None else list(map(convert, values))
+    raise TypeError(f"Unable to hydrate field '{field.name}' of shape {field.shape}")
+
+
+@cache
+def _converters(model: type[BaseModel]) -> dict[str, Converter]:
+    return {
+        name: _field_converter(field)
+        for name, field in model.__fields__.items()
+        if field.field_info.exclude is not True
+    }
+
+
+@cache
+def _required_fields(model: type[BaseModel]) -> frozenset[str]:
+    return frozenset(name for name, field in model.__fields__.items() if field.required)
+
+
+def construct[ModelType: BaseModel](model: type[ModelType], data: dict) -> ModelType:
+    """
+    Build the model from data without running validation, converting nested
+    models, enums and datetimes to their field types. Only suitable for data
+    that has already been validated, i.e. rows that we wrote ourselves.
+    Attributes that are not fields of the model are dropped.
+    """
+    missing_fields = _required_fields(model).difference(data)
+    if missing_fields:
+        raise KeyError(", ".join(sorted(missing_fields)))
+
+    fields = {
+        name: convert(data[name])
+        for name, convert in _converters(model).items()
+        if name in data
+    }
+    return model.construct(**fields)
+
+
+def hydrate[ModelType: BaseModel](model: type[ModelType], data: dict) -> ModelType:
+    """
+    Trusted construction of the model from data, falling back to full
+    validation if the data does not fit the shape of the model
+    """
+    try:
+        return construct(model, data)
+    except HYDRATION_ERRORS:
+        return model(**data)
@@ -1,50 +1,88 @@
-from typing import Any
+from typing import Any, Callable
 
 from .errors import UnableToUnmarshall
 
-MARSHALL_FUNCTION_BY_TYPE = {
+
+def _marshall_string(x) -> dict:
+    return {"S": str(x)}
+
+
+def _marshall_number(x) -> dict:
+    return {"N": str(x)}
+
+
+def _marshall_list(x) -> dict:
+    return {"L": [marshall_value(item) for item in x]}
+
+
+def _marshall_set(x) -> dict:
+    """Non-empty sets of strings or numbers become SS or NS, otherwise L"""
+    types = set(map(type, x))
+    if types == {str}:
+        return {"SS": list(x)}
+    if types and types <= {int, float}:
+        return {"NS": list(map(str, x))}
+    return _marshall_list(x)
+
+
+def _marshall_mapping(x) -> dict:
+    return {"M": {k: marshall_value(v) for (k, v) in x.items()}}
+
+
+MARSHALL_FUNCTION_BY_TYPE: dict[type, Callable[[Any], dict]] = {
     type(None): (lambda _: {"NULL": True}),
+    str: _marshall_string,
     bool: (lambda x: {"BOOL": x}),
-    int: (lambda x: {"N": str(x)}),
-    float: (lambda x: {"N": str(x)}),
-    set: (lambda x: {"L": [marshall_value(item) for item in x]}),
-    list: (lambda x: {"L": [marshall_value(item) for item in x]}),
-    tuple: (lambda x: {"L": [marshall_value(item) for item in x]}),
-    dict: (lambda x: {"M": {k: marshall_value(v) for (k, v) in x.items()}}),
+    int: _marshall_number,
+    float: _marshall_number,
+    set: _marshall_set,
+    frozenset: _marshall_set,
+    list: _marshall_list,
+    tuple: _marshall_list,
+    dict: _marshall_mapping,
 }
 
 
 def marshall_value(value) -> dict:
-    fn = MARSHALL_FUNCTION_BY_TYPE.get(type(value), (lambda x: {"S": str(x)}))
+    if type(value) is str:  # fast path for the most common type
+        return {"S": value}
+    fn = MARSHALL_FUNCTION_BY_TYPE.get(type(value), _marshall_string)
     return fn(value)
 
 
 def marshall(**data) -> dict:
-    return marshall_value(data)["M"]
+    return {k: marshall_value(v) for (k, v) in data.items()}
 
 
-def _unmarshall_mapping(mapping: dict[str, dict[str, Any]]) -> dict[str, Any]:
-    return {k: unmarshall_value(v) for (k, v) in mapping["M"].items()}
+def _unmarshall_number(value: str) -> int | float:
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+UNMARSHALL_FUNCTION_BY_TYPE_NAME: dict[str, Callable[[Any], Any]] = {
+    "NULL": (lambda _: None),
+    "S": str,
+    "BOOL": bool,
+    "N": _unmarshall_number,
+    "L": (lambda value: list(map(unmarshall_value, value))),
+    "M": (lambda value: {k: unmarshall_value(v) for (k, v) in value.items()}),
+    "SS": set,
+    "NS": (lambda value: set(map(_unmarshall_number, value))),
+}
 
 
 def unmarshall_value(record: dict[str, str | dict | list]):
-    ((_type_name, value),) = record.items()
-    match _type_name:
-        case "NULL":
-            return None
-        case "S":
-            return str(value)
-        case "BOOL":
-            return bool(value)
-        case "N":
-            return int(value) if value.isdigit() else float(value)
-        case "L":
-            return list(map(unmarshall_value, value))
-        case "M":
-            return _unmarshall_mapping(mapping=record)
-        case _:
-            raise UnableToUnmarshall(f"Unhandled record {record}")
+    if "S" in record:  # fast path for the most common type
+        return record["S"]
+    for _type_name, value in record.items():
+        fn = UNMARSHALL_FUNCTION_BY_TYPE_NAME.get(_type_name)
+        if fn is None or len(record) > 1:
+            break
+        return fn(value)
+    raise UnableToUnmarshall(f"Unhandled record {record}")
 
 
 def unmarshall(record) -> dict[str, Any]:
-    return _unmarshall_mapping({"M": record})
+    return {k: unmarshall_value(v) for (k, v) in record.items()}
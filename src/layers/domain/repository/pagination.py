@@ -0,0 +1,76 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as Base64Error
+
+import orjson
+from domain.repository.errors import InvalidPageToken
+
+
+def encode_page_token(last_evaluated_key: dict) -> str:
+    """
+    Render DynamoDB's LastEvaluatedKey as an opaque, url-safe continuation
+    token. The key is already in DynamoDB's marshalled form, so it can be
+    handed straight back as an ExclusiveStartKey.
+    """
+    serialised = orjson.dumps(last_evaluated_key, option=orjson.OPT_SORT_KEYS)
+    return urlsafe_b64encode(serialised).decode().rstrip("=")
+
+
+def decode_page_token(
+    page_token: str, key_attributes: set[str], partition_key: tuple[str, str]
+) -> dict:
+    """
+    Reverse of 'encode_page_token'. The token is client-supplied, so it is only
+    accepted if it has exactly the key shape of the query being resumed and
+    belongs to the same partition.
+    """
+    padding = "=" * (-len(page_token) % 4)
+    try:
+        exclusive_start_key = orjson.loads(urlsafe_b64decode(page_token + padding))
+    except (Base64Error, ValueError):
+        raise InvalidPageToken(page_token)
+
+    if not isinstance(exclusive_start_key, dict) or set(exclusive_start_key) != (
+        key_attributes
+    ):
+        raise InvalidPageToken(page_token)
+
+    if not all(
+        isinstance(value, dict) and set(value) == {"S"} and isinstance(value["S"], str)
+        for value in exclusive_start_key.values()
+    ):
+        raise InvalidPageToken(page_token)
+
+    pk_attribute_name, pk = partition_key
+    if exclusive_start_key[pk_attribute_name]["S"] != pk:
+        raise InvalidPageToken(page_token)
+    return exclusive_start_key
+
+
+def encode_fan_out_page_token(page_tokens: dict[str, str]) -> str:
+    """
+    Combine the continuation tokens of several searches, keyed by the value
+    (e.g. organisation code) that each search was made for, into one token
+    """
+    serialised = orjson.dumps(page_tokens, option=orjson.OPT_SORT_KEYS)
+    return urlsafe_b64encode(serialised).decode().rstrip("=")
+
+
+def decode_fan_out_page_token(page_token: str, values: list[str]) -> dict[str, str]:
+    """
+    Reverse of 'encode_fan_out_page_token'. Each of the combined tokens is
+    validated when its search is resumed, so here only the shape of the token
+    is validated, and that it only resumes searches for the given 'values'.
+    """
+    padding = "=" * (-len(page_token) % 4)
+    try:
+        page_tokens = orjson.loads(urlsafe_b64decode(page_token + padding))
+    except (Base64Error, ValueError):
+        raise InvalidPageToken(page_token)
+
+    if not isinstance(page_tokens, dict) or not page_tokens:
+        raise InvalidPageToken(page_token)
+    if not set(page_tokens) <= set(values):
+        raise InvalidPageToken(page_token)
+    if not all(isinstance(token, str) for token in page_tokens.values()):
+        raise InvalidPageToken(page_token)
+    return page_tokens
@@ -0,0 +1,93 @@
+import time
+from collections import OrderedDict
+from weakref import WeakSet
+
+from domain.core.product_team import ProductTeam
+from domain.repository.hydration import hydrate
+from domain.repository.keys import TableKey
+
+PRODUCT_TEAM_CACHE_TTL_SECONDS = 60
+PRODUCT_TEAM_CACHE_MAX_SIZE = 1024
+
+# Every ProductTeamCache in this process, see 'clear_product_team_caches'
+_PRODUCT_TEAM_CACHES: "WeakSet[ProductTeamCache]" = WeakSet()
+
+
+class ProductTeamCache:
+    """
+    Read-through cache of active ProductTeams, intended to live for the lifetime
+    of a warm lambda container. Entries are keyed by the product team id
+    (PT#<id>) and by each of its aliases (PTA#<alias>), expire after 'ttl'
+    seconds and the least recently used entry is evicted beyond 'max_size'.
+
+    Deletions made in this container invalidate the relevant entries
+    immediately, whereas deletions made elsewhere are picked up once the
+    entry expires.
+    """
+
+    def __init__(
+        self,
+        ttl: float = PRODUCT_TEAM_CACHE_TTL_SECONDS,
+        max_size: int = PRODUCT_TEAM_CACHE_MAX_SIZE,
+    ):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        _PRODUCT_TEAM_CACHES.add(self)
+
+    @staticmethod
+    def _cache_keys(id: str) -> tuple[str, str]:
+        return (TableKey.PRODUCT_TEAM.key(id), TableKey.PRODUCT_TEAM_ALIAS.key(id))
+
+    def get(self, id: str) -> ProductTeam | None:
+        """Lookup by product team id or alias"""
+        now = time.monotonic()
+        for cache_key in self._cache_keys(id):
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                continue
+            expires_at, product_team_state = entry
+            if expires_at <= now:
+                del self._entries[cache_key]
+                continue
+            self._entries.move_to_end(cache_key)
+            self.hits += 1
+            # Return a fresh copy, since callers are free to mutate the result
+            return hydrate(ProductTeam, product_team_state)
+        self.misses += 1
+        return None
+
+    def put(self, product_team: ProductTeam):
+        entry = (time.monotonic() + self.ttl, product_team.state())
+        cache_keys = [TableKey.PRODUCT_TEAM.key(product_team.id)] + [
+            TableKey.PRODUCT_TEAM_ALIAS.key(key.key_value) for key in product_team.keys
+        ]
+        for cache_key in cache_keys:
+            self._entries[cache_key] = entry
+            self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, id: str, aliases: list[str] = ()):
+        cache_keys = [TableKey.PRODUCT_TEAM.key(id)] + [
+            TableKey.PRODUCT_TEAM_ALIAS.key(alias) for alias in aliases
+        ]
+        for cache_key in cache_keys:
+            self._entries.pop(cache_key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+def clear_product_team_caches():
+    """
+    Clear every ProductTeamCache in this process, e.g. when the table that
+    they were populated from has been replaced
+    """
+    for product_team_cache in list(_PRODUCT_TEAM_CACHES):
+        product_team_cache.clear()
@@ -0,0 +1,129 @@
+from unittest import mock
+
+import pytest
+from domain.core.root import Root
+from domain.repository.errors import ItemNotFound
+from domain.repository.product_team_repository import ProductTeamRepository
+from domain.repository.product_team_repository.cache import (
+    ProductTeamCache,
+    clear_product_team_caches,
+)
+
+from test_helpers.dynamodb import mock_table_cpm
+from test_helpers.sample_data import CPM_PRODUCT_TEAM_NO_ID
+
+TABLE_NAME = "my_table"
+(PRODUCT_TEAM_ALIAS,) = (key["key_value"] for key in CPM_PRODUCT_TEAM_NO_ID["keys"])
+
+
+def _create_product_team(name: str = CPM_PRODUCT_TEAM_NO_ID["name"], **kwargs):
+    org = Root.create_ods_organisation(ods_code=CPM_PRODUCT_TEAM_NO_ID["ods_code"])
+    return org.create_product_team(name=name, **kwargs)
+
+
+def test_product_team_cache_by_id_and_alias():
+    product_team = _create_product_team(keys=CPM_PRODUCT_TEAM_NO_ID["keys"])
+    product_team_cache = ProductTeamCache()
+
+    assert product_team_cache.get(product_team.id) is None
+    product_team_cache.put(product_team)
+    assert product_team_cache.get(product_team.id) == product_team
+    assert product_team_cache.get(PRODUCT_TEAM_ALIAS) == product_team
+    assert product_team_cache.stats() == {"hits": 2, "misses": 1, "size": 2}
+
+
+def test_product_team_cache_returns_copies():
+    product_team = _create_product_team()
+    product_team_cache = ProductTeamCache()
+    product_team_cache.put(product_team)
+
+    cached_product_team = product_team_cache.get(product_team.id)
+    cached_product_team.delete()
+
+    assert product_team_cache.get(product_team.id).status == "active"
+    assert product_team_cache.get(product_team.id).events == []
+
+
+def test_product_team_cache_ttl():
+    product_team = _create_product_team()
+    product_team_cache = ProductTeamCache(ttl=10)
+
+    with mock.patch("time.monotonic", return_value=100):
+        product_team_cache.put(product_team)
+    with mock.patch("time.monotonic", return_value=109.9):
+        assert product_team_cache.get(product_team.id) == product_team
+    with mock.patch("time.monotonic", return_value=110):
+        assert product_team_cache.get(product_team.id) is None
+    assert product_team_cache.stats() == {"hits": 1, "misses": 1, "size": 0}
+
+
+def test_product_team_cache_lru():
+    product_teams = [_create_product_team(name=f"team {i}") for i in range(3)]
+    product_team_cache = ProductTeamCache(max_size=2)
+
+    product_team_cache.put(product_teams[0])
+    product_team_cache.put(product_teams[1])
+    product_team_cache.get(product_teams[0].id)
+    product_team_cache.put(product_teams[2])
+
+    assert product_team_cache.get(product_teams[0].id) == product_teams[0]
+    assert product_team_cache.get(product_teams[1].id) is None
+    assert product_team_cache.get(product_teams[2].id) == product_teams[2]
+
+
+def test_product_team_repository_read_through_cache():
+    product_team = _create_product_team(keys=CPM_PRODUCT_TEAM_NO_ID["keys"])
+    product_team_cache = ProductTeamCache()
+
+    with mock_table_cpm(TABLE_NAME) as client:
+        repo = ProductTeamRepository(
+            table_name=TABLE_NAME,
+            dynamodb_client=client,
+            product_team_cache=product_team_cache,
+        )
+        repo.write(product_team)
+
+        with mock.patch.object(client, "query", wraps=client.query) as query:
+            assert repo.read(id=PRODUCT_TEAM_ALIAS) == product_team
+            assert repo.read(id=product_team.id) == product_team
+            assert repo.read(id=PRODUCT_TEAM_ALIAS) == product_team
+        assert query.call_count == 1
+
+        with pytest.raises(ItemNotFound):
+            repo.read(id="not-a-product-team")
+
+    assert product_team_cache.stats() == {"hits": 2, "misses": 2, "size": 2}
+
+
+def test_product_team_repository_delete_invalidates_cache():
+    product_team = _create_product_team(keys=CPM_PRODUCT_TEAM_NO_ID["keys"])
+    product_team_cache = ProductTeamCache()
+
+    with mock_table_cpm(TABLE_NAME) as client:
+        repo = ProductTeamRepository(
+            table_name=TABLE_NAME,
+            dynamodb_client=client,
+            product_team_cache=product_team_cache,
+        )
+        repo.write(product_team)
+
+        _product_team = repo.read(id=product_team.id)
+        _product_team.delete()
+        repo.write(_product_team)
+
+        assert product_team_cache.stats()["size"] == 0
+        with pytest.raises(ItemNotFound):
+            repo.read(id=product_team.id)
+        with pytest.raises(ItemNotFound):
+            repo.read(id=PRODUCT_TEAM_ALIAS)
+
+
+def test_clear_product_team_caches():
+    product_team = _create_product_team(keys=CPM_PRODUCT_TEAM_NO_ID["keys"])
+    product_team_caches = [ProductTeamCache(), ProductTeamCache()]
+    for product_team_cache in product_team_caches:
+        product_team_cache.put(product_team)
+
+    clear_product_team_caches()
+
+    assert [cache.stats()["size"] for cache in product_team_caches] == [0, 0]
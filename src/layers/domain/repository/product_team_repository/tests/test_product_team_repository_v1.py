@@ -88,3 +88,29 @@ def test__product_team_repository__product_team_does_not_exist_local():
         )
         with pytest.raises(ItemNotFound):
             repo.read(team_id)
+
+
+def test__product_team_repository_read_many_local():
+    org = Root.create_ods_organisation(ods_code=CPM_PRODUCT_TEAM_NO_ID["ods_code"])
+    team = org.create_product_team(
+        name="Test Team", keys=CPM_PRODUCT_TEAM_NO_ID["keys"]
+    )
+    other_team = org.create_product_team(name="Other Team")
+    (team_alias,) = (key["key_value"] for key in CPM_PRODUCT_TEAM_NO_ID["keys"])
+
+    with mock_table_cpm("my_table") as client:
+        repo = ProductTeamRepository(
+            table_name="my_table",
+            dynamodb_client=client,
+        )
+
+        repo.write(team)
+        repo.write(other_team)
+        result = repo.read_many(
+            ids=[other_team.id, "359e28eb-6e2c-409c-a3ab-a4868ab5c2df", team_alias]
+        )
+    assert [_team and _team.state() for _team in result] == [
+        other_team.state(),
+        None,
+        team.state(),
+    ]
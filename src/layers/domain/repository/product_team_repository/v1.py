@@ -11,9 +11,16 @@ from domain.core.product_team_key import ProductTeamKey
 from domain.repository.cpm_repository import Repository
 from domain.repository.keys import TableKey
 
+from .cache import ProductTeamCache
+
 
 class ProductTeamRepository(Repository[ProductTeam]):
-    def __init__(self, table_name: str, dynamodb_client):
+    def __init__(
+        self,
+        table_name: str,
+        dynamodb_client,
+        product_team_cache: ProductTeamCache = None,
+    ):
         super().__init__(
             table_name=table_name,
             model=ProductTeam,
@@ -21,9 +28,23 @@ class ProductTeamRepository(Repository[ProductTeam]):
             table_key=TableKey.PRODUCT_TEAM,
             parent_table_keys=(TableKey.PRODUCT_TEAM,),
         )
+        self.product_team_cache = product_team_cache
 
     def read(self, id: str) -> ProductTeam:
-        return super()._read(parent_ids=(id,), id=id, status="active")
+        if self.product_team_cache is None:
+            return super()._read(parent_ids=(id,), id=id, status="active")
+
+        product_team = self.product_team_cache.get(id)
+        if product_team is None:
+            product_team = super()._read(parent_ids=(id,), id=id, status="active")
+            self.product_team_cache.put(product_team)
+        return product_team
+
+    def read_many(self, ids: list[str]) -> list[ProductTeam | None]:
+        """Read product teams by id or alias, in request order."""
+        return super()._read_many(
+            keys=[(self.table_key.key(id),) * 2 for id in ids], status="active"
+        )
 
     def search(self) -> list[ProductTeam]:
         return super()._search(parent_ids=("",))
@@ -53,6 +74,10 @@ class ProductTeamRepository(Repository[ProductTeam]):
 
     def handle_ProductTeamDeletedEvent(self, event: ProductTeamDeletedEvent):
         keys = {ProductTeamKey(**key) for key in event.keys}
+        if self.product_team_cache is not None:
+            self.product_team_cache.invalidate(
+                id=event.id, aliases=[key.key_value for key in keys]
+            )
         product_team_key_delete_transactions = [
             self.delete_index(id=key.key_value) for key in keys
         ]
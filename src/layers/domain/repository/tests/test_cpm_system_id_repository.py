@@ -0,0 +1,50 @@
+from array import array
+
+from domain.core.cpm_system_id import ProductId
+from domain.core.cpm_system_id.pool import IdPool, write_id_pool
+from domain.repository.cpm_system_id_repository import (
+    CpmSystemIdRepository,
+    IdPoolReservations,
+)
+
+from test_helpers.dynamodb import mock_table_cpm
+
+TABLE_NAME = "my_table"
+
+
+def _id_pool(tmp_path, ids: list[int]) -> IdPool:
+    path = tmp_path / "pool.bin"
+    write_id_pool(path, array("I", ids))
+    return IdPool(path)
+
+
+def test_reserve_pool_positions():
+    with mock_table_cpm(TABLE_NAME) as client:
+        repo = CpmSystemIdRepository(
+            table_name=TABLE_NAME, model=ProductId, dynamodb_client=client
+        )
+        assert repo.reserve_pool_positions(size=3) == range(0, 3)
+        assert repo.reserve_pool_positions(size=2) == range(3, 5)
+
+
+def test_id_pool_reservations_are_unique_across_containers(tmp_path):
+    pool = _id_pool(tmp_path, ids=list(range(100, 110)))
+
+    with mock_table_cpm(TABLE_NAME) as client:
+        repo = CpmSystemIdRepository(
+            table_name=TABLE_NAME, model=ProductId, dynamodb_client=client
+        )
+        container_1 = IdPoolReservations(pool=pool, repository=repo, block_size=3)
+        container_2 = IdPoolReservations(pool=pool, repository=repo, block_size=3)
+
+        ids_1 = [container_1.next_id() for _ in range(2)]
+        ids_2 = [container_2.next_id() for _ in range(4)]
+        ids_1 += [container_1.next_id() for _ in range(2)]
+
+        # Blocks of the counter are handed out in turn, until the pool runs out
+        assert ids_1 == [100, 101, 102, 109]
+        assert ids_2 == [103, 104, 105, 106]
+        assert container_1.next_id() is None
+        assert container_1.exhausted
+
+    pool.close()
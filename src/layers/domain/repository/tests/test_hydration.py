@@ -0,0 +1,80 @@
+from datetime import datetime
+from unittest import mock
+
+import pytest
+from domain.core.cpm_product import CpmProduct
+from domain.core.cpm_system_id import ProductId
+from domain.core.enum import Status
+from domain.core.error import DuplicateError
+from domain.core.product_key import ProductKey
+from domain.core.product_team import ProductTeam
+from domain.core.root import Root
+from domain.repository.hydration import construct, hydrate
+
+from test_helpers.sample_data import CPM_PRODUCT_TEAM_NO_ID
+
+TABLE_ATTRIBUTES = {"pk": "PT#123", "sk": "P#456", "root": True, "row_type": "product"}
+
+
+@pytest.fixture
+def product_team() -> ProductTeam:
+    org = Root.create_ods_organisation(ods_code="AAA")
+    return org.create_product_team(
+        name="product-team", keys=CPM_PRODUCT_TEAM_NO_ID["keys"]
+    )
+
+
+@pytest.fixture
+def product(product_team: ProductTeam) -> CpmProduct:
+    product = product_team.create_cpm_product(name="product")
+    product.add_key(key_type="general", key_value="ABC123")
+    product.clear_events()
+    return product
+
+
+def test_construct_product(product: CpmProduct):
+    _product = construct(CpmProduct, {**product.state(), **TABLE_ATTRIBUTES})
+
+    assert _product == product
+    assert _product.state() == product.state()
+    assert _product.events == []
+    assert isinstance(_product.id, ProductId)
+    assert isinstance(_product.status, Status)
+    assert isinstance(_product.created_on, datetime)
+    assert all(isinstance(key, ProductKey) for key in _product.keys)
+    assert not hasattr(_product, "pk")
+
+    with pytest.raises(DuplicateError):
+        _product.add_key(key_type="general", key_value="ABC123")
+
+
+def test_construct_product_team(product_team: ProductTeam):
+    _product_team = construct(ProductTeam, {**product_team.state(), **TABLE_ATTRIBUTES})
+    assert _product_team == product_team
+    assert _product_team.state() == product_team.state()
+
+
+def test_construct_does_not_validate(product: CpmProduct):
+    with mock.patch.object(CpmProduct, "__init__") as mocked_init:
+        construct(CpmProduct, product.state())
+    mocked_init.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"created_on": "not-a-date"},
+        {"status": "not-a-status"},
+        {"keys": [{"key_type": "not-a-key-type", "key_value": "ABC123"}]},
+    ],
+)
+def test_hydrate_falls_back_to_validation(product: CpmProduct, changes: dict):
+    with pytest.raises(ValueError):
+        hydrate(CpmProduct, {**product.state(), **changes})
+
+
+def test_hydrate_falls_back_to_validation_on_missing_fields(product: CpmProduct):
+    state = product.state()
+    state.pop("name")
+    with pytest.raises(ValueError, match="name\n  field required"):
+        hydrate(CpmProduct, state)
@@ -1,4 +1,5 @@
 import pytest
+from domain.repository.errors import UnableToUnmarshall
 from domain.repository.marshall import marshall, marshall_value, unmarshall_value
 
 
@@ -102,3 +103,55 @@ def test_marshall():
         "three": {"N": "3"},
     }
     assert actual == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        "",
+        "foo",
+        0,
+        -1,
+        123,
+        -1.5,
+        2.0,
+        1e-07,
+        True,
+        False,
+        [1, -2, "3", [None]],
+        {"a": {"b": [-1.0, {"c": "d"}]}},
+        {"foo", "bar"},
+        {1, -2, 3.5},
+    ],
+)
+def test_marshall_round_trip(value):
+    actual = unmarshall_value(marshall_value(value))
+    assert actual == value
+    assert type(actual) is type(value)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        [{"foo"}, {"SS": ["foo"]}],
+        [{1}, {"NS": ["1"]}],
+        [{1.5}, {"NS": ["1.5"]}],
+        [{"foo", 1}, {"L": [{"N": "1"}, {"S": "foo"}]}],
+        [{True}, {"L": [{"BOOL": True}]}],
+    ],
+)
+def test_marshall_value_sets(value, expected):
+    actual = marshall_value(value)
+    if "L" in actual:
+        actual["L"].sort(key=str)
+    assert actual == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [{}, {"B": b"foo"}, {"N": "1", "BOOL": True}],
+)
+def test__unmarshall_value_unhandled(value):
+    with pytest.raises(UnableToUnmarshall):
+        unmarshall_value(value)
@@ -1,13 +1,19 @@
 import pytest
 from botocore.exceptions import ClientError
-from domain.repository.errors import AlreadyExistsError, UnhandledTransaction
+from domain.repository.errors import (
+    AlreadyExistsError,
+    ItemNotActive,
+    UnhandledTransaction,
+)
 from domain.repository.transaction import (
     CancellationReason,
     TransactionErrorMetadata,
     TransactionErrorResponse,
     TransactionStatement,
     TransactItem,
+    active_condition_check,
     handle_client_errors,
+    update_transactions,
 )
 
 COMMANDS = [
@@ -73,3 +79,41 @@ def test_handle_client_errors_does_not_fail():
     with handle_client_errors(commands=None):
         pass
     # implicit that no error has been raised
+
+
+def test_handle_client_errors_condition_check():
+    commands = [
+        active_condition_check(table_name="table", key={}),
+        *COMMANDS,
+    ]
+    error_response = TransactionErrorResponse(
+        Error=TransactionErrorMetadata(Message="oops", Code="oops123"),
+        CancellationReasons=[
+            CancellationReason(Code="ConditionalCheckFailed"),
+            CancellationReason(Code="None"),
+        ],
+    )
+    with pytest.raises(ItemNotActive):
+        with handle_client_errors(commands=commands):
+            raise ClientError(
+                error_response=error_response.dict(), operation_name="PUT"
+            )
+
+
+def test_update_transactions_remove_fields():
+    (transact_item,) = update_transactions(
+        table_name="table",
+        primary_keys=[{"pk": {"S": "foo"}, "sk": {"S": "foo"}}],
+        data={"status": "inactive"},
+        removed_fields=["pk_active"],
+    )
+    assert transact_item.Update.UpdateExpression == (
+        "SET #status = :status REMOVE #pk_active"
+    )
+    assert transact_item.Update.ExpressionAttributeNames == {
+        "#status": "status",
+        "#pk_active": "pk_active",
+    }
+    assert transact_item.Update.ExpressionAttributeValues == {
+        ":status": {"S": "inactive"}
+    }
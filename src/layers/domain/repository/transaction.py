@@ -4,11 +4,12 @@ from functools import partial
 from typing import Literal, Optional
 
 from botocore.exceptions import ClientError
+from domain.core.enum import Status
 from domain.core.error import NotFoundError
 from domain.repository.marshall import marshall_value
 from pydantic import BaseModel, Field
 
-from .errors import AlreadyExistsError, UnhandledTransaction
+from .errors import AlreadyExistsError, ItemNotActive, UnhandledTransaction
 
 
 class ConditionExpression(StrEnum):
@@ -16,11 +17,13 @@ class ConditionExpression(StrEnum):
     # rather than the individual "pk" field
     MUST_EXIST = "attribute_exists(pk)"
     MUST_NOT_EXIST = "attribute_not_exists(pk)"
+    MUST_BE_ACTIVE = "attribute_exists(pk) AND #status = :active"
 
 
 TRANSACTION_ERROR_MAPPING = {
     ConditionExpression.MUST_NOT_EXIST: AlreadyExistsError,
     ConditionExpression.MUST_EXIST: NotFoundError,
+    ConditionExpression.MUST_BE_ACTIVE: ItemNotActive,
 }
 
 
@@ -38,11 +41,17 @@ class TransactItem(BaseModel):
     Put: Optional[TransactionStatement] = None
     Delete: Optional[TransactionStatement] = None
     Update: Optional[TransactionStatement] = None
+    ConditionCheck: Optional[TransactionStatement] = None
+
+    @property
+    def statement(self) -> TransactionStatement:
+        return self.Put or self.Delete or self.Update or self.ConditionCheck
 
 
 class Transaction(BaseModel):
     TransactItems: list[TransactItem]
-    ReturnConsumedCapacity: Literal["NONE"] = "NONE"
+    ClientRequestToken: Optional[str] = None
+    ReturnConsumedCapacity: Literal["INDEXES", "TOTAL", "NONE"] = "NONE"
     ReturnItemCollectionMetrics: Literal["NONE"] = "NONE"
 
 
@@ -77,8 +86,7 @@ def handle_client_errors(commands: list[TransactItem]):
         for reason, command in zip(response.CancellationReasons, commands):
             if not reason.condition_check_failed:
                 continue
-            statement = command.Put or command.Delete or command.Update
-            error = TRANSACTION_ERROR_MAPPING.get(statement.ConditionExpression)
+            error = TRANSACTION_ERROR_MAPPING.get(command.statement.ConditionExpression)
             if error:
                 raise error()
         raise UnhandledTransaction(
@@ -88,7 +96,7 @@ def handle_client_errors(commands: list[TransactItem]):
         )
 
 
-def _update_expression(updated_fields: dict) -> dict:
+def _update_expression(updated_fields: dict, removed_fields: list[str] = ()) -> dict:
     expression_attribute_names = {}
     expression_attribute_values = {}
     update_clauses = []
@@ -103,6 +111,14 @@ def _update_expression(updated_fields: dict) -> dict:
 
     update_expression = "SET " + ", ".join(update_clauses)
 
+    if removed_fields:
+        remove_clauses = []
+        for field_name in removed_fields:
+            field_name_placeholder = f"#{field_name}"
+            remove_clauses.append(field_name_placeholder)
+            expression_attribute_names[field_name_placeholder] = field_name
+        update_expression += " REMOVE " + ", ".join(remove_clauses)
+
     return dict(
         UpdateExpression=update_expression,
         ExpressionAttributeNames=expression_attribute_names,
@@ -111,9 +127,14 @@ def _update_expression(updated_fields: dict) -> dict:
 
 
 def update_transactions(
-    table_name: str, primary_keys: list[dict], data: dict
+    table_name: str,
+    primary_keys: list[dict],
+    data: dict,
+    removed_fields: list[str] = (),
 ) -> list[TransactItem]:
-    update_expression = _update_expression(updated_fields=data)
+    update_expression = _update_expression(
+        updated_fields=data, removed_fields=removed_fields
+    )
     update_statement = partial(
         TransactionStatement,
         TableName=table_name,
@@ -126,6 +147,22 @@ def update_transactions(
     return transact_items
 
 
+def active_condition_check(table_name: str, key: dict) -> TransactItem:
+    """
+    Writes nothing, but cancels the transaction that it is part of unless the
+    item with this key exists and is active
+    """
+    return TransactItem(
+        ConditionCheck=TransactionStatement(
+            TableName=table_name,
+            Key=key,
+            ConditionExpression=ConditionExpression.MUST_BE_ACTIVE,
+            ExpressionAttributeNames={"#status": "status"},
+            ExpressionAttributeValues={":active": marshall_value(Status.ACTIVE)},
+        )
+    )
+
+
 def dynamodb_projection_expression(updated_fields: list[str]):
     expression_attribute_names = {}
     update_clauses = []
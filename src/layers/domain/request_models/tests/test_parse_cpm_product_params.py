@@ -1,5 +1,10 @@
 import pytest
-from domain.request_models import CreateCpmProductIncomingParams
+from domain.core.root import Root
+from domain.request_models import (
+    ALLOWED_PRODUCT_FIELDS,
+    CpmProductReadQueryParams,
+    CreateCpmProductIncomingParams,
+)
 from pydantic import ValidationError
 
 from test_helpers.sample_data import (
@@ -27,3 +32,29 @@ def test_validate_cpm_product_raises_no_name():
         CreateCpmProductIncomingParams(**CPM_PRODUCT_NO_NAME)
 
     assert exc.value.model is CreateCpmProductIncomingParams
+
+
+def test_cpm_product_read_fields():
+    query_params = CpmProductReadQueryParams(fields="id, name,id")
+    assert query_params.fields == ["id", "name"]
+    assert CpmProductReadQueryParams().fields is None
+
+
+def test_cpm_product_read_ignores_other_query_params():
+    query_params = CpmProductReadQueryParams(fields="id", foo="bar")
+    assert query_params.dict() == {"fields": ["id"]}
+
+
+def test_cpm_product_read_fields_raises_unknown_field():
+    with pytest.raises(ValidationError) as exc:
+        CpmProductReadQueryParams(fields="id,pk")
+
+    assert exc.value.model is CpmProductReadQueryParams
+
+
+def test_allowed_product_fields_are_the_product_fields():
+    org = Root.create_ods_organisation(ods_code="F5H1R")
+    product = org.create_product_team(name="product-team").create_cpm_product(
+        name="product"
+    )
+    assert set(ALLOWED_PRODUCT_FIELDS) == product.model_fields
@@ -0,0 +1,67 @@
+import pytest
+from domain.request_models import SEARCH_PRODUCT_FILTER_LIMIT, SearchProductQueryParams
+from pydantic import ValidationError
+
+
+@pytest.mark.parametrize(
+    ["params", "expected"],
+    [
+        ({"product_team_id": "foo"}, {"product_team_id": ["foo"]}),
+        ({"organisation_code": "foo"}, {"organisation_code": ["foo"]}),
+        (
+            {"organisation_code": "foo", "page_token": "bar"},
+            {"organisation_code": ["foo"], "page_token": "bar"},
+        ),
+        (
+            {"organisation_code": "foo, bar,foo"},
+            {"organisation_code": ["foo", "bar"]},
+        ),
+        ({"product_team_id": ["foo", "bar"]}, {"product_team_id": ["foo", "bar"]}),
+        ({"organisation_code": "foo,"}, {"organisation_code": ["foo"]}),
+        ({"product_team_id": ", foo,,"}, {"product_team_id": ["foo"]}),
+        ({"product_team_id": ["", "foo "]}, {"product_team_id": ["foo"]}),
+    ],
+)
+def test_search_product_params(params: dict, expected: dict):
+    query_params = SearchProductQueryParams(**params)
+    assert query_params.get_non_null_params() == expected
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"page_token": "bar"},
+        {"product_team_id": "foo", "organisation_code": "foo"},
+        {"organisation_code": "foo", "FOO": "bar"},
+        {"organisation_code": []},
+        {"organisation_code": ""},
+        {"product_team_id": " , "},
+        {
+            "organisation_code": ",".join(
+                map(str, range(SEARCH_PRODUCT_FILTER_LIMIT + 1))
+            )
+        },
+    ],
+)
+def test_search_product_params_invalid(params: dict):
+    with pytest.raises(ValidationError) as exc:
+        SearchProductQueryParams(**params)
+
+    assert exc.value.model is SearchProductQueryParams
+
+
+def test_search_product_params_too_many_values():
+    with pytest.raises(ValidationError) as exc:
+        SearchProductQueryParams(
+            product_team_id=",".join(map(str, range(SEARCH_PRODUCT_FILTER_LIMIT + 1)))
+        )
+
+    # Only the field is reported, rather than also the missing filter
+    assert exc.value.errors() == [
+        {
+            "loc": ("product_team_id",),
+            "msg": f"ensure this value has at most {SEARCH_PRODUCT_FILTER_LIMIT} items",
+            "type": "value_error",
+        }
+    ]
@@ -5,10 +5,25 @@ from domain.core.product_team_key import ProductTeamKey
 from pydantic import BaseModel, Extra, Field, root_validator, validator
 
 ALPHANUMERIC_SPACES_AND_UNDERSCORES = r"^[a-zA-Z0-9 _]*$"
+BATCH_READ_PRODUCT_LIMIT = 500
+BULK_IMPORT_ROW_LIMIT = 500
+SEARCH_PRODUCT_FILTER_LIMIT = 50
 ALLOWED_PRODUCT_SEARCH_PARAMS = (
     "product_team_id",
     "organisation_code",
 )
+ALLOWED_PRODUCT_FIELDS = (
+    "id",
+    "cpm_product_team_id",
+    "product_team_id",
+    "name",
+    "ods_code",
+    "status",
+    "created_on",
+    "updated_on",
+    "deleted_on",
+    "keys",
+)
 
 
 class ProductTeamPathParams(BaseModel, extra=Extra.forbid):
@@ -30,6 +45,31 @@ class CreateCpmProductIncomingParams(BaseModel, extra=Extra.forbid):
         return v
 
 
+class ProductFieldsQueryParams(BaseModel, extra=Extra.forbid):
+    """A comma-separated list of the product fields to return (default: all)"""
+
+    fields: Optional[list[str]]
+
+    @validator("fields", pre=True)
+    def split_fields(cls, v):
+        if isinstance(v, str):
+            return [field.strip() for field in v.split(",")]
+        return v
+
+    @validator("fields")
+    def validate_fields(cls, v: list[str]) -> list[str]:
+        unknown_fields = [field for field in v if field not in ALLOWED_PRODUCT_FIELDS]
+        if unknown_fields:
+            raise ValueError(
+                f"Unknown fields {unknown_fields}, permitted: {ALLOWED_PRODUCT_FIELDS}"
+            )
+        return list(dict.fromkeys(v))
+
+
+class CpmProductReadQueryParams(ProductFieldsQueryParams, extra=Extra.ignore):
+    """Product reads have always ignored any other query parameters"""
+
+
 class CpmProductReadPathParams(BaseModel, extra=Extra.forbid):
     product_id: str = Field(...)
 
@@ -49,6 +89,17 @@ class CpmProductPathParams(BaseModel, extra=Extra.forbid):
         return values
 
 
+class CpmProductBatchReadKey(BaseModel, extra=Extra.forbid):
+    product_team_id: str = Field(...)
+    product_id: str = Field(...)
+
+
+class BatchReadCpmProductIncomingParams(BaseModel, extra=Extra.forbid):
+    products: list[CpmProductBatchReadKey] = Field(
+        ..., min_items=1, max_items=BATCH_READ_PRODUCT_LIMIT
+    )
+
+
 class SubCpmProductPathParams(BaseModel, extra=Extra.forbid):
     product_id: str = Field(...)
     product_team_id: str = Field(...)
@@ -76,15 +127,61 @@ class CreateProductTeamIncomingParams(BaseModel, extra=Extra.forbid):
         return v
 
 
-class SearchProductQueryParams(BaseModel, extra=Extra.forbid):
-    product_team_id: Optional[str]
-    organisation_code: Optional[str]
+class BulkImportCpmProduct(CreateCpmProductIncomingParams):
+    product_team_id: str = Field(...)
+
+
+class BulkImportRow(BaseModel, extra=Extra.forbid):
+    product_team: Optional[CreateProductTeamIncomingParams]
+    product: Optional[BulkImportCpmProduct]
+
+    @root_validator(skip_on_failure=True)
+    def check_row_type(cls, values: dict):
+        n_entities = sum(values.get(field) is not None for field in cls.__fields__)
+        if n_entities != 1:
+            raise ValueError("Provide exactly one of 'product_team' or 'product'")
+        return values
+
+
+class BulkImportIncomingParams(BaseModel, extra=Extra.forbid):
+    rows: list[str] = Field(..., min_items=1, max_items=BULK_IMPORT_ROW_LIMIT)
+
+
+class SearchProductQueryParams(ProductFieldsQueryParams):
+    """
+    Either filter may be a comma-separated list of up to
+    SEARCH_PRODUCT_FILTER_LIMIT values, whose results are combined
+    """
+
+    product_team_id: Optional[list[str]]
+    organisation_code: Optional[list[str]]
+    page_token: Optional[str]
+
+    @validator("product_team_id", "organisation_code", pre=True)
+    def split_filter_values(cls, v):
+        if isinstance(v, str):
+            return v.split(",")
+        return v
+
+    @validator("product_team_id", "organisation_code")
+    def validate_filter_values(cls, v: list[str]) -> list[str]:
+        # Blank values (e.g. from "ABC," or ",ABC") are not filters
+        values = list(dict.fromkeys(filter(None, map(str.strip, v))))
+        if not values:
+            raise ValueError("ensure this value has at least 1 items")
+        if len(values) > SEARCH_PRODUCT_FILTER_LIMIT:
+            raise ValueError(
+                f"ensure this value has at most {SEARCH_PRODUCT_FILTER_LIMIT} items"
+            )
+        return values
 
-    @root_validator
+    @root_validator(skip_on_failure=True)
     def check_filters(cls, values: dict):
-        # Count the number of non-null parameters
+        # Count the number of non-null filter parameters
         non_empty_params = [
-            param for param in values.values() if param is not None and param != 0
+            values.get(param)
+            for param in ALLOWED_PRODUCT_SEARCH_PARAMS
+            if values.get(param) is not None
         ]
 
         if len(non_empty_params) != 1:
@@ -32,7 +32,8 @@ class AwsLambdaResponse(BaseModel):
         body: str = values["body"]
         version: None | str = values["version"]
         headers = AwsLambdaResponseHeaders(
-            content_length=len(body),
+            # In bytes: an ASCII body has one byte per character
+            content_length=len(body) if body.isascii() else len(body.encode()),
             version="null" if version is None else version,
             host="foo.co.uk",
         )
@@ -1,4 +1,3 @@
-import json
 from http import HTTPStatus
 
 from domain.response.error_response import ErrorResponse
@@ -7,9 +6,9 @@ from pydantic import ValidationError
 
 from .aws_lambda_response import AwsLambdaResponse
 from .validators import (
+    serialise_json_response,
     validate_exception,
     validate_http_status_response,
-    validate_json_serialisable_response,
 )
 
 
@@ -30,13 +29,16 @@ def render_response(
 ) -> AwsLambdaResponse:
     if isinstance(response, Exception):
         http_status, outcome = _exception_to_response_tuple(exception=response)
+        body = serialise_json_response(item=outcome)
     else:
         http_status, outcome = response
         try:
             validate_http_status_response(http_status=http_status)
-            validate_json_serialisable_response(item=outcome)
+            body = serialise_json_response(item=outcome) if outcome is not None else b""
         except Exception as exception:
             http_status, outcome = _exception_to_response_tuple(exception=exception)
+            body = serialise_json_response(item=outcome)
 
-    body = json.dumps(outcome) if outcome is not None else ""
-    return AwsLambdaResponse(statusCode=http_status, body=body, version=version)
+    return AwsLambdaResponse(
+        statusCode=http_status, body=body.decode(), version=version
+    )
@@ -11,7 +11,7 @@ from domain.core.error import (
     NotEprProductError,
 )
 from domain.ods import InvalidOdsCodeError
-from domain.repository.errors import AlreadyExistsError, ItemNotFound
+from domain.repository.errors import AlreadyExistsError, InvalidPageToken, ItemNotFound
 from event.status.steps import StatusNotOk
 
 from .coding import CpmCoding, SpineCoding
@@ -60,6 +60,7 @@ EXCEPTIONS_TO_SPINE_CODING = {
     VersionException: SpineCoding.ACCESS_DENIED,
     AlreadyExistsError: SpineCoding.VALIDATION_ERROR,
     ItemNotFound: SpineCoding.RESOURCE_NOT_FOUND,
+    InvalidPageToken: SpineCoding.VALIDATION_ERROR,
     StatusNotOk: SpineCoding.SERVICE_UNAVAILABLE,
     AccreditedSystemFatalError: SpineCoding.VALIDATION_ERROR,
     DuplicateInteractionIdError: SpineCoding.VALIDATION_ERROR,
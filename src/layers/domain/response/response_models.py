@@ -1,52 +1,97 @@
+from itertools import groupby
+from typing import Iterable
+
+import orjson
 from domain.core.aggregate_root import AggregateRoot
+from domain.core.cpm_product import CpmProduct
+from domain.response.validators import serialise_json_response
+
+SEARCH_PRODUCT_GROUPING_FIELDS = ("ods_code", "cpm_product_team_id", "product_team_id")
+
+
+def _get_field(product: CpmProduct | dict, field: str):
+    return product[field] if isinstance(product, dict) else getattr(product, field)
 
 
 class SearchResponse[T](AggregateRoot):
     results: list[T]
 
 
-class SearchProductResponse(SearchResponse[dict]):
-    """Wrapper for grouping products by organisation and product team."""
+class _ProductTeamGroup:
+    def __init__(self, product_team_id: str | None):
+        self.product_team_id = product_team_id
+        self.products = bytearray()
 
-    def __init__(self, products: list[dict]):
-        grouped_products = self._group_products(products)
-        super().__init__(results=grouped_products)
+    def append(self, product_json: bytes):
+        if self.products:
+            self.products += b","
+        self.products += product_json
 
-    def _group_products(self, products: list[dict]) -> list[dict]:
-        organisations = {}
+    def fragment(self) -> orjson.Fragment:
+        return orjson.Fragment(b"[" + self.products + b"]")
 
-        product_dicts = [product.state() for product in products]
 
-        for product in product_dicts:
-            org_code = product["ods_code"]
-            product_team_id = product["product_team_id"]
-            cpm_team_id = product["cpm_product_team_id"]
+class SearchProductResponse:
+    """
+    Groups products by organisation and product team. Each product is
+    serialised as it is added, so only the JSON of the result set is retained
+    rather than the models themselves, meaning that products can be streamed
+    in a page at a time with 'extend'. Products may be models or dicts of
+    projected fields, which must include SEARCH_PRODUCT_GROUPING_FIELDS. If
+    'fields' are provided then only those fields of each product are rendered.
+    """
 
-            if org_code not in organisations:
-                organisations[org_code] = {"org_code": org_code, "product_teams": {}}
+    def __init__(
+        self,
+        products: Iterable[CpmProduct | dict] = (),
+        next_page_token: str = None,
+        fields: list[str] = None,
+    ):
+        self.next_page_token = next_page_token
+        self.fields = fields
+        self._product_teams: dict[tuple[str, str], _ProductTeamGroup] = {}
+        self.extend(products)
 
-            if cpm_team_id not in organisations[org_code]["product_teams"]:
-                organisations[org_code]["product_teams"][cpm_team_id] = {
-                    "product_team_id": product_team_id,
-                    "cpm_product_team_id": cpm_team_id,
-                    "products": [],
-                }
+    def extend(self, products: Iterable[CpmProduct | dict]):
+        for product in products:
+            ods_code, cpm_product_team_id, product_team_id = (
+                _get_field(product, field) for field in SEARCH_PRODUCT_GROUPING_FIELDS
+            )
+            key = (ods_code, cpm_product_team_id)
+            product_team = self._product_teams.get(key)
+            if product_team is None:
+                product_team = _ProductTeamGroup(product_team_id)
+                self._product_teams[key] = product_team
+            if self.fields is not None:
+                product = {field: _get_field(product, field) for field in self.fields}
+            product_team.append(serialise_json_response(product))
 
-            organisations[org_code]["product_teams"][cpm_team_id]["products"].append(
-                product
+    def _results(self) -> list[dict]:
+        product_teams = sorted(self._product_teams.items(), key=lambda item: item[0])
+        return [
+            {
+                "org_code": org_code,
+                "product_teams": [
+                    {
+                        "product_team_id": product_team.product_team_id,
+                        "cpm_product_team_id": cpm_product_team_id,
+                        "products": product_team.fragment(),
+                    }
+                    for (_, cpm_product_team_id), product_team in org_product_teams
+                ],
+            }
+            for org_code, org_product_teams in groupby(
+                product_teams, key=lambda item: item[0][0]
             )
+        ]
+
+    def dict(self) -> dict:
+        """Ready for rendering, with the products as pre-serialised JSON fragments"""
+        data = {"results": self._results()}
+        # next_page_token is only rendered when there are more results to fetch
+        if self.next_page_token is not None:
+            data["next_page_token"] = self.next_page_token
+        return data
 
-        # Convert to final structured format
-        return sorted(
-            [
-                {
-                    "org_code": org["org_code"],
-                    "product_teams": sorted(
-                        list(org["product_teams"].values()),
-                        key=lambda team: team["cpm_product_team_id"],
-                    ),
-                }
-                for org in organisations.values()
-            ],
-            key=lambda org: org["org_code"],
-        )
+    def state(self) -> dict:
+        return orjson.loads(serialise_json_response(self.dict()))
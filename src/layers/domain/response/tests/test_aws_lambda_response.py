@@ -10,7 +10,7 @@ def test_aws_lambda_response(aws_lambda_response: AwsLambdaResponse):
         "body": aws_lambda_response.body,
         "headers": {
             "Content-Type": "application/json",
-            "Content-Length": f"{len(aws_lambda_response.body)}",
+            "Content-Length": f"{len(aws_lambda_response.body.encode())}",
             "Version": "null",
             "Host": "foo.co.uk",
         },
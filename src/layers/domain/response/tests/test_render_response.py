@@ -1,7 +1,10 @@
-import json
 from http import HTTPStatus
 
+import orjson
 import pytest
+from domain.core.base import BaseModel
+from domain.core.product_team import ProductTeam
+from domain.core.root import Root
 from domain.response.render_response import render_response
 from domain.response.response_matrix import SUCCESS_STATUSES
 from domain.response.tests.test_validation_errors import (
@@ -21,7 +24,7 @@ def test_render_response_of_json_serialisable_ok():
     )
     expected = {
         "statusCode": HTTPStatus.OK,
-        "body": '{"dict": "of things"}',
+        "body": '{"dict":"of things"}',
         "headers": {
             "Content-Type": "application/json",
             "Content-Length": "14",
@@ -37,7 +40,7 @@ def test_render_response_of_json_serialisable_ok():
 
 
 def test_render_response_of_success_http_status_created():
-    expected_body = json.dumps({"foo": "bar"})
+    expected_body = orjson.dumps({"foo": "bar"}).decode()
 
     aws_lambda_response = render_response(response=(HTTPStatus.CREATED, {"foo": "bar"}))
 
@@ -61,7 +64,7 @@ def test_render_response_of_success_http_status_created():
 
 @pytest.mark.parametrize("http_status", NON_SUCCESS_STATUSES)
 def test_render_response_of_non_success_http_status(http_status: HTTPStatus):
-    expected_body = json.dumps(
+    expected_body = orjson.dumps(
         {
             "errors": [
                 {
@@ -74,7 +77,7 @@ def test_render_response_of_non_success_http_status(http_status: HTTPStatus):
                 }
             ],
         }
-    )
+    ).decode()
     aws_lambda_response = render_response(response=(http_status, "some response"))
 
     expected = {
@@ -96,7 +99,7 @@ def test_render_response_of_non_success_http_status(http_status: HTTPStatus):
 
 
 def test_render_response_of_non_json_serialisable():
-    expected_body = json.dumps(
+    expected_body = orjson.dumps(
         {
             "errors": [
                 {
@@ -105,7 +108,7 @@ def test_render_response_of_non_json_serialisable():
                 }
             ],
         }
-    )
+    ).decode()
 
     aws_lambda_response = render_response((HTTPStatus.OK, object()))
     expected = {
@@ -128,7 +131,7 @@ def test_render_response_of_non_json_serialisable():
 @pytest.mark.parametrize(
     ["response", "expected_body"],
     [
-        ({"foo": "bar"}, '{"foo": "bar"}'),
+        ({"foo": "bar"}, '{"foo":"bar"}'),
         (123, "123"),
         (True, "true"),
         ("aString", '"aString"'),
@@ -155,7 +158,7 @@ def test_render_response_of_json_serialisable(response, expected_body):
 
 def test_render_response_of_blank_exception():
     aws_lambda_response = render_response(response=Exception())
-    expected_body = json.dumps(
+    expected_body = orjson.dumps(
         {
             "errors": [
                 {
@@ -164,7 +167,7 @@ def test_render_response_of_blank_exception():
                 }
             ],
         }
-    )
+    ).decode()
     expected = {
         "statusCode": 500,
         "body": expected_body,
@@ -184,7 +187,7 @@ def test_render_response_of_blank_exception():
 
 def test_render_response_of_general_exception():
     aws_lambda_response = render_response(response=Exception("oops"))
-    expected_body = json.dumps(
+    expected_body = orjson.dumps(
         {
             "errors": [
                 {
@@ -193,7 +196,7 @@ def test_render_response_of_general_exception():
                 }
             ],
         }
-    )
+    ).decode()
     expected = {
         "statusCode": 500,
         "body": expected_body,
@@ -273,3 +276,48 @@ def test_render_response_of_internal_validation_error():
     )
     assert aws_lambda_response.headers.content_type == "application/json"
     assert aws_lambda_response.headers.version == "null"
+
+
+def test_render_response_content_length_is_in_bytes():
+    aws_lambda_response = render_response(response=(HTTPStatus.OK, {"name": "café"}))
+    assert aws_lambda_response.body == '{"name":"café"}'
+    assert aws_lambda_response.headers.content_length == str(
+        len(aws_lambda_response.body.encode())
+    )
+
+
+def test_render_response_of_model():
+    org = Root.create_ods_organisation(ods_code="AAA")
+    product_team = org.create_product_team(name="product-team")
+
+    aws_lambda_response = render_response(response=(HTTPStatus.OK, product_team))
+
+    assert aws_lambda_response.statusCode == HTTPStatus.OK
+    assert json_loads(aws_lambda_response.body) == product_team.state()
+    assert aws_lambda_response.headers.content_length == str(
+        len(aws_lambda_response.body)
+    )
+
+
+class _ModelWithEncodedFields(BaseModel):
+    tags: set[str]
+    model_type: type
+
+
+def test_render_response_of_model_with_json_encoded_fields():
+    model = _ModelWithEncodedFields(tags={"foo"}, model_type=ProductTeam)
+
+    aws_lambda_response = render_response(response=(HTTPStatus.OK, model))
+
+    assert aws_lambda_response.statusCode == HTTPStatus.OK
+    assert json_loads(aws_lambda_response.body) == {
+        "tags": ["foo"],
+        "model_type": "ProductTeam",
+    }
+    assert json_loads(aws_lambda_response.body) == json_loads(model.json())
+
+
+def test_render_response_of_none():
+    aws_lambda_response = render_response(response=(HTTPStatus.OK, None))
+    assert aws_lambda_response.body == ""
+    assert aws_lambda_response.headers.content_length == "0"
@@ -0,0 +1,69 @@
+from domain.core.root import Root
+from domain.response.response_models import SearchProductResponse
+
+
+def _create_products(ods_code: str, product_team_name: str, product_ids: list[str]):
+    org = Root.create_ods_organisation(ods_code=ods_code)
+    product_team = org.create_product_team(name=product_team_name)
+    return product_team, [
+        product_team.create_cpm_product(
+            name=f"product-{product_id}", product_id=f"P.AAA-{product_id}"
+        )
+        for product_id in product_ids
+    ]
+
+
+def test_search_product_response_groups_products_across_pages():
+    team_b, products_b = _create_products("BBB", "team-b", ["333", "444"])
+    team_a, products_a = _create_products("AAA", "team-a", ["666", "777"])
+
+    response = SearchProductResponse()
+    response.extend([products_b[0], products_a[0]])
+    response.next_page_token = "token"
+    response.extend([products_b[1], products_a[1]])
+    response.next_page_token = None
+
+    assert response.state() == {
+        "results": [
+            {
+                "org_code": "AAA",
+                "product_teams": [
+                    {
+                        "product_team_id": None,
+                        "cpm_product_team_id": team_a.id,
+                        "products": [p.state() for p in products_a],
+                    }
+                ],
+            },
+            {
+                "org_code": "BBB",
+                "product_teams": [
+                    {
+                        "product_team_id": None,
+                        "cpm_product_team_id": team_b.id,
+                        "products": [p.state() for p in products_b],
+                    }
+                ],
+            },
+        ]
+    }
+
+
+def test_search_product_response_serialises_products_as_they_are_added():
+    _, products = _create_products("AAA", "team-a", ["333"])
+    (product,) = products
+
+    response = SearchProductResponse(products, next_page_token="token")
+    product.name = "renamed"
+
+    ((rendered_product,),) = (
+        team["products"]
+        for org in response.state()["results"]
+        for team in org["product_teams"]
+    )
+    assert rendered_product["name"] == "product-333"
+    assert response.state()["next_page_token"] == "token"
+
+
+def test_search_product_response_empty():
+    assert SearchProductResponse().state() == {"results": []}
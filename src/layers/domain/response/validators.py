@@ -1,8 +1,15 @@
-import json
 from http import HTTPStatus
 
+import orjson
+from domain.core.base import BaseModel as DomainBaseModel
+from event.aws.metrics import record_bytes_serialised
+from pydantic import BaseModel
+
 from .response_matrix import SUCCESS_STATUSES
 
+# Render values (e.g. sets) as the domain models' .json() would have done
+JSON_ENCODERS = DomainBaseModel.__config__.json_encoders
+
 
 class UnexpectedHttpStatus(Exception):
     def __init__(self, http_status):
@@ -31,11 +38,26 @@ def validate_http_status_response(http_status: HTTPStatus):
         raise UnexpectedHttpStatus(http_status=http_status)
 
 
-def validate_json_serialisable_response(item):
+def _json_default(item):
+    if isinstance(item, BaseModel):
+        return item.dict()
+    for _type, encoder in JSON_ENCODERS.items():
+        if isinstance(item, _type):
+            return encoder(item)
+    raise TypeError(f"Object of type {type(item).__name__} is not JSON serializable")
+
+
+def serialise_json_response(item) -> bytes:
+    """
+    Serialise the response in a single pass, rendering any pydantic models
+    (e.g. AggregateRoots) directly rather than via their 'state'
+    """
     try:
-        json.dumps(item)
-    except Exception as exception:
-        raise NotJsonSerialisable(str(exception))
+        body = orjson.dumps(item, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError as exception:
+        raise NotJsonSerialisable(str(exception.__cause__ or exception))
+    record_bytes_serialised(n_bytes=len(body))
+    return body
 
 
 def validate_exception(exception):
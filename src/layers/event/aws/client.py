@@ -1,17 +1,77 @@
-from typing import TYPE_CHECKING
+import os
+from typing import TYPE_CHECKING, Callable
 
 import boto3
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
 
 if TYPE_CHECKING:
     from mypy_boto3_dynamodb import DynamoDBClient
     from mypy_boto3_secretsmanager import SecretsManagerClient
 
+# Set to "true" to open each client's connection when the client is created
+PREWARM_CLIENTS = "PREWARM_CLIENTS"
 
-def dynamodb_client() -> "DynamoDBClient":
+# Enough for concurrent transaction writes and query fan-out from one lambda
+MAX_POOL_CONNECTIONS = 25
+CONNECT_TIMEOUT_SECONDS = 2
+READ_TIMEOUT_SECONDS = 5
+# Throttling and transaction conflicts are retried by event.aws.retry, within
+# the lambda's remaining time, so botocore only retries once (e.g. after a
+# dropped connection). Adaptive mode additionally rate limits the client once
+# it has been throttled.
+BOTOCORE_MAX_ATTEMPTS = 2
+
+CLIENT_CONFIG = Config(
+    max_pool_connections=MAX_POOL_CONNECTIONS,
+    connect_timeout=CONNECT_TIMEOUT_SECONDS,
+    read_timeout=READ_TIMEOUT_SECONDS,
+    retries={"mode": "adaptive", "total_max_attempts": BOTOCORE_MAX_ATTEMPTS},
+    tcp_keepalive=True,
+)
+
+
+def _should_prewarm(prewarm_client: bool = None) -> bool:
+    if prewarm_client is None:
+        return os.environ.get(PREWARM_CLIENTS, "").lower() == "true"
+    return prewarm_client
+
+
+def prewarm(request: Callable[[], object]):
+    """
+    Make a cheap 'request' so that DNS resolution and the TCP and TLS
+    handshakes happen during lambda init, rather than during the first
+    invocation. The connection is kept in the client's pool whatever the
+    response, so errors (e.g. AccessDenied) are ignored.
+    """
+    try:
+        request()
+    except (BotoCoreError, ClientError):
+        pass
+
+
+def _client(service_name: str, session: boto3.Session = None, config: Config = None):
+    # boto3.client() uses the default session, so that credentials are only
+    # resolved once however many clients are created
+    create_client = session.client if session else boto3.client
+    return create_client(service_name, config=config or CLIENT_CONFIG)
+
+
+def dynamodb_client(
+    session: boto3.Session = None, config: Config = None, prewarm_client: bool = None
+) -> "DynamoDBClient":
     """Explicitly pull this out so that it can be mocked globally"""
-    return boto3.client("dynamodb")
+    client = _client("dynamodb", session=session, config=config)
+    if _should_prewarm(prewarm_client):
+        prewarm(client.describe_endpoints)
+    return client
 
 
-def secretsmanager_client() -> "SecretsManagerClient":
+def secretsmanager_client(
+    session: boto3.Session = None, config: Config = None, prewarm_client: bool = None
+) -> "SecretsManagerClient":
     """Explicitly pull this out so that it can be mocked globally"""
-    return boto3.client("secretsmanager")
+    client = _client("secretsmanager", session=session, config=config)
+    if _should_prewarm(prewarm_client):
+        prewarm(lambda: client.list_secrets(MaxResults=1))
+    return client
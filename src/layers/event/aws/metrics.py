@@ -0,0 +1,119 @@
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from typing import Literal
+
+import orjson
+
+EMF_NAMESPACE = "connecting-party-manager"
+STEP_DIMENSION = "step"
+
+type ReturnConsumedCapacity = Literal["INDEXES", "TOTAL", "NONE"]
+
+
+class StepMetrics:
+    """
+    Metrics accumulated whilst a step runs: AWS client calls (including
+    retries) by operation, DynamoDB capacity units consumed and the number of
+    bytes serialised into responses. Updates are thread-safe, since concurrent
+    writes record into the same StepMetrics from worker threads.
+    """
+
+    def __init__(self):
+        self.client_calls = Counter()
+        self.consumed_capacity = 0.0
+        self.bytes_serialised = 0
+        self._lock = Lock()
+
+    def record_client_call(self, operation: str, n_attempts: int, response=None):
+        capacity = _consumed_capacity_units(response)
+        with self._lock:
+            self.client_calls[operation] += n_attempts
+            self.consumed_capacity += capacity
+
+    def record_bytes_serialised(self, n_bytes: int):
+        with self._lock:
+            self.bytes_serialised += n_bytes
+
+
+_step_metrics: ContextVar[StepMetrics | None] = ContextVar("step_metrics", default=None)
+
+
+def current_step_metrics() -> StepMetrics | None:
+    return _step_metrics.get()
+
+
+@contextmanager
+def collect_step_metrics():
+    """Collect StepMetrics for the duration of the 'with' block"""
+    metrics = StepMetrics()
+    token = _step_metrics.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _step_metrics.reset(token)
+
+
+def return_consumed_capacity() -> ReturnConsumedCapacity:
+    """Only ask DynamoDB for consumed capacity if somebody is collecting it"""
+    return "NONE" if current_step_metrics() is None else "TOTAL"
+
+
+def record_client_call(operation: str, n_attempts: int, response=None):
+    metrics = current_step_metrics()
+    if metrics is not None:
+        metrics.record_client_call(
+            operation=operation, n_attempts=n_attempts, response=response
+        )
+
+
+def record_bytes_serialised(n_bytes: int):
+    metrics = current_step_metrics()
+    if metrics is not None:
+        metrics.record_bytes_serialised(n_bytes=n_bytes)
+
+
+def _consumed_capacity_units(response) -> float:
+    # Single-table operations (e.g. query) return a dict, whereas
+    # multi-table operations (e.g. transact_write_items) return a list
+    if not isinstance(response, dict):
+        return 0.0
+    consumed_capacity = response.get("ConsumedCapacity") or []
+    if isinstance(consumed_capacity, dict):
+        consumed_capacity = [consumed_capacity]
+    return sum(capacity.get("CapacityUnits", 0) for capacity in consumed_capacity)
+
+
+def step_metrics_record(step: str, duration_ms: float, metrics: StepMetrics) -> dict:
+    """Render the metrics of a step in CloudWatch Embedded Metric Format (EMF)"""
+    return {
+        "_aws": {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [
+                {
+                    "Namespace": EMF_NAMESPACE,
+                    "Dimensions": [[STEP_DIMENSION]],
+                    "Metrics": [
+                        {"Name": "Duration", "Unit": "Milliseconds"},
+                        {"Name": "DynamoDbCalls", "Unit": "Count"},
+                        {"Name": "ConsumedCapacity", "Unit": "Count"},
+                        {"Name": "BytesSerialised", "Unit": "Bytes"},
+                    ],
+                }
+            ],
+        },
+        STEP_DIMENSION: step,
+        "Duration": duration_ms,
+        "DynamoDbCalls": metrics.client_calls.total(),
+        "ConsumedCapacity": metrics.consumed_capacity,
+        "BytesSerialised": metrics.bytes_serialised,
+        "client_calls": dict(metrics.client_calls),
+    }
+
+
+def emit_metrics_record(record: dict):
+    """EMF records are picked up by CloudWatch from the lambda's stdout"""
+    sys.stdout.write(orjson.dumps(record).decode() + "\n")
@@ -0,0 +1,173 @@
+import random
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from typing import Callable
+
+from botocore.exceptions import ClientError
+from event.aws.metrics import record_client_call
+from nhs_context_logging import add_fields
+from nhs_context_logging.logger import logging_context
+
+MAX_ATTEMPTS = 5
+# Stop retrying this long before the lambda times out, so that there is still
+# time to return an error response
+DEADLINE_MARGIN_SECONDS = 1
+
+RETRYABLE_ERROR_CODES = frozenset(
+    {
+        "InternalServerError",
+        "ProvisionedThroughputExceededException",
+        "RequestLimitExceeded",
+        "ThrottlingException",
+        "TransactionConflictException",
+    }
+)
+TRANSACTION_CANCELLED = "TransactionCanceledException"
+# A cancelled transaction is only retried if every cancellation reason is one of these
+RETRYABLE_CANCELLATION_CODES = frozenset(
+    {"None", "ProvisionedThroughputExceeded", "ThrottlingError", "TransactionConflict"}
+)
+
+
+def exponential_backoff_with_jitter(
+    n_retries, base_delay=0.1, min_delay=0.05, max_delay=5
+):
+    """Calculate the delay with exponential backoff and jitter."""
+    delay = min(base_delay * (2**n_retries), max_delay)
+    return random.uniform(min_delay, delay)
+
+
+class RetryBudget:
+    """
+    Per-invocation retry state: the monotonic time after which no more retries
+    are attempted, and the number of attempts made per client operation
+    """
+
+    def __init__(self, deadline: float = None):
+        self.deadline = deadline
+        self.attempts = Counter()
+        self.retries = Counter()
+        self._lock = Lock()
+
+    def record(self, operation: str, n_attempts: int):
+        with self._lock:
+            self.attempts[operation] += n_attempts
+            if n_attempts > 1:
+                self.retries[operation] += n_attempts - 1
+
+    def allows(self, delay: float) -> bool:
+        return self.deadline is None or time.monotonic() + delay < self.deadline
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"attempts": dict(self.attempts), "retries": dict(self.retries)}
+
+
+_retry_budget: ContextVar[RetryBudget | None] = ContextVar("retry_budget", default=None)
+
+
+def current_retry_budget() -> RetryBudget | None:
+    return _retry_budget.get()
+
+
+@contextmanager
+def retry_budget(context=None, margin: float = DEADLINE_MARGIN_SECONDS):
+    """
+    Bound retries by the remaining time of the lambda 'context' (if provided)
+    for the duration of the 'with' block
+    """
+    deadline = None
+    if context is not None:
+        remaining_seconds = context.get_remaining_time_in_millis() / 1000
+        deadline = time.monotonic() + remaining_seconds - margin
+
+    budget = RetryBudget(deadline=deadline)
+    token = _retry_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _retry_budget.reset(token)
+
+
+def is_retryable(error: ClientError) -> bool:
+    code = error.response.get("Error", {}).get("Code")
+    if code in RETRYABLE_ERROR_CODES:
+        return True
+    if code != TRANSACTION_CANCELLED:
+        return False
+    reasons = {
+        reason.get("Code") for reason in error.response.get("CancellationReasons", [])
+    }
+    return bool(reasons - {"None"}) and reasons <= RETRYABLE_CANCELLATION_CODES
+
+
+class RetryPolicy:
+    """
+    Retries throttled or conflicting AWS client calls with exponential backoff
+    and jitter. No retry is made if its delay would overrun the current
+    RetryBudget's deadline, in which case the last error is raised.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = MAX_ATTEMPTS,
+        base_delay: float = 0.1,
+        min_delay: float = 0.05,
+        max_delay: float = 5,
+        is_retryable: Callable[[ClientError], bool] = is_retryable,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.is_retryable = is_retryable
+
+    def call[T](self, fn: Callable[..., T], *args, **kwargs) -> T:
+        budget = current_retry_budget()
+        n_attempts = 0
+        response = None
+        try:
+            while True:
+                n_attempts += 1
+                try:
+                    response = fn(*args, **kwargs)
+                    return response
+                except ClientError as error:
+                    if n_attempts == self.max_attempts or not self.is_retryable(error):
+                        raise
+                    delay = exponential_backoff_with_jitter(
+                        n_retries=n_attempts - 1,
+                        base_delay=self.base_delay,
+                        min_delay=self.min_delay,
+                        max_delay=self.max_delay,
+                    )
+                    if budget is not None and not budget.allows(delay):
+                        raise
+                    time.sleep(delay)
+        finally:
+            _record_attempts(
+                budget=budget,
+                operation=_operation_name(fn),
+                n_attempts=n_attempts,
+                response=response,
+            )
+
+
+def _operation_name(fn: Callable) -> str:
+    return getattr(fn, "__name__", type(fn).__name__)
+
+
+def _record_attempts(
+    budget: RetryBudget | None, operation: str, n_attempts: int, response=None
+):
+    record_client_call(operation=operation, n_attempts=n_attempts, response=response)
+    if budget is not None:
+        budget.record(operation=operation, n_attempts=n_attempts)
+    if n_attempts > 1 and logging_context.current():
+        add_fields(**{f"{operation}_attempts": n_attempts})
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
@@ -0,0 +1,87 @@
+import time
+from threading import Lock
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from mypy_boto3_secretsmanager import SecretsManagerClient
+
+AWSCURRENT = "AWSCURRENT"
+SECRET_TTL_SECONDS = 5 * 60
+# Forced refreshes (e.g. on suspected rotation) are rate-limited to this interval
+MIN_REFRESH_INTERVAL_SECONDS = 30
+
+
+class _CachedSecret(NamedTuple):
+    value: str
+    version_id: str
+    fetched_at: float
+
+
+class SecretCache:
+    """
+    In-process cache of Secrets Manager secret values by (secret_id, version_stage),
+    so that warm lambda containers only read each secret once every 'ttl' seconds.
+    Concurrent reads of the same expired secret result in a single request.
+
+    Rotation is picked up when the TTL expires, or sooner via 'refresh', which
+    re-reads the secret unless it was read within 'min_refresh_interval' seconds.
+    """
+
+    def __init__(
+        self,
+        client: "SecretsManagerClient",
+        ttl: float = SECRET_TTL_SECONDS,
+        min_refresh_interval: float = MIN_REFRESH_INTERVAL_SECONDS,
+    ):
+        self.client = client
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        self._secrets: dict[tuple[str, str], _CachedSecret] = {}
+        self._locks: dict[tuple[str, str], Lock] = {}
+        self._lock = Lock()
+
+    def _key_lock(self, key: tuple[str, str]) -> Lock:
+        with self._lock:
+            return self._locks.setdefault(key, Lock())
+
+    def _get(self, secret_id: str, version_stage: str, max_age: float) -> str:
+        key = (secret_id, version_stage)
+        secret = self._secrets.get(key)
+        if secret and time.monotonic() - secret.fetched_at < max_age:
+            return secret.value
+
+        with self._key_lock(key):
+            # Another thread may have fetched the secret whilst we were waiting
+            secret = self._secrets.get(key)
+            if secret and time.monotonic() - secret.fetched_at < max_age:
+                return secret.value
+
+            response = self.client.get_secret_value(
+                SecretId=secret_id, VersionStage=version_stage
+            )
+            self._secrets[key] = _CachedSecret(
+                value=response["SecretString"],
+                version_id=response["VersionId"],
+                fetched_at=time.monotonic(),
+            )
+            return response["SecretString"]
+
+    def get(self, secret_id: str, version_stage: str = AWSCURRENT) -> str:
+        return self._get(
+            secret_id=secret_id, version_stage=version_stage, max_age=self.ttl
+        )
+
+    def refresh(self, secret_id: str, version_stage: str = AWSCURRENT) -> str:
+        return self._get(
+            secret_id=secret_id,
+            version_stage=version_stage,
+            max_age=self.min_refresh_interval,
+        )
+
+    def version_id(self, secret_id: str, version_stage: str = AWSCURRENT) -> str | None:
+        secret = self._secrets.get((secret_id, version_stage))
+        return secret.version_id if secret else None
+
+    def clear(self):
+        with self._lock:
+            self._secrets.clear()
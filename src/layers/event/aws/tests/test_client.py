@@ -0,0 +1,70 @@
+import os
+from unittest import mock
+
+import boto3
+import pytest
+from event.aws.client import (
+    BOTOCORE_MAX_ATTEMPTS,
+    CONNECT_TIMEOUT_SECONDS,
+    MAX_POOL_CONNECTIONS,
+    PREWARM_CLIENTS,
+    READ_TIMEOUT_SECONDS,
+    dynamodb_client,
+    prewarm,
+    secretsmanager_client,
+)
+from moto import mock_aws
+
+
+@pytest.fixture
+def session():
+    with mock_aws():
+        yield boto3.Session(region_name="eu-west-2")
+
+
+@pytest.mark.parametrize("client_factory", [dynamodb_client, secretsmanager_client])
+def test_client_config(client_factory, session):
+    client = client_factory(session=session, prewarm_client=False)
+    config = client.meta.config
+    assert config.max_pool_connections == MAX_POOL_CONNECTIONS
+    assert config.connect_timeout == CONNECT_TIMEOUT_SECONDS
+    assert config.read_timeout == READ_TIMEOUT_SECONDS
+    assert config.retries == {
+        "mode": "adaptive",
+        "total_max_attempts": BOTOCORE_MAX_ATTEMPTS,
+    }
+    assert config.tcp_keepalive is True
+
+
+@pytest.mark.parametrize(
+    ["client_factory", "operation"],
+    [
+        (dynamodb_client, "DescribeEndpoints"),
+        (secretsmanager_client, "ListSecrets"),
+    ],
+)
+@pytest.mark.parametrize(
+    ["prewarm_client", "environ", "expected_operations"],
+    [
+        (None, {}, 0),
+        (None, {PREWARM_CLIENTS: "true"}, 1),
+        (True, {}, 1),
+        (False, {PREWARM_CLIENTS: "true"}, 0),
+    ],
+)
+def test_client_prewarm(
+    client_factory, operation, prewarm_client, environ, expected_operations, session
+):
+    operations = []
+    session.events.register(
+        "before-call",
+        lambda model, **kwargs: operations.append(model.name),
+    )
+    with mock.patch.dict(os.environ, environ):
+        client_factory(session=session, prewarm_client=prewarm_client)
+    assert operations == [operation] * expected_operations
+
+
+def test_prewarm_ignores_errors(session):
+    client = session.client("secretsmanager")
+    prewarm(lambda: client.get_secret_value(SecretId="does-not-exist"))
@@ -0,0 +1,112 @@
+from unittest import mock
+
+import orjson
+import pytest
+from botocore.exceptions import ClientError
+from event.aws.metrics import (
+    EMF_NAMESPACE,
+    collect_step_metrics,
+    current_step_metrics,
+    emit_metrics_record,
+    record_bytes_serialised,
+    record_client_call,
+    return_consumed_capacity,
+    step_metrics_record,
+)
+from event.aws.retry import RetryPolicy
+
+THROTTLED = ClientError(
+    error_response={"Error": {"Code": "ThrottlingException", "Message": "Slow down"}},
+    operation_name="Query",
+)
+
+
+def test_return_consumed_capacity_only_when_collecting():
+    assert return_consumed_capacity() == "NONE"
+    with collect_step_metrics() as metrics:
+        assert current_step_metrics() is metrics
+        assert return_consumed_capacity() == "TOTAL"
+    assert current_step_metrics() is None
+    assert return_consumed_capacity() == "NONE"
+
+
+@pytest.mark.parametrize(
+    ["response", "expected_capacity"],
+    [
+        [None, 0],
+        [{}, 0],
+        [{"ConsumedCapacity": {"TableName": "t", "CapacityUnits": 0.5}}, 0.5],
+        [
+            {
+                "ConsumedCapacity": [
+                    {"TableName": "t", "CapacityUnits": 2.0},
+                    {"TableName": "u", "CapacityUnits": 1.5},
+                ]
+            },
+            3.5,
+        ],
+    ],
+)
+def test_record_client_call(response, expected_capacity):
+    with collect_step_metrics() as metrics:
+        record_client_call(operation="query", n_attempts=2, response=response)
+        record_client_call(operation="query", n_attempts=1, response=response)
+        record_bytes_serialised(n_bytes=10)
+        record_bytes_serialised(n_bytes=5)
+
+    assert metrics.client_calls == {"query": 3}
+    assert metrics.consumed_capacity == 2 * expected_capacity
+    assert metrics.bytes_serialised == 15
+
+
+def test_record_without_collector_is_noop():
+    record_client_call(operation="query", n_attempts=1, response={})
+    record_bytes_serialised(n_bytes=10)
+    assert current_step_metrics() is None
+
+
+@mock.patch("event.aws.retry.time.sleep")
+def test_retry_policy_records_client_calls(mocked_sleep):
+    responses = [THROTTLED, {"ConsumedCapacity": {"CapacityUnits": 1.0}}]
+
+    def query(**kwargs):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    with collect_step_metrics() as metrics:
+        RetryPolicy().call(query)
+
+    assert metrics.client_calls == {"query": 2}
+    assert metrics.consumed_capacity == 1.0
+
+
+def test_step_metrics_record_is_emf(capsys):
+    with collect_step_metrics() as metrics:
+        record_client_call(
+            operation="query",
+            n_attempts=1,
+            response={"ConsumedCapacity": {"CapacityUnits": 0.5}},
+        )
+        record_bytes_serialised(n_bytes=123)
+
+    emit_metrics_record(
+        step_metrics_record(step="query_products", duration_ms=1.5, metrics=metrics)
+    )
+
+    (line,) = capsys.readouterr().out.splitlines()
+    record = orjson.loads(line)
+    (directive,) = record["_aws"]["CloudWatchMetrics"]
+    assert directive["Namespace"] == EMF_NAMESPACE
+    assert directive["Dimensions"] == [["step"]]
+    metric_names = [metric["Name"] for metric in directive["Metrics"]]
+    # Every metric in the directive must be present in the record
+    assert {name: record[name] for name in metric_names} == {
+        "Duration": 1.5,
+        "DynamoDbCalls": 1,
+        "ConsumedCapacity": 0.5,
+        "BytesSerialised": 123,
+    }
+    assert record["step"] == "query_products"
+    assert record["client_calls"] == {"query": 1}
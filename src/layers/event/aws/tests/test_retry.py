@@ -0,0 +1,141 @@
+from unittest import mock
+
+import pytest
+from botocore.exceptions import ClientError
+from event.aws.retry import (
+    RetryPolicy,
+    current_retry_budget,
+    is_retryable,
+    retry_budget,
+)
+
+
+def _client_error(code: str, cancellation_reasons: list[str] = None) -> ClientError:
+    response = {"Error": {"Code": code, "Message": code}}
+    if cancellation_reasons is not None:
+        response["CancellationReasons"] = [{"Code": c} for c in cancellation_reasons]
+    return ClientError(error_response=response, operation_name="Operation")
+
+
+class _FlakyOperation:
+    def __init__(self, *errors: ClientError):
+        self.errors = list(errors)
+        self.n_calls = 0
+        self.__name__ = "flaky_operation"
+
+    def __call__(self, **kwargs):
+        self.n_calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return kwargs
+
+
+class _LambdaContext:
+    def __init__(self, remaining_time_in_millis: int):
+        self.remaining_time_in_millis = remaining_time_in_millis
+
+    def get_remaining_time_in_millis(self):
+        return self.remaining_time_in_millis
+
+
+@pytest.mark.parametrize(
+    ["error", "expected"],
+    [
+        (_client_error("ThrottlingException"), True),
+        (_client_error("ProvisionedThroughputExceededException"), True),
+        (
+            _client_error(
+                "TransactionCanceledException", ["None", "TransactionConflict"]
+            ),
+            True,
+        ),
+        (_client_error("TransactionCanceledException", ["ThrottlingError"]), True),
+        (
+            _client_error(
+                "TransactionCanceledException",
+                ["TransactionConflict", "ConditionalCheckFailed"],
+            ),
+            False,
+        ),
+        (_client_error("TransactionCanceledException", ["None"]), False),
+        (_client_error("TransactionCanceledException", []), False),
+        (_client_error("ValidationException"), False),
+    ],
+)
+def test_is_retryable(error: ClientError, expected: bool):
+    assert is_retryable(error) is expected
+
+
+@mock.patch("event.aws.retry.time.sleep")
+def test_retry_policy_retries_until_success(mocked_sleep):
+    operation = _FlakyOperation(
+        _client_error("ThrottlingException"),
+        _client_error("TransactionCanceledException", ["TransactionConflict"]),
+    )
+    with retry_budget() as budget:
+        assert RetryPolicy().call(operation, foo="bar") == {"foo": "bar"}
+
+    assert operation.n_calls == 3
+    assert mocked_sleep.call_count == 2
+    assert budget.stats() == {
+        "attempts": {"flaky_operation": 3},
+        "retries": {"flaky_operation": 2},
+    }
+
+
+@mock.patch("event.aws.retry.time.sleep")
+def test_retry_policy_does_not_retry_other_errors(mocked_sleep):
+    error = _client_error("TransactionCanceledException", ["ConditionalCheckFailed"])
+    operation = _FlakyOperation(error)
+    with pytest.raises(ClientError) as exception_wrapper:
+        RetryPolicy().call(operation)
+
+    assert exception_wrapper.value is error
+    assert operation.n_calls == 1
+    assert mocked_sleep.call_count == 0
+
+
+@mock.patch("event.aws.retry.time.sleep")
+def test_retry_policy_max_attempts(mocked_sleep):
+    operation = _FlakyOperation(
+        *(_client_error("ThrottlingException") for _ in range(5))
+    )
+    with pytest.raises(ClientError):
+        RetryPolicy(max_attempts=3).call(operation)
+
+    assert operation.n_calls == 3
+    assert mocked_sleep.call_count == 2
+
+
+def test_retry_policy_respects_deadline():
+    operation = _FlakyOperation(
+        *(_client_error("ThrottlingException") for _ in range(5))
+    )
+    policy = RetryPolicy(base_delay=1, min_delay=1, max_delay=1)
+    clock = [0.0]
+
+    def _sleep(seconds):
+        clock[0] += seconds
+
+    with mock.patch("time.monotonic", lambda: clock[0]), mock.patch(
+        "event.aws.retry.time.sleep", side_effect=_sleep
+    ) as mocked_sleep:
+        # 2.5 seconds remaining, less a 1 second margin: room for a single retry
+        with retry_budget(context=_LambdaContext(2500)) as budget:
+            assert budget.deadline == 1.5
+            with pytest.raises(ClientError):
+                policy.call(operation)
+
+    assert operation.n_calls == 2
+    assert mocked_sleep.call_count == 1
+
+
+def test_retry_budget_is_scoped():
+    assert current_retry_budget() is None
+    with retry_budget() as budget:
+        assert current_retry_budget() is budget
+        assert budget.deadline is None
+        with retry_budget() as inner_budget:
+            assert current_retry_budget() is inner_budget
+        assert current_retry_budget() is budget
+    assert current_retry_budget() is None
@@ -0,0 +1,74 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import boto3
+import pytest
+from event.aws.secrets import SecretCache
+from moto import mock_aws
+
+SECRET_ID = "my-secret"
+
+
+@pytest.fixture
+def client():
+    with mock_aws():
+        client = boto3.client("secretsmanager", region_name="eu-west-2")
+        client.create_secret(
+            Name=SECRET_ID, SecretString="hello"  # pragma: allowlist secret
+        )
+        yield client
+
+
+def _rotate(client, value: str):
+    client.put_secret_value(SecretId=SECRET_ID, SecretString=value)
+
+
+def test_secret_cache_ttl(client):
+    secret_cache = SecretCache(client=client, ttl=100)
+    with mock.patch("time.monotonic", return_value=0):
+        assert secret_cache.get(SECRET_ID) == "hello"
+    _rotate(client, "goodbye")
+    with mock.patch("time.monotonic", return_value=99):
+        assert secret_cache.get(SECRET_ID) == "hello"
+    with mock.patch("time.monotonic", return_value=100):
+        assert secret_cache.get(SECRET_ID) == "goodbye"
+
+
+def test_secret_cache_refresh_picks_up_rotation(client):
+    secret_cache = SecretCache(client=client, ttl=100, min_refresh_interval=10)
+    with mock.patch("time.monotonic", return_value=0):
+        assert secret_cache.get(SECRET_ID) == "hello"
+        version_id = secret_cache.version_id(SECRET_ID)
+    _rotate(client, "goodbye")
+    with mock.patch("time.monotonic", return_value=5):
+        assert secret_cache.refresh(SECRET_ID) == "hello"
+    with mock.patch("time.monotonic", return_value=10):
+        assert secret_cache.refresh(SECRET_ID) == "goodbye"
+        assert secret_cache.get(SECRET_ID) == "goodbye"
+    assert secret_cache.version_id(SECRET_ID) != version_id
+
+
+def test_secret_cache_version_stage(client):
+    secret_cache = SecretCache(client=client)
+    _rotate(client, "goodbye")
+    assert secret_cache.get(SECRET_ID) == "goodbye"
+    assert secret_cache.get(SECRET_ID, version_stage="AWSPREVIOUS") == "hello"
+
+
+def test_secret_cache_single_flight(client):
+    get_secret_value = client.get_secret_value
+
+    def _slow_get_secret_value(**kwargs):
+        time.sleep(0.2)
+        return get_secret_value(**kwargs)
+
+    secret_cache = SecretCache(client=client)
+    with mock.patch.object(
+        client, "get_secret_value", side_effect=_slow_get_secret_value
+    ) as mocked_get_secret_value:
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            values = list(executor.map(lambda _: secret_cache.get(SECRET_ID), range(5)))
+
+    assert values == ["hello"] * 5
+    assert mocked_get_secret_value.call_count == 1
@@ -1,11 +1,14 @@
 from http import HTTPStatus
 
+from event.aws.retry import DEFAULT_RETRY_POLICY
+
 from .errors import StatusNotOk
 
 
 def _status_check(client, table_name: str) -> tuple[HTTPStatus, dict]:
     try:
-        client.query(
+        DEFAULT_RETRY_POLICY.call(
+            client.query,
             TableName=table_name,
             KeyConditionExpression="pk = :pk",
             ExpressionAttributeValues={":pk": {"S": "#NONE#"}},
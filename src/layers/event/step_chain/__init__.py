@@ -1,3 +1,6 @@
+import asyncio
+from functools import wraps
+from inspect import iscoroutinefunction
 from types import FunctionType
 
 from event.step_chain.errors import StepChainError
@@ -13,8 +16,14 @@ class StepChain:
         * Can access results of previous steps using `data[step]`
         * Can access "global" data from `cache`
         * Can apply decorators to all steps
+        * Steps may be coroutine functions (`async def`), in which case each
+          is run to completion in its own event loop, so that it can await
+          several operations concurrently before the next step runs
         * Execute the pipeline with `StepChain.run`
         * Retrieve the final step's result from the `result` member
+        * Or execute the pipeline with `StepChain.execute`, which returns the
+          data and result rather than storing them, so that a StepChain that
+          is reused across invocations keeps nothing from the last one
 
     Example:
 
@@ -43,8 +52,9 @@ class StepChain:
             )
 
         # Decorate the steps in "reverse" order, which actually means that
-        # they get applied in the logical order
-        decorated_steps = step_chain
+        # they get applied in the logical order. This happens once, so that
+        # a StepChain can be constructed at import time and then reused.
+        decorated_steps = list(map(_run_to_completion, step_chain))
         for deco in reversed(step_decorators):
             decorated_steps = list(map(deco, decorated_steps))
         self.step_chain = decorated_steps
@@ -52,21 +62,41 @@ class StepChain:
         # Store a mapping to the original unwrapped steps, so that the user
         # may look up data by the original step reference
         self.naked_step_lookup = dict(zip(decorated_steps, step_chain))
+        self._steps = list(zip(decorated_steps, step_chain))
 
     def run(self, cache: dict = None, init: any = None):
+        self.data, self.result = self.execute(cache=cache, init=init)
+
+    def execute(self, cache: dict = None, init: any = None) -> tuple[FrozenDict, any]:
         if cache is None:
             cache = {}
 
-        data = FrozenDict(**{self.INIT: init})
-        for step in self.step_chain:
+        # Each step sees a read-only view of the results so far, which are
+        # accumulated in place rather than copied after every step
+        results = {self.INIT: init}
+        data = FrozenDict.view(results)
+        for step, naked_step in self._steps:
             try:
                 result = step(data=data, cache=cache)
             except Exception as exception:
                 result = exception
-            naked_step = self.naked_step_lookup[step]  # unwrap decorators off the step
-            data = FrozenDict({**data, naked_step: result})
+            results[naked_step] = result
             if isinstance(result, Exception):
                 break
+        return data, result
+
+
+def _run_to_completion(step: FunctionType) -> FunctionType:
+    """
+    Coroutine function steps are made synchronous before they are decorated,
+    so that decorators (e.g. logging and profiling) see the step's result
+    rather than a coroutine
+    """
+    if not iscoroutinefunction(step):
+        return step
+
+    @wraps(step)
+    def _step(data, cache):
+        return asyncio.run(step(data=data, cache=cache))
 
-        self.data = data
-        self.result = result
+    return _step
@@ -13,3 +13,12 @@ def test_frozen_dict_is_frozen():
     fd = FrozenDict(a=1, b=2)
     with pytest.raises(TypeError):
         fd["a"] = 3
+
+
+def test_frozen_dict_view():
+    d = {"a": 1}
+    fd = FrozenDict.view(d)
+    d["b"] = 2
+    assert fd == FrozenDict(a=1, b=2)
+    with pytest.raises(TypeError):
+        fd["c"] = 3
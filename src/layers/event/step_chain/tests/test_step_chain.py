@@ -1,3 +1,4 @@
+import asyncio
 from functools import wraps
 
 import pytest
@@ -102,3 +103,95 @@ def test_step_chain_no_duplicate_steps_allowed():
 
     with pytest.raises(StepChainError):
         StepChain(step_chain=[a, a])
+
+
+def test_step_chain_is_reusable():
+    n_decorations = 0
+
+    def count_decorations(function):
+        nonlocal n_decorations
+        n_decorations += 1
+        return function
+
+    def a(data, cache):
+        return data[StepChain.INIT] * 2
+
+    def b(data, cache):
+        with pytest.raises(TypeError):
+            data[b] = "not allowed"
+        return data[a] + 1
+
+    step_chain = StepChain(step_chain=[a, b], step_decorators=[count_decorations])
+
+    step_chain.run(init=1)
+    first_data = step_chain.data
+    step_chain.run(init=10)
+
+    assert step_chain.result == 21
+    assert step_chain.data == FrozenDict({StepChain.INIT: 10, a: 20, b: 21})
+    assert first_data == FrozenDict({StepChain.INIT: 1, a: 2, b: 3})
+    assert n_decorations == 2
+
+
+def test_step_chain_with_coroutine_steps():
+    steps_running_together = set()
+
+    async def _wait_for_each_other(name: str):
+        steps_running_together.add(name)
+        while len(steps_running_together) < 2:
+            await asyncio.sleep(0)
+        return name
+
+    async def a(data, cache):
+        return await asyncio.gather(
+            _wait_for_each_other("foo"), _wait_for_each_other("bar")
+        )
+
+    def b(data, cache):
+        return "".join(data[a])
+
+    results_seen_by_decorator = []
+
+    def record_result(function):
+        @wraps(function)
+        def wrapper(data, cache):
+            result = function(data=data, cache=cache)
+            results_seen_by_decorator.append(result)
+            return result
+
+        return wrapper
+
+    step_chain = StepChain(step_chain=[a, b], step_decorators=[record_result])
+    step_chain.run(init=None)
+
+    assert step_chain.result == "foobar"
+    assert step_chain.data == FrozenDict(
+        {StepChain.INIT: None, a: ["foo", "bar"], b: "foobar"}
+    )
+    assert results_seen_by_decorator == [["foo", "bar"], "foobar"]
+
+
+def test_step_chain_with_coroutine_step_error():
+    my_exception = ValueError()
+
+    async def a(data, cache):
+        raise my_exception
+
+    step_chain = StepChain(step_chain=[a], step_decorators=[])
+    step_chain.run(init=None)
+
+    assert step_chain.result is my_exception
+
+
+def test_step_chain_execute_keeps_no_state():
+    def a(data, cache):
+        return data[StepChain.INIT] * 2
+
+    step_chain = StepChain(step_chain=[a])
+
+    data, result = step_chain.execute(init=1)
+
+    assert result == 2
+    assert data == FrozenDict({StepChain.INIT: 1, a: 2})
+    assert not hasattr(step_chain, "data")
+    assert not hasattr(step_chain, "result")
@@ -8,6 +8,18 @@ class FrozenDict(Mapping):
         self._d = dict(*args, **kwargs)
         self._hash = None
 
+    @classmethod
+    def view(cls, d: dict) -> "FrozenDict":
+        """
+        A read-only view onto 'd', without copying it. Changes made to 'd' by its
+        owner are visible through the view, so the view must not be hashed
+        until the owner has finished with 'd'.
+        """
+        frozen_dict = cls.__new__(cls)
+        frozen_dict._d = d
+        frozen_dict._hash = None
+        return frozen_dict
+
     def __iter__(self):
         return iter(self._d)
 
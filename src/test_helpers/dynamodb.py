@@ -1,6 +1,7 @@
 from contextlib import contextmanager
 from typing import Generator
 
+from domain.repository.product_team_repository.cache import clear_product_team_caches
 from event.aws.client import dynamodb_client
 from moto import mock_aws
 from mypy_boto3_dynamodb import DynamoDBClient
@@ -28,6 +29,22 @@ GLOBAL_SECONDARY_INDEXES_CPM = [
         ],
         "Projection": {"ProjectionType": "ALL"},
     },
+    {
+        "IndexName": "idx_gsi_active",
+        "KeySchema": [
+            {"AttributeName": "pk_active", "KeyType": "HASH"},
+            {"AttributeName": "sk", "KeyType": "RANGE"},
+        ],
+        "Projection": {"ProjectionType": "ALL"},
+    },
+    {
+        "IndexName": "idx_gsi_active_read_2",
+        "KeySchema": [
+            {"AttributeName": "pk_active_read_2", "KeyType": "HASH"},
+            {"AttributeName": "sk_read_2", "KeyType": "RANGE"},
+        ],
+        "Projection": {"ProjectionType": "ALL"},
+    },
 ]
 ATTRIBUTE_DEFINITIONS_CPM = [
     {"AttributeName": "pk", "AttributeType": "S"},
@@ -36,6 +53,8 @@ ATTRIBUTE_DEFINITIONS_CPM = [
     {"AttributeName": "sk_read_1", "AttributeType": "S"},
     {"AttributeName": "pk_read_2", "AttributeType": "S"},
     {"AttributeName": "sk_read_2", "AttributeType": "S"},
+    {"AttributeName": "pk_active", "AttributeType": "S"},
+    {"AttributeName": "pk_active_read_2", "AttributeType": "S"},
 ]
 
 
@@ -57,6 +76,9 @@ def _scan(client: DynamoDBClient, table_name: str) -> Generator[dict, None, None
 def clear_dynamodb_table(
     client: DynamoDBClient, table_name: str, chunk_size=CHUNK_SIZE
 ):
+    # Lambdas hold a warm ProductTeamCache in their module-level 'cache', which
+    # would otherwise outlive the table that it was populated from
+    clear_product_team_caches()
     transact_items = []
     for item in _scan(client=client, table_name=table_name):
         transact_items.append({"Delete": {"TableName": table_name, "Key": item}})
@@ -93,6 +115,7 @@ def patch_dynamodb_client(client: DynamoDBClient):
 
 @contextmanager
 def mock_table_cpm(table_name: str):
+    clear_product_team_caches()
     with mock_aws():
         client = dynamodb_client()
         with patch_dynamodb_client(client=client):
@@ -0,0 +1,67 @@
+import time
+from collections import Counter
+from contextlib import contextmanager
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+ODS_PATH_PREFIX = "/organisations/"
+
+
+class StubOdsServer(ThreadingHTTPServer):
+    """
+    Local stand-in for the ODS API: known ODS codes return 200, unknown codes
+    return 404, and each code can be made to fail with a 500 'n_failures' times
+    before it succeeds
+    """
+
+    daemon_threads = True
+
+    def __init__(self, ods_codes, failures=None, delay=0):
+        super().__init__(("127.0.0.1", 0), _StubOdsRequestHandler)
+        self.ods_codes = set(ods_codes)
+        self.failures = Counter(failures or {})
+        self.delay = delay
+        self.requests = Counter()
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{ODS_PATH_PREFIX}" "{ods_code}"
+
+
+class _StubOdsRequestHandler(BaseHTTPRequestHandler):
+    server: StubOdsServer
+
+    def do_GET(self):
+        ods_code = self.path.removeprefix(ODS_PATH_PREFIX)
+        self.server.requests[ods_code] += 1
+        if self.server.delay:
+            time.sleep(self.server.delay)
+
+        if self.server.failures[ods_code] > 0:
+            self.server.failures[ods_code] -= 1
+            status = HTTPStatus.INTERNAL_SERVER_ERROR
+        elif ods_code in self.server.ods_codes:
+            status = HTTPStatus.OK
+        else:
+            status = HTTPStatus.NOT_FOUND
+
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@contextmanager
+def stub_ods_server(ods_codes, failures=None, delay=0):
+    server = StubOdsServer(ods_codes=ods_codes, failures=failures, delay=delay)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()